@@ -157,10 +157,15 @@ class DataAlignment(object):
 
         result.headers = [str(field.name) for field in targetedFieldLeafFields]
         from netzob.Model.Vocabulary.Domain.Parser.MessageParser import MessageParser
+
+        # the fields are walked once for all the data
+        parsingPlan = MessageParser.compile(targetedFieldLeafFields)
+        fieldLeafFields = self.field.getLeafFields(depth=self.depth)
+
         for d in self.data:
             mp = MessageParser()
             # alignedMsg = mp.parseRaw(TypeConverter.convert(d, HexaString, Raw), targetedFieldLeafFields)
-            alignedMsg = next(mp.parseRaw(d, targetedFieldLeafFields))
+            alignedMsg = next(mp.parseRaw(d, parsingPlan))
 
             alignedEncodedMsg = []
             for ifield, currentField in enumerate(targetedFieldLeafFields):
@@ -177,7 +182,7 @@ class DataAlignment(object):
                     fieldValue = TypeConverter.convert(fieldValue, BitArray,
                                                        Raw)
 
-                if currentField in self.field.getLeafFields(depth=self.depth):
+                if currentField in fieldLeafFields:
                     alignedEncodedMsg.append(fieldValue)
 
             result.append(alignedEncodedMsg)
@@ -210,8 +210,8 @@ class ParallelDataAlignment(object):
                 "There are not the same number of alignment ({0}) than the number of data ({1})".
                 format(len(result), len(data)))
 
-        self._logger.debug("Alignment of {0} data took {1}s with {2} threads.".
-                           format(len(data), end - start, self.nbThread))
+        self._logger.debug("Alignment of %s data took %ss with %s threads.",
+                           len(data), end - start, self.nbThread)
         return result
 
     # Static method
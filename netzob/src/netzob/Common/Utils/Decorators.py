@@ -34,6 +34,7 @@
 #+---------------------------------------------------------------------------+
 #| Standard library imports                                                  |
 #+---------------------------------------------------------------------------+
+import collections
 import logging
 import os
 
@@ -99,12 +100,27 @@ except Exception as e:
     has_colour = False
 
 
+# Level and handler shared by all the loggers attached by NetzobLogger
+try:
+    _netzobLogLevel = int(os.environ['NETZOB_LOG_LEVEL'])
+except:
+    _netzobLogLevel = None
+_netzobLogHandler = None
+
+
 def NetzobLogger(klass):
     """This class decorator adds (if necessary) an instance
     of the logger (self.__logger) to the attached class
     and removes from the getState the logger.
 
+    All the loggers share a single handler. Messages should be logged
+    with their arguments, as in ``self._logger.debug("Parse %s", data)``,
+    so they are only formatted when the level is enabled. Arguments that
+    are costly to compute are guarded with
+    ``self._logger.isEnabledFor(logging.DEBUG)``.
+
     """
+    global _netzobLogHandler
 
     # Verify if a logger already exists
     found = False
@@ -113,22 +129,28 @@ def NetzobLogger(klass):
             found = True
             break
     if not found:
+        if _netzobLogHandler is None:
+            _netzobLogHandler = ColourStreamHandler(
+            ) if has_colour else logging.StreamHandler()
+            fmt = '%(relativeCreated)d: [%(levelname)s] %(module)s:%(funcName)s: %(message)s'
+            _netzobLogHandler.setFormatter(logging.Formatter(fmt))
         klass._logger = logging.getLogger(klass.__name__)
-        try:
-            klass._logger.setLevel(int(os.environ['NETZOB_LOG_LEVEL']))
-        except:
-            pass
-        handler = ColourStreamHandler(
-        ) if has_colour else logging.StreamHandler()
-        fmt = '%(relativeCreated)d: [%(levelname)s] %(module)s:%(funcName)s: %(message)s'
-        handler.setFormatter(logging.Formatter(fmt))
-        klass._logger.addHandler(handler)
+        if _netzobLogLevel is not None:
+            klass._logger.setLevel(_netzobLogLevel)
+        klass._logger.addHandler(_netzobLogHandler)
         klass._logger.propagate = False
 
-    # Exclude logger from __getstate__
+    # Exclude logger from __getstate__ (and from the state returned by the
+    # __getstate__ of the class, if it has one)
+    klassGetState = klass.__dict__.get("__getstate__")
+
     def getState(self, **kwargs):
+        if klassGetState is not None:
+            state = klassGetState(self)
+        else:
+            state = self.__dict__
         r = dict()
-        for k, v in list(self.__dict__.items()):
+        for k, v in list(state.items()):
             if not isinstance(v, logging.Logger):
                 r[k] = v
         return r
@@ -143,6 +165,20 @@ def NetzobLogger(klass):
     return klass
 
 
+# Mode of the typeCheck decorator, selected at import time with the
+# environment variable NETZOB_TYPECHECK_MODE:
+#  - "check" (default): the arguments are type-checked,
+#  - "production": the functions are returned undecorated,
+#  - "profile": the arguments are type-checked and the calls of each
+#    decorated function are counted in typeCheckCounters.
+TYPECHECK_MODE_CHECK = "check"
+TYPECHECK_MODE_PRODUCTION = "production"
+TYPECHECK_MODE_PROFILE = "profile"
+
+typeCheckMode = os.environ.get("NETZOB_TYPECHECK_MODE", TYPECHECK_MODE_CHECK)
+typeCheckCounters = collections.Counter()
+
+
 def typeCheck(*types):
     """Decorator which reduces the amount of code to type-check attributes.
 
@@ -164,29 +200,56 @@ def typeCheck(*types):
     .. note:: set type = "SELF" to check the type of the self parameter
     .. warning:: if argument is None, the type checking is not executed on it.
 
+    The expected types are resolved once when the function is decorated,
+    except "SELF" which depends on the object.
+
+    >>> from netzob.Common.Utils.Decorators import typeCheck
+    >>> @typeCheck(int, str)
+    ... def f(self, a, b):
+    ...     return a
+    >>> f(None, 1, "a")
+    1
+    >>> f(None, 1, 2)
+    Traceback (most recent call last):
+    ...
+    TypeError: Invalid type for arguments, expecting: int, str and received int
+
     """
 
     def _typeCheck_(func):
+        if typeCheckMode == TYPECHECK_MODE_PRODUCTION:
+            return func
+
+        nbTypes = len(types)
+        hasSelfType = any(type == "SELF" for type in types)
+        staticTypes = None if hasSelfType else tuple(types)
+
         def wrapped_f(*args, **kwargs):
-            arguments = args[1:]
-            if len(arguments) == len(types):
-                # Replace "SELF" with args[0] type
-                final_types = []
-                for type in types:
-                    if type == "SELF":
-                        final_types.append(args[0].__class__)
-                    else:
-                        final_types.append(type)
-
-                for i, argument in enumerate(arguments):
+            if len(args) == nbTypes + 1:
+                if staticTypes is not None:
+                    final_types = staticTypes
+                else:
+                    # Replace "SELF" with args[0] type
+                    final_types = tuple(args[0].__class__ if type == "SELF"
+                                        else type for type in types)
+
+                for argument, argumentType in zip(args[1:], final_types):
                     if argument is not None and not isinstance(argument,
-                                                               final_types[i]):
+                                                               argumentType):
                         raise TypeError(
                             "Invalid type for arguments, expecting: {0} and received {1}".
                             format(', '.join([t.__name__ for t in final_types
                                               ]), argument.__class__.__name__))
             return func(*args, **kwargs)
 
+        if typeCheckMode == TYPECHECK_MODE_PROFILE:
+            checked_f = wrapped_f
+            counterKey = "{0}.{1}".format(func.__module__, func.__qualname__)
+
+            def wrapped_f(*args, **kwargs):
+                typeCheckCounters[counterKey] += 1
+                return checked_f(*args, **kwargs)
+
         return wraps(func)(wrapped_f)
 
     return _typeCheck_
@@ -31,10 +31,13 @@
 #|       - Frédéric Guihéry <frederic.guihery (a) amossys.fr>                |
 #+---------------------------------------------------------------------------+
 
+
 #+---------------------------------------------------------------------------+
 #| Standard library imports                                                  |
 #+---------------------------------------------------------------------------+
-from bintrees import AVLTree
+import bisect
+import heapq
+import operator
 
 #+---------------------------------------------------------------------------+
 #| Related third party imports                                               |
@@ -51,10 +54,14 @@ from netzob.Common.Utils.SortableObject import SortableObject
 class SortedTypedList(object):
     """This data structure allows to sort and maintain sorted
     a list of objects inheriting from :class:`netzob.Common.Utils.SortableObject.SortableObject`.
-    It uses an AVLTree proposed by :mod:`bintrees` to represent elements in the list.
+    Elements are sorted by priority and, for a same priority, by insertion order.
 
-    :TODO: The inner object __tree stores the given element using an AVLTree. Thus
-    exposing new methods only requires the creation of a wrapper method in this class.
+    Elements are kept in a list along with the list of their priorities.
+    Elements are usually added in order (e.g. messages sorted by date), so
+    they are appended in constant time. Other elements are inserted at
+    their place (found by bisection) and large batches of unsorted
+    elements are sorted then merged with the current elements. The list
+    returned by :meth:`values` is cached until the list is modified.
 
     >>> from netzob.all import *
     >>> from netzob.Common.Utils.SortedTypedList import SortedTypedList
@@ -75,15 +82,47 @@ class SortedTypedList(object):
     >>> print(len(l))
     6
 
+    Elements sharing a priority are all kept, in their insertion order,
+    and the list can be iterated and indexed like its values:
+
+    >>> l.addAll([RawMessage(b"msg7", date=14.0), RawMessage(b"msg8", date=2.0)])
+    >>> print([m.data for m in l])
+    [b'msg2', b'msg8', b'msg5', b'msg7', b'msg1', b'msg4', b'msg3', b'msg6']
+    >>> print(l[1].data, len(l))
+    b'msg8' 8
+    >>> l.values() is l.values()
+    True
+
+    Elements that are known to be valid (e.g. messages built by an
+    importer) can be inserted without being checked:
+
+    >>> trustedList = SortedTypedList._fromTrusted(RawMessage, l.values())
+    >>> trustedList._extendTrusted([RawMessage(b"msg9", date=0.0)])
+    >>> print(len(trustedList), trustedList[0].data)
+    9 b'msg9'
+    >>> l.clear()
+    >>> print(len(l), l.values())
+    0 []
+
     """
 
     def __init__(self, membersTypes, elements=None):
         self.membersTypes = membersTypes
-        self.__treePriorities = AVLTree()
-        self.__mapMessages = dict()
-        if elements is not None and len(elements) > 0:
+        self.__priorities = []
+        self.__elements = []
+        self.__values = None
+        if elements is not None:
             self._extend(elements)
 
+    @classmethod
+    def _fromTrusted(cls, membersTypes, elements):
+        """Creates a SortedTypedList of the specified elements without
+        checking their types. It must only be used with elements known to
+        be valid."""
+        sortedTypedList = cls(membersTypes)
+        sortedTypedList._extendTrusted(elements)
+        return sortedTypedList
+
     def add(self, element):
         """Insert in the proper place the specified element.
 
@@ -108,20 +147,20 @@ class SortedTypedList(object):
 
     def values(self):
         """Return a list sorted with the values of the current SortedTypedList.
-        :warning: modifying this list has no effect on the SortedTypedList.
+        :warning: the list is cached until the SortedTypedList is modified,
+                  it must not be modified.
 
         :rtype: :mod:list
         """
-
-        l = []
-        for x in list(self.__treePriorities.keys()):
-            l.extend(self.__mapMessages[x])
-        return l
+        if self.__values is None:
+            self.__values = list(self.__elements)
+        return self.__values
 
     def clear(self):
-        """remove all items from the list.
-        It's a O(n) operation"""
-        self.__treePriorities.clear()
+        """remove all items from the list."""
+        self.__priorities = []
+        self.__elements = []
+        self.__values = None
 
     def _extend(self, elements):
         """Add all the elements in the current list.
@@ -129,24 +168,52 @@ class SortedTypedList(object):
         :parameter elements: a list of :class:`netzob.Common.Utils.SortableObject.SortableObject` to insert.
         :raises: TypeError if something is wrong with the given elements
         """
-        for e in elements:
-            self._check(e)
-
-        d = dict()
-        for e in elements:
-            d[e.priority()] = None
-            if e.priority() in self.__mapMessages:
-                self.__mapMessages[e.priority()].append(e)
-            else:
-                self.__mapMessages[e.priority()] = [e]
-        self.__treePriorities.update(d)
+        elements = list(elements)
+        for elementType in set(map(type, elements)):
+            self._checkType(elementType)
+        self._extendTrusted(elements)
+
+    def _extendTrusted(self, elements):
+        """Add all the elements in the current list without checking
+        their types. It must only be used with elements known to be valid."""
+        elements = list(elements)
+        if len(elements) == 0:
+            return
+        self.__values = None
+
+        priorities = [e.priority() for e in elements]
+        if (len(self.__priorities) == 0 or
+                priorities[0] >= self.__priorities[-1]) and all(
+                    map(operator.le, priorities, priorities[1:])):
+            # Elements come after the current ones
+            self.__priorities.extend(priorities)
+            self.__elements.extend(elements)
+        elif len(elements) == 1:
+            index = bisect.bisect_right(self.__priorities, priorities[0])
+            self.__priorities.insert(index, priorities[0])
+            self.__elements.insert(index, elements[0])
+        else:
+            # Sort the new elements and merge them with the current ones
+            # (the merge is stable, so current elements come first)
+            merged = list(
+                heapq.merge(
+                    zip(self.__priorities, self.__elements),
+                    sorted(
+                        zip(priorities, elements),
+                        key=operator.itemgetter(0)),
+                    key=operator.itemgetter(0)))
+            self.__priorities = [priority for (priority, e) in merged]
+            self.__elements = [e for (priority, e) in merged]
 
     def _check(self, v):
-        if not isinstance(v, self.membersTypes):
+        self._checkType(type(v))
+
+    def _checkType(self, elementType):
+        if not issubclass(elementType, self.membersTypes):
             raise TypeError(
                 "Invalid type for argument, expecting: {0}, received : {1}".
-                format(self.membersTypes, v.__class__.__name__))
-        if not isinstance(v, SortableObject):
+                format(self.membersTypes, elementType.__name__))
+        if not issubclass(elementType, SortableObject):
             raise TypeError(
                 "Objects inserted in a SortedTypedList must inherits from SortableObject class"
             )
@@ -154,7 +221,10 @@ class SortedTypedList(object):
     def __len__(self):
         """Returns the number of elements in the sorted list which takes
         O(1) operation :)"""
-        return len(self.__treePriorities)
+        return len(self.__elements)
+
+    def __getitem__(self, index):
+        return self.__elements[index]
 
     def __str__(self):
         return ', \n'.join([str(v) for v in list(self.values())])
@@ -164,4 +234,4 @@ class SortedTypedList(object):
 
     def __iter__(self):
         """SortedTypedList is an iterable over its values (and not its keys)."""
-        return list(self.__treePriorities.values()).__iter__()
+        return iter(self.values())
@@ -60,10 +60,18 @@ class TypedList(collections.MutableSequence):
     'titi'
     >>> typedList.append(3)
     Traceback (most recent call last):
-    TypeError: Invalid type for argument, expecting: <type 'str'>
+    TypeError: Invalid type for argument, expecting: <class 'str'>, received : int
     >>> typedList.extend(["tutu", 5])
     Traceback (most recent call last):
-    TypeError: Invalid type for argument, expecting: <type 'str'>
+    TypeError: Invalid type for argument, expecting: <class 'str'>, received : int
+
+    Values that are known to be valid (e.g. the values of another
+    TypedList) can be inserted without being checked:
+
+    >>> trustedList = TypedList._fromTrusted(str, typedList)
+    >>> trustedList._extendTrusted(["tutu"])
+    >>> print(len(trustedList), trustedList[-1])
+    4 tutu
     """
 
     def __init__(self, membersTypes, *args):
@@ -71,12 +79,42 @@ class TypedList(collections.MutableSequence):
         self.list = list()
         self.extend(list(args))
 
+    @classmethod
+    def _fromTrusted(cls, membersTypes, values):
+        """Creates a TypedList of the specified values without checking
+        their types. It must only be used with values known to be valid."""
+        typedList = cls(membersTypes)
+        typedList._extendTrusted(values)
+        return typedList
+
     def check(self, v):
         if not isinstance(v, self.membersTypes):
             raise TypeError(
                 "Invalid type for argument, expecting: {0}, received : {1}".
                 format(self.membersTypes, v.__class__.__name__))
 
+    def checkAll(self, values):
+        """Checks the types of all the values. Each distinct type is only
+        checked once."""
+        for valueType in set(map(type, values)):
+            if not issubclass(valueType, self.membersTypes):
+                raise TypeError(
+                    "Invalid type for argument, expecting: {0}, received : {1}".
+                    format(self.membersTypes, valueType.__name__))
+
+    def extend(self, values):
+        values = list(values)
+        self.checkAll(values)
+        self.list.extend(values)
+
+    def _extendTrusted(self, values):
+        """Appends the values without checking their types. It must only
+        be used with values known to be valid."""
+        self.list.extend(values)
+
+    def clear(self):
+        del self.list[:]
+
     def __len__(self):
         return len(self.list)
 
@@ -0,0 +1,392 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#+---------------------------------------------------------------------------+
+#|          01001110 01100101 01110100 01111010 01101111 01100010            |
+#|                                                                           |
+#|               Netzob : Inferring communication protocols                  |
+#+---------------------------------------------------------------------------+
+#| Copyright (C) 2011-2017 Georges Bossert and Frédéric Guihéry              |
+#| This program is free software: you can redistribute it and/or modify      |
+#| it under the terms of the GNU General Public License as published by      |
+#| the Free Software Foundation, either version 3 of the License, or         |
+#| (at your option) any later version.                                       |
+#|                                                                           |
+#| This program is distributed in the hope that it will be useful,           |
+#| but WITHOUT ANY WARRANTY; without even the implied warranty of            |
+#| MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the              |
+#| GNU General Public License for more details.                              |
+#|                                                                           |
+#| You should have received a copy of the GNU General Public License         |
+#| along with this program. If not, see <http://www.gnu.org/licenses/>.      |
+#+---------------------------------------------------------------------------+
+#| @url      : http://www.netzob.org                                         |
+#| @contact  : contact@netzob.org                                            |
+#| @sponsors : Amossys, http://www.amossys.fr                                |
+#|             Supélec, http://www.rennes.supelec.fr/ren/rd/cidre/           |
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| Standard library imports
+#+---------------------------------------------------------------------------+
+import array
+import socket
+import struct
+import time
+
+#+---------------------------------------------------------------------------+
+#| Related third party imports
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| Local application imports
+#+---------------------------------------------------------------------------+
+from netzob.Common.Utils.Decorators import typeCheck, NetzobLogger
+from netzob.Model.Vocabulary.Symbol import Symbol
+from netzob.Model.Vocabulary.Domain.Variables.Memory import Memory
+from netzob.Model.Vocabulary.Domain.Specializer.MessageSpecializer import MessageSpecializer
+from netzob.Model.Vocabulary.Types.TypeConverter import TypeConverter
+from netzob.Model.Vocabulary.Types.BitArray import BitArray
+from netzob.Model.Vocabulary.Types.Raw import Raw
+
+
+@NetzobLogger
+class PCAPExporter(object):
+    """Writes messages in a classic PCAP file (Ethernet link type).
+
+    The data of each message is written as the payload of a UDP datagram
+    or of a TCP segment, encapsulated in synthetic IPv4 (or IPv6) and
+    Ethernet headers. The properties of these headers are read from the
+    layer 2 to 4 metadata of the messages (such as the metadata of
+    :class:`L4NetworkMessage <netzob.Model.Vocabulary.Messages.L4NetworkMessage.L4NetworkMessage>`)
+    or, if the messages do not carry them, from the defaults of the
+    exporter. IP and transport checksums are computed and the sequence
+    numbers of the TCP segments follow each other in each direction (no
+    handshake is written). Frames are buffered and written by blocks of
+    `bufferSize` bytes.
+
+    Messages can be exported as they are:
+
+    >>> import os, tempfile
+    >>> from netzob.all import *
+    >>> messages = PCAPImporter.readFile("./test/resources/pcaps/test_import_http.pcap").values()
+    >>> filePath = os.path.join(tempfile.mkdtemp(), "export.pcap")
+    >>> PCAPExporter.writeFile(filePath, messages)
+    >>> exportedMessages = PCAPImporter.readFile(filePath).values()
+    >>> print(len(exportedMessages))
+    62
+    >>> print([m.data for m in exportedMessages] == [m.data for m in messages])
+    True
+    >>> print([m.source for m in exportedMessages] == [m.source for m in messages])
+    True
+    >>> print(exportedMessages[0].l4Protocol, exportedMessages[0].l2DestinationAddress)
+    TCP 00:25:90:94:70:28
+
+    or directly generated out of a symbol definition:
+
+    >>> symbol = Symbol([Field("hello "), Field(ASCII(nbChars=(5, 10)))])
+    >>> with PCAPExporter(filePath, l4Protocol="UDP", l4DestinationAddress=53) as exporter:
+    ...     exporter.writeSymbol(symbol, nbMessages=100, date=1500000000.0, interval=0.5)
+    >>> exportedMessages = PCAPImporter.readFile(filePath).values()
+    >>> print(len(exportedMessages), exportedMessages[-1].date)
+    100 1500000049.5
+    >>> print(exportedMessages[0].destination, exportedMessages[0].data[:6])
+    127.0.0.1:53 b'hello '
+
+    """
+
+    # Global header of classic PCAP files (little endian, microseconds)
+    PCAP_GLOBAL_HEADER = struct.Struct("<IHHiIII")
+    PCAP_MAGIC_NUMBER = 0xa1b2c3d4
+    PCAP_RECORD_HEADER = struct.Struct("<IIII")
+    LINKTYPE_EN10MB = 1
+
+    ETHERNET_HEADER = struct.Struct("!6s6sH")
+    IPV4_HEADER = struct.Struct("!BBHHHBBH4s4s")
+    IPV6_HEADER = struct.Struct("!IHBB16s16s")
+    UDP_HEADER = struct.Struct("!HHHH")
+    TCP_HEADER = struct.Struct("!HHIIBBHHH")
+    CHECKSUM = struct.Struct("=H")
+    ETHERTYPE_IPV4 = 0x0800
+    ETHERTYPE_IPV6 = 0x86dd
+    IP_PROTOCOL_TCP = 6
+    IP_PROTOCOL_UDP = 17
+    TCP_FLAGS_PSH_ACK = 0x18
+    TCP_WINDOW = 0xffff
+    TTL = 64
+
+    # Size of the buffer of frames written at once in the file
+    BUFFER_SIZE = 1024 * 1024
+
+    def __init__(self,
+                 filePath,
+                 l2SourceAddress="00:00:00:00:00:01",
+                 l2DestinationAddress="00:00:00:00:00:02",
+                 l3SourceAddress="127.0.0.1",
+                 l3DestinationAddress="127.0.0.1",
+                 l4Protocol="UDP",
+                 l4SourceAddress=1024,
+                 l4DestinationAddress=1024,
+                 snapLen=65535,
+                 bufferSize=BUFFER_SIZE):
+        """Creates (or truncates) the PCAP file and writes its header.
+
+        :param filePath: the path of the PCAP file to write
+        :type filePath: :class:`str`
+        :keyword l2SourceAddress: the default source MAC address
+        :type l2SourceAddress: :class:`str`
+        :keyword l2DestinationAddress: the default destination MAC address
+        :type l2DestinationAddress: :class:`str`
+        :keyword l3SourceAddress: the default source IP address
+        :type l3SourceAddress: :class:`str`
+        :keyword l3DestinationAddress: the default destination IP address
+        :type l3DestinationAddress: :class:`str`
+        :keyword l4Protocol: the default transport protocol ("UDP" or "TCP")
+        :type l4Protocol: :class:`str`
+        :keyword l4SourceAddress: the default source port
+        :type l4SourceAddress: :class:`int`
+        :keyword l4DestinationAddress: the default destination port
+        :type l4DestinationAddress: :class:`int`
+        :keyword snapLen: the maximum number of bytes saved for each frame
+        :type snapLen: :class:`int`
+        :keyword bufferSize: the number of bytes of frames buffered before being written
+        :type bufferSize: :class:`int`
+        """
+        if l4Protocol not in ("UDP", "TCP"):
+            raise ValueError(
+                "Only UDP and TCP are supported as layer 4 protocols")
+        self.defaults = (l2SourceAddress, l2DestinationAddress,
+                         l3SourceAddress, l3DestinationAddress, l4Protocol,
+                         l4SourceAddress, l4DestinationAddress)
+        self.snapLen = snapLen
+        self.bufferSize = bufferSize
+        self.__ipIdentification = 0
+        self.__tcpSequences = dict()
+        self.__buffer = bytearray()
+        self.__file = open(filePath, "wb")
+        self.__file.write(
+            PCAPExporter.PCAP_GLOBAL_HEADER.pack(
+                PCAPExporter.PCAP_MAGIC_NUMBER, 2, 4, 0, 0, snapLen,
+                PCAPExporter.LINKTYPE_EN10MB))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Writes the buffered frames and closes the file."""
+        if self.__file is not None:
+            self.flush()
+            self.__file.close()
+            self.__file = None
+
+    def flush(self):
+        """Writes the buffered frames in the file."""
+        if len(self.__buffer) > 0:
+            self.__file.write(self.__buffer)
+            self.__buffer = bytearray()
+
+    def writeMessages(self, messages):
+        """Writes the specified messages. Their data is written as
+        transport payload and their layer 2 to 4 metadata (if any) are
+        used to build the headers.
+
+        :param messages: the messages to write
+        :type messages: a list of :class:`AbstractMessage <netzob.Model.Vocabulary.Messages.AbstractMessage.AbstractMessage>`
+        """
+        (l2Src, l2Dst, l3Src, l3Dst, l4Proto, l4Src,
+         l4Dst) = self.defaults
+        for message in messages:
+            self.writeData(
+                message.data,
+                message.date,
+                PCAPExporter.__property(message, "l2SourceAddress", l2Src),
+                PCAPExporter.__property(message, "l2DestinationAddress",
+                                        l2Dst),
+                PCAPExporter.__property(message, "l3SourceAddress", l3Src),
+                PCAPExporter.__property(message, "l3DestinationAddress",
+                                        l3Dst),
+                PCAPExporter.__property(message, "l4Protocol", l4Proto),
+                PCAPExporter.__property(message, "l4SourceAddress", l4Src),
+                PCAPExporter.__property(message, "l4DestinationAddress",
+                                        l4Dst))
+
+    @staticmethod
+    def __property(message, name, default):
+        """Internal method that returns a property of the message, or the
+        default value if the message does not define it."""
+        value = getattr(message, name, None)
+        if value is None or value == "None":
+            return default
+        return value
+
+    @typeCheck(Symbol, int, Memory, dict)
+    def writeSymbol(self,
+                    symbol,
+                    nbMessages=1,
+                    memory=None,
+                    presets=None,
+                    date=None,
+                    interval=0.001):
+        """Generates messages out of the symbol definition and writes them
+        with the default metadata of the exporter. Messages are specialized
+        like with :meth:`Symbol.specialize <netzob.Model.Vocabulary.Symbol.Symbol.specialize>`.
+
+        :param symbol: the symbol to specialize
+        :type symbol: :class:`Symbol <netzob.Model.Vocabulary.Symbol.Symbol>`
+        :keyword nbMessages: the number of messages to generate
+        :type nbMessages: :class:`int`
+        :keyword memory: the memory used to specialize the messages
+        :type memory: :class:`Memory <netzob.Model.Vocabulary.Domain.Variables.Memory.Memory>`
+        :keyword presets: the values preset for some fields of the symbol
+        :type presets: :class:`dict`
+        :keyword date: the timestamp of the first message (default is now)
+        :type date: :class:`float`
+        :keyword interval: the time elapsed between two messages (in seconds)
+        :type interval: :class:`float`
+        """
+        if date is None:
+            date = time.time()
+        (l2Src, l2Dst, l3Src, l3Dst, l4Proto, l4Src,
+         l4Dst) = self.defaults
+        for index in range(nbMessages):
+            specializingPath = MessageSpecializer(
+                memory=memory, presets=presets).specializeSymbol(symbol)
+            data = TypeConverter.convert(specializingPath.generatedContent,
+                                         BitArray, Raw)
+            self.writeData(data, date + index * interval, l2Src, l2Dst,
+                           l3Src, l3Dst, l4Proto, l4Src, l4Dst)
+
+    def writeData(self, data, date, l2SourceAddress, l2DestinationAddress,
+                  l3SourceAddress, l3DestinationAddress, l4Protocol,
+                  l4SourceAddress, l4DestinationAddress):
+        """Writes a frame carrying the specified transport payload.
+
+        The date is rounded to the microsecond before it is split in
+        seconds and microseconds in the record header:
+
+        >>> import os, struct, tempfile
+        >>> from netzob.all import *
+        >>> filePath = os.path.join(tempfile.mkdtemp(), "date.pcap")
+        >>> with PCAPExporter(filePath) as exporter:
+        ...     exporter.writeData(b"hello", 1.9999999, None, None, "127.0.0.1", "127.0.0.1", "UDP", 5000, 53)
+        >>> with open(filePath, "rb") as pcapFile:
+        ...     header = pcapFile.read(PCAPExporter.PCAP_GLOBAL_HEADER.size + 8)
+        >>> struct.unpack("<II", header[-8:])
+        (2, 0)
+        """
+
+        if l4Protocol == "TCP":
+            ipProtocolNum = PCAPExporter.IP_PROTOCOL_TCP
+            flow = (l3SourceAddress, l4SourceAddress, l3DestinationAddress,
+                    l4DestinationAddress)
+            reverseFlow = (l3DestinationAddress, l4DestinationAddress,
+                           l3SourceAddress, l4SourceAddress)
+            sequence = self.__tcpSequences.get(flow, 0)
+            self.__tcpSequences[flow] = (sequence + len(data)) & 0xffffffff
+            l4Header = PCAPExporter.TCP_HEADER.pack(
+                l4SourceAddress, l4DestinationAddress, sequence,
+                self.__tcpSequences.get(reverseFlow, 0), 5 << 4,
+                PCAPExporter.TCP_FLAGS_PSH_ACK, PCAPExporter.TCP_WINDOW, 0, 0)
+            checksumOffset = 16
+        elif l4Protocol == "UDP":
+            ipProtocolNum = PCAPExporter.IP_PROTOCOL_UDP
+            l4Header = PCAPExporter.UDP_HEADER.pack(
+                l4SourceAddress, l4DestinationAddress,
+                PCAPExporter.UDP_HEADER.size + len(data), 0)
+            checksumOffset = 6
+        else:
+            raise ValueError(
+                "Unsupported layer 4 protocol: {0}".format(l4Protocol))
+        l4Length = len(l4Header) + len(data)
+
+        # Build the IP header and the pseudo header of the L4 checksum
+        if ":" in l3SourceAddress:
+            etherType = PCAPExporter.ETHERTYPE_IPV6
+            l3Src = socket.inet_pton(socket.AF_INET6, l3SourceAddress)
+            l3Dst = socket.inet_pton(socket.AF_INET6, l3DestinationAddress)
+            l3Header = PCAPExporter.IPV6_HEADER.pack(
+                6 << 28, l4Length, ipProtocolNum, PCAPExporter.TTL, l3Src,
+                l3Dst)
+            pseudoHeader = l3Src + l3Dst + struct.pack("!IxxxB", l4Length,
+                                                       ipProtocolNum)
+        else:
+            etherType = PCAPExporter.ETHERTYPE_IPV4
+            l3Src = socket.inet_aton(l3SourceAddress)
+            l3Dst = socket.inet_aton(l3DestinationAddress)
+            totalLength = PCAPExporter.IPV4_HEADER.size + l4Length
+            if totalLength > 0xffff:
+                raise ValueError(
+                    "The message is too large for an IPv4 packet")
+            self.__ipIdentification = (self.__ipIdentification + 1) & 0xffff
+            l3Header = bytearray(
+                PCAPExporter.IPV4_HEADER.pack(
+                    0x45, 0, totalLength, self.__ipIdentification, 0x4000,
+                    PCAPExporter.TTL, ipProtocolNum, 0, l3Src, l3Dst))
+            PCAPExporter.CHECKSUM.pack_into(
+                l3Header, 10, PCAPExporter._checksum(l3Header))
+            pseudoHeader = l3Src + l3Dst + struct.pack("!xBH", ipProtocolNum,
+                                                       l4Length)
+
+        l4Header = bytearray(l4Header)
+        checksum = PCAPExporter._checksum(pseudoHeader + l4Header + data)
+        if checksum == 0 and ipProtocolNum == PCAPExporter.IP_PROTOCOL_UDP:
+            checksum = 0xffff
+        PCAPExporter.CHECKSUM.pack_into(l4Header, checksumOffset, checksum)
+
+        l2Header = PCAPExporter.ETHERNET_HEADER.pack(
+            PCAPExporter._macAddress(l2DestinationAddress, self.defaults[1]),
+            PCAPExporter._macAddress(l2SourceAddress, self.defaults[0]),
+            etherType)
+
+        # Append the record to the buffer
+        frameLength = len(l2Header) + len(l3Header) + l4Length
+        frame = l2Header + l3Header + l4Header + data
+        (seconds, microseconds) = divmod(int(round(date * 1000000)), 1000000)
+        self.__buffer += PCAPExporter.PCAP_RECORD_HEADER.pack(
+            seconds, microseconds,
+            min(frameLength, self.snapLen), frameLength)
+        self.__buffer += frame[:self.snapLen]
+        if len(self.__buffer) >= self.bufferSize:
+            self.flush()
+
+    @staticmethod
+    def _checksum(data):
+        """Computes the internet checksum (RFC 1071) of data. The checksum
+        is computed with native 16 bits words and must be written in the
+        native byte order."""
+        if len(data) % 2 == 1:
+            data = data + b"\x00"
+        total = sum(array.array("H", bytes(data)))
+        while total >> 16:
+            total = (total & 0xffff) + (total >> 16)
+        return ~total & 0xffff
+
+    @staticmethod
+    def _macAddress(address, defaultAddress):
+        """Returns the 6 bytes of a MAC address, or of the default address
+        if the specified one is not a MAC address (e.g. the direction of a
+        Protocol 201 frame)."""
+        for value in (address, defaultAddress):
+            try:
+                macAddress = bytes.fromhex(value.replace(":", ""))
+            except (AttributeError, ValueError):
+                continue
+            if len(macAddress) == 6:
+                return macAddress
+        raise ValueError("Invalid MAC address: {0}".format(defaultAddress))
+
+    @staticmethod
+    def writeFile(filePath, messages, **kwargs):
+        """Writes the specified messages in a PCAP file. Keyword arguments
+        are given to the constructor of the exporter.
+
+        :param filePath: the path of the PCAP file to write
+        :type filePath: :class:`str`
+        :param messages: the messages to write
+        :type messages: a list of :class:`AbstractMessage <netzob.Model.Vocabulary.Messages.AbstractMessage.AbstractMessage>`
+        """
+        with PCAPExporter(filePath, **kwargs) as exporter:
+            exporter.writeMessages(messages)
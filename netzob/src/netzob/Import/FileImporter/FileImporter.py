@@ -29,6 +29,7 @@
 #| Standard library imports
 #+---------------------------------------------------------------------------+
 import errno
+from gettext import gettext as _
 
 #+---------------------------------------------------------------------------+
 #| Related third party imports
@@ -85,8 +86,17 @@ class FileImporter(object):
     ./test/resources/files/test_import_raw_message2.dat
     >>> print(messages[707].file_message_number)
     353
+
+    Large files can be read lazily with FileImporter.iterFiles(...) and FileImporter.iterFile(...): files are scanned by windows of fixed size and messages are yielded by batches, so the memory consumption does not depend on the size of the files.
+
+    >>> batches = FileImporter.iterFiles([file1, file2], delimitor=b"\\x00\\x00", batchSize=300)
+    >>> print([len(batch) for batch in batches])
+    [300, 300, 202]
     """
 
+    # Size of the windows read when files are scanned for delimitors
+    WINDOW_SIZE = 1024 * 1024
+
     def __init__(self):
         pass
 
@@ -101,7 +111,16 @@ class FileImporter(object):
         :return: a sorted list of messages
         :rtype: a :class:`netzob.Common.Utils.SortedTypedList.SortedTypedList` of :class:`netzob.Model.Vocabulary.Messages.AbstractMessage`
         """
-        # Verify the existence of input files
+        self._verifyFiles(filePathList)
+
+        self.messages = SortedTypedList(AbstractMessage)
+        for filePath in filePathList:
+            self.__readMessagesFromFile(filePath, delimitor)
+        
+        return self.messages
+
+    def _verifyFiles(self, filePathList):
+        """Internal method that verifies the existence of input files."""
         errorMessageList = []
         for filePath in filePathList:
             try:
@@ -119,31 +138,98 @@ class FileImporter(object):
 
         if errorMessageList != []:
             raise NetzobImportException("File", "\n".join(errorMessageList))
-                
-        self.messages = SortedTypedList(AbstractMessage)
-        for filePath in filePathList:
-            self.__readMessagesFromFile(filePath, delimitor)
-        
-        return self.messages
     
     @typeCheck(str, bytes)
     def __readMessagesFromFile(self, filePath, delimitor=b'\n'):
+        self.messages._extendTrusted(
+            self.__iterMessagesFromFile(filePath, delimitor,
+                                        FileImporter.WINDOW_SIZE))
+
+    def __iterMessagesFromFile(self, filePath, delimitor, windowSize):
+        """Internal generator that scans a file by windows of windowSize
+        bytes and yields a FileMessage for each non-empty chunk of data
+        found between delimitors. Messages are numbered like the items of
+        `content.split(delimitor)`."""
         if filePath is None or len(str(filePath).strip()) == 0:
             raise TypeError("Filepath cannot be None or empty")
  
-        if delimitor is None or len(str(delimitor)) == 0:
+        if delimitor is None or len(delimitor) == 0:
             raise TypeError("Delimitor cannot be None or empty")
 
-        file_content = None
         with open(filePath, 'rb') as fd:
-            file_content = fd.read()
+            buffer = bytearray()
+            i_data = 0
+            while True:
+                window = fd.read(windowSize)
+                if len(window) == 0:
+                    break
+
+                # The remaining data of the previous windows does not
+                # contain any delimitor, but one can straddle it and the
+                # new window
+                start = 0
+                searchStart = max(0, len(buffer) - len(delimitor) + 1)
+                buffer += window
+                end = buffer.find(delimitor, searchStart)
+                while end >= 0:
+                    if end > start:
+                        yield FileMessage(bytes(buffer[start:end]), file_path = filePath, file_message_number = i_data)
+                    i_data += 1
+                    start = end + len(delimitor)
+                    end = buffer.find(delimitor, start)
+                del buffer[:start]
+
+            if len(buffer) > 0:
+                yield FileMessage(bytes(buffer), file_path = filePath, file_message_number = i_data)
 
-        if file_content is None:
-            raise Exception("No content found in '{}'".format(filePath))
+    @typeCheck(list, bytes, int, int)
+    def iterMessages(self, filePathList, delimitor=b"\n", batchSize=1000, windowSize=WINDOW_SIZE):
+        """Lazily read the messages found in the specified filePathList and
+        given a delimitor. This method returns a generator that yields lists
+        of at most `batchSize` messages, in the order they appear in the
+        files. Files are scanned by windows of `windowSize` bytes, so only
+        a window, the data of the current message and the current batch are
+        kept in memory.
 
-        for i_data, data in enumerate(file_content.split(delimitor)):
-            if len(data) > 0:
-                self.messages.add(FileMessage(data, file_path = filePath, file_message_number = i_data))
+        >>> from netzob.all import *
+        >>> file1 = "./test/resources/files/test_import_raw_message1.dat"
+        >>> messages = FileImporter.readFile(file1, delimitor=b"\\x00\\x00").values()
+        >>> batches = FileImporter().iterMessages([file1], delimitor=b"\\x00\\x00", windowSize=7)
+        >>> streamedMessages = [m for batch in batches for m in batch]
+        >>> print([(m.data, m.file_message_number) for m in messages] == [(m.data, m.file_message_number) for m in streamedMessages])
+        True
+
+        :param filePathList: paths of the file to parse
+        :type filePathList: a list of :class:`str`
+        :param delimitor: the delimitor used to find messages in the same file
+        :type delimitor: :class:`bytes`
+        :param batchSize: the maximum number of messages in each yielded batch
+        :type batchSize: :class:`int`
+        :param windowSize: the number of bytes read at once in the files
+        :type windowSize: :class:`int`
+        :return: a generator of lists of messages
+        :rtype: a generator of list of :class:`netzob.Model.Vocabulary.Messages.FileMessage`
+        """
+        if batchSize is None or batchSize <= 0:
+            raise ValueError("A strictly positive batch size is required.")
+        if windowSize is None or windowSize <= 0:
+            raise ValueError("A strictly positive window size is required.")
+        self._verifyFiles(filePathList)
+
+        return self.__iterMessagesFromFiles(filePathList, delimitor, batchSize, windowSize)
+
+    def __iterMessagesFromFiles(self, filePathList, delimitor, batchSize, windowSize):
+        """Internal generator that yields the messages of each file by
+        batches."""
+        batch = []
+        for filePath in filePathList:
+            for message in self.__iterMessagesFromFile(filePath, delimitor, windowSize):
+                batch.append(message)
+                if len(batch) == batchSize:
+                    yield batch
+                    batch = []
+        if len(batch) > 0:
+            yield batch
 
     @staticmethod
     @typeCheck(list, bytes)
@@ -175,3 +261,35 @@ class FileImporter(object):
         """
         importer = FileImporter()        
         return importer.readFiles([filePath], delimitor = delimitor)
+
+    @staticmethod
+    @typeCheck(list, bytes, int)
+    def iterFiles(filePathList, delimitor=b'\n', batchSize=1000):
+        """Lazily read messages from a list of files by batches of at most
+        `batchSize` messages. Refer to :meth:`iterMessages` for the
+        description of the parameters.
+
+        :return: a generator of lists of messages
+        :rtype: a generator of list of :class:`netzob.Model.Vocabulary.Messages.FileMessage`
+        """
+        importer = FileImporter()
+        return importer.iterMessages(filePathList, delimitor, batchSize)
+
+    @staticmethod
+    @typeCheck(str, bytes, int)
+    def iterFile(filePath, delimitor=b'\n', batchSize=1000):
+        """Lazily read messages from the specified file by batches of at
+        most `batchSize` messages. Refer to :meth:`iterMessages` for the
+        description of the parameters.
+
+        >>> from netzob.all import *
+        >>> for batch in FileImporter.iterFile("./test/resources/files/test_import_text_message.txt", batchSize=5):
+        ...    print(len(batch), batch[0].data)
+        5 b'The life that I have'
+        5 b'Of the life that I have'
+        3 b'For the peace of my years'
+
+        :return: a generator of lists of messages
+        :rtype: a generator of list of :class:`netzob.Model.Vocabulary.Messages.FileMessage`
+        """
+        return FileImporter.iterFiles([filePath], delimitor, batchSize)
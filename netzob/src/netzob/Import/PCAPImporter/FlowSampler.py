@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+#+---------------------------------------------------------------------------+
+#|          01001110 01100101 01110100 01111010 01101111 01100010            |
+#|                                                                           |
+#|               Netzob : Inferring communication protocols                  |
+#+---------------------------------------------------------------------------+
+#| Copyright (C) 2011-2017 Georges Bossert and Frédéric Guihéry              |
+#| This program is free software: you can redistribute it and/or modify      |
+#| it under the terms of the GNU General Public License as published by      |
+#| the Free Software Foundation, either version 3 of the License, or         |
+#| (at your option) any later version.                                       |
+#|                                                                           |
+#| This program is distributed in the hope that it will be useful,           |
+#| but WITHOUT ANY WARRANTY; without even the implied warranty of            |
+#| MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the              |
+#| GNU General Public License for more details.                              |
+#|                                                                           |
+#| You should have received a copy of the GNU General Public License         |
+#| along with this program. If not, see <http://www.gnu.org/licenses/>.      |
+#+---------------------------------------------------------------------------+
+#| @url      : http://www.netzob.org                                         |
+#| @contact  : contact@netzob.org                                            |
+#| @sponsors : Amossys, http://www.amossys.fr                                |
+#|             Supélec, http://www.rennes.supelec.fr/ren/rd/cidre/           |
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| Standard library imports
+#+---------------------------------------------------------------------------+
+import random
+
+#+---------------------------------------------------------------------------+
+#| Related third party imports
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| Local application imports
+#+---------------------------------------------------------------------------+
+from netzob.Common.Utils.Decorators import NetzobLogger
+
+
+@NetzobLogger
+class FlowSampler(object):
+    """Samples the messages of each flow while a capture is imported.
+
+    The sampler works on the records (messageClass, arguments) decoded by
+    :class:`PCAPImporter <netzob.Import.PCAPImporter.PCAPImporter.PCAPImporter>`,
+    so the messages that are not selected are never built. A flow is
+    identified by the addressing properties of its messages (protocols,
+    addresses and ports of each layer), each direction being a different
+    flow. Two strategies are available:
+
+    - with `nbMessagesPerFlow`, the first messages of each flow are kept;
+    - with `reservoirSize`, a uniform random sample of at most
+      `reservoirSize` messages is kept for each flow and each bucket of
+      `lengthBucketSize` bytes of message length. The sample is only known
+      when the import is over (see :meth:`flush`). A `seed` can be given
+      to get a reproducible sample.
+
+    >>> from netzob.all import *
+    >>> messages = PCAPImporter.readFile("./test/resources/pcaps/test_import_http.pcap", importLayer=4, sampler=FlowSampler(nbMessagesPerFlow=1)).values()
+    >>> print(len(messages))
+    14
+    >>> print(len(set((m.source, m.destination) for m in messages)))
+    14
+
+    >>> sampler = FlowSampler(reservoirSize=2, lengthBucketSize=1000, seed=0)
+    >>> messages = PCAPImporter.readFile("./test/resources/pcaps/test_import_http.pcap", importLayer=4, sampler=sampler).values()
+    >>> print(len(messages))
+    37
+    >>> print(messages == sorted(messages, key=lambda m: m.date))
+    True
+
+    Samplers can be directly used on records:
+
+    >>> sampler = FlowSampler(nbMessagesPerFlow=2)
+    >>> records = [(RawMessage, (b"data", float(i), "A", "B")) for i in range(4)]
+    >>> print(len(sampler.sample(records)), len(sampler.flush()))
+    2 0
+    >>> FlowSampler()
+    Traceback (most recent call last):
+    ...
+    ValueError: Either nbMessagesPerFlow or reservoirSize must be specified
+
+    """
+
+    def __init__(self,
+                 nbMessagesPerFlow=None,
+                 reservoirSize=None,
+                 lengthBucketSize=64,
+                 seed=None):
+        """
+        :keyword nbMessagesPerFlow: the number of messages kept at the beginning of each flow
+        :type nbMessagesPerFlow: :class:`int`
+        :keyword reservoirSize: the number of messages randomly kept for each flow and length bucket
+        :type reservoirSize: :class:`int`
+        :keyword lengthBucketSize: the size (in bytes) of the length buckets used with reservoirSize
+        :type lengthBucketSize: :class:`int`
+        :keyword seed: the seed of the random generator used with reservoirSize
+        :type seed: :class:`int`
+        """
+        if (nbMessagesPerFlow is None) == (reservoirSize is None):
+            raise ValueError(
+                "Either nbMessagesPerFlow or reservoirSize must be specified")
+        for value in (nbMessagesPerFlow, reservoirSize, lengthBucketSize):
+            if value is not None and value <= 0:
+                raise ValueError(
+                    "Sampling parameters must be strictly positive")
+        self.nbMessagesPerFlow = nbMessagesPerFlow
+        self.reservoirSize = reservoirSize
+        self.lengthBucketSize = lengthBucketSize
+        self.seed = seed
+        self.reset()
+
+    def reset(self):
+        """Forget the flows seen so far, so the sampler can be used for
+        another import."""
+        self.__flows = dict()
+        self.__random = random.Random(self.seed)
+
+    def sample(self, records):
+        """Sample records (messageClass, arguments) given in the order they
+        are imported. It returns the records that are kept right away, i.e.
+        the first records of their flow. Records kept in reservoirs are
+        returned by :meth:`flush`."""
+
+        selectedRecords = []
+        for record in records:
+            arguments = record[1]
+            if self.nbMessagesPerFlow is not None:
+                flow = arguments[2:]
+                nbMessages = self.__flows.get(flow, 0)
+                if nbMessages < self.nbMessagesPerFlow:
+                    self.__flows[flow] = nbMessages + 1
+                    selectedRecords.append(record)
+            else:
+                flow = arguments[2:] + (
+                    len(arguments[0]) // self.lengthBucketSize, )
+                reservoir = self.__flows.get(flow)
+                if reservoir is None:
+                    reservoir = self.__flows[flow] = [0, []]
+                reservoir[0] += 1
+                if len(reservoir[1]) < self.reservoirSize:
+                    reservoir[1].append(record)
+                else:
+                    index = self.__random.randrange(reservoir[0])
+                    if index < self.reservoirSize:
+                        reservoir[1][index] = record
+        return selectedRecords
+
+    def flush(self):
+        """Returns the records of the reservoirs, sorted by date, and
+        resets the sampler."""
+
+        records = []
+        if self.reservoirSize is not None:
+            for (nbRecords, reservoir) in self.__flows.values():
+                records.extend(reservoir)
+            records.sort(key=lambda record: record[1][1])
+        self.reset()
+        return records
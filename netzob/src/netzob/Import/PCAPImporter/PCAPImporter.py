@@ -29,19 +29,29 @@
 #| Standard library imports
 #+---------------------------------------------------------------------------+
 import errno
+import socket
+import struct
 from gettext import gettext as _
 
 #+---------------------------------------------------------------------------+
 #| Related third party imports
 #+---------------------------------------------------------------------------+
-import pcapy
+try:
+    # pcapy is only required to compile the BPF filters that PacketFilter
+    # does not support
+    import pcapy
+except ImportError:
+    pcapy = None
 
 ## FIXME: Temporary deactivate this module as it is not currently supported in Python3
 # import impacket.ImpactDecoder as Decoders
 # import impacket.ImpactPacket as Packets
 ## Instead, import local adapted files
-from netzob.Import.PCAPImporter import ImpactPacket as Packets
 from netzob.Import.PCAPImporter import ImpactDecoder as Decoders
+from netzob.Import.PCAPImporter.TCPStreamReassembler import TCPStreamReassembler
+from netzob.Import.PCAPImporter.PCAPReader import PCAPReader
+from netzob.Import.PCAPImporter.PacketFilter import PacketFilter
+from netzob.Import.PCAPImporter.FlowSampler import FlowSampler
 
 #+---------------------------------------------------------------------------+
 #| Local application imports
@@ -53,6 +63,7 @@ from netzob.Model.Vocabulary.Types.Raw import Raw
 from netzob.Model.Vocabulary.Types.HexaString import HexaString
 from netzob.Model.Vocabulary.Types.TypeConverter import TypeConverter
 from netzob.Model.Vocabulary.Messages.AbstractMessage import AbstractMessage
+from netzob.Model.Vocabulary.Messages.MessageStore import MessageStore
 from netzob.Model.Vocabulary.Messages.L2NetworkMessage import L2NetworkMessage
 from netzob.Model.Vocabulary.Messages.L3NetworkMessage import L3NetworkMessage
 from netzob.Model.Vocabulary.Messages.L4NetworkMessage import L4NetworkMessage
@@ -64,6 +75,7 @@ class PCAPImporter(object):
     We recommend to use static methods such as
     - PCAPImporter.readFiles(...)
     - PCAPimporter.readFile(...)
+    - PCAPImporter.iterFiles(...) and PCAPImporter.iterFile(...), to read large captures by batches
     refer to their documentation to have an overview of the required parameters.
 
     >>> from netzob.all import *
@@ -121,6 +133,35 @@ class PCAPImporter(object):
     2
     >>> print(len(messages[1].data))
     3224
+
+    Parameter `reassembleTCPStreams` offers a real reassembly of TCP streams for L5 network messages. The payloads of TCP segments are ordered according to their sequence numbers, retransmissions and duplicated data are dropped, and one message is produced per applicative PDU (i.e. data sent in one direction of a connection until the peer answers or the connection is closed).
+
+    >>> messages = PCAPImporter.readFile("./test/resources/pcaps/test_import_http_flow.pcap", reassembleTCPStreams=True).values()
+    >>> print([len(m.data) for m in messages])
+    [410, 3224]
+
+    Files are read with :class:`PCAPReader <netzob.Import.PCAPImporter.PCAPReader.PCAPReader>`, so pcapng files are also supported, even if their interfaces have different link types. BPF filters are evaluated on the decoded header fields (see :class:`PacketFilter <netzob.Import.PCAPImporter.PacketFilter.PacketFilter>`), pcapy is only required for the filters that use other parts of the BPF syntax.
+
+    >>> messages = PCAPImporter.readFile("./test/resources/pcaps/test_import_multi_interfaces.pcapng", importLayer=2).values()
+    >>> print([m.l2Protocol for m in messages])
+    ['Ethernet', 'Linux SLL', 'Ethernet', 'Ethernet']
+    >>> messages = PCAPImporter.readFile("./test/resources/pcaps/test_import_multi_interfaces.pcapng", bpfFilter="udp or dst port 80").values()
+    >>> print([m.data for m in messages])
+    [b'hello', b'world', b'GET /']
+    >>> messages = PCAPImporter.readFile("./test/resources/pcaps/test_import_multi_interfaces.pcapng", importLayer=2, bpfFilter="not ip").values()
+    >>> print(len(messages))
+    1
+
+    Parameter `columnar` can be used to import large captures: messages are returned in a :class:`MessageStore <netzob.Model.Vocabulary.Messages.MessageStore.MessageStore>` that holds the payloads and properties of the messages in compact arrays and only builds the messages when they are accessed.
+
+    >>> messages = PCAPImporter.readFile("./test/resources/pcaps/test_import_udp.pcap", columnar=True)
+    >>> print(type(messages).__name__, len(messages))
+    MessageStore 14
+    >>> print(repr(messages[0].data))
+    b'CMDidentify#\\x07\\x00\\x00\\x00Roberto'
+    >>> symbol = Symbol(messages=messages)
+    >>> print(len(symbol.getCells()))
+    14
     """
 
     INVALID_BPF_FILTER = 0
@@ -130,32 +171,68 @@ class PCAPImporter(object):
 
     PROTOCOL201 = 201
 
-    # Supported datalinks (by pcapy)
+    # Layout of the decoded headers (precompiled once and shared by all
+    # the decoded packets)
+    ETHERNET_HEADER = struct.Struct("!6s6sH")
+    ETHERTYPE = struct.Struct("!H")
+    SLL_HEADER = struct.Struct("!HHH8sH")
+    IPV4_HEADER = struct.Struct("!BBHHHBBH4s4s")
+    IPV6_HEADER = struct.Struct("!IHBB16s16s")
+    PORTS = struct.Struct("!HH")
+    TCP_HEADER = struct.Struct("!HHIIBB")
+
+    MAC_ADDRESS_FORMAT = ":".join(["{:02x}"] * 6)
+    VLAN_ETHERTYPES = (0x8100, 0x88a8, 0x9100)
+    ETHERTYPE_IPV4 = 0x0800
+    ETHERTYPE_IPV6 = 0x86dd
+    IPV6_FRAGMENT_HEADER = 44
+    IPV6_EXTENSION_HEADERS = (0, 43, 44, 60)
+    IP_PROTOCOL_TCP = 6
+    IP_PROTOCOL_UDP = 17
+    TCP_FLAG_FIN = 0x01
+    TCP_FLAG_SYN = 0x02
+    TCP_FLAG_RST = 0x04
+
+    # Link types (as stored in PCAP and pcapng files) that can be decoded
+    LINKTYPE_EN10MB = 1
+    LINKTYPE_LINUX_SLL = 113
+
+    # Supported datalinks
     SUPPORTED_DATALINKS = {
-        pcapy.DLT_ARCNET: "DLT_ARCNET",
-        pcapy.DLT_FDDI: "DLT_FDDI",
-        pcapy.DLT_LOOP: "DLT_LOOP",
-        pcapy.DLT_PPP_ETHER: "DLT_PPP_ETHER",
-        pcapy.DLT_ATM_RFC1483: "DLT_ATM_RFC1483",
-        pcapy.DLT_IEEE802: "DLT_IEEE802",
-        pcapy.DLT_LTALK: "DLT_LTALK",
-        pcapy.DLT_PPP_SERIAL: "DLT_PPP_SERIAL",
-        pcapy.DLT_C_HDLC: "DLT_C_HDLC",
-        pcapy.DLT_IEEE802_11: "IEEE802_11",
-        pcapy.DLT_NULL: "DLT_NULL",
-        pcapy.DLT_RAW: "DLT_RAW",
-        pcapy.DLT_EN10MB: "DLT_EN10MB",
-        pcapy.DLT_LINUX_SLL: "LINUX_SLL",
-        pcapy.DLT_PPP: "DLT_PPP",
-        pcapy.DLT_SLIP: "DLT_SLIP",
+        0: "DLT_NULL",
+        1: "DLT_EN10MB",
+        6: "DLT_IEEE802",
+        7: "DLT_ARCNET",
+        8: "DLT_SLIP",
+        9: "DLT_PPP",
+        10: "DLT_FDDI",
+        50: "DLT_PPP_SERIAL",
+        51: "DLT_PPP_ETHER",
+        100: "DLT_ATM_RFC1483",
+        101: "DLT_RAW",
+        104: "DLT_C_HDLC",
+        105: "IEEE802_11",
+        108: "DLT_LOOP",
+        113: "LINUX_SLL",
+        114: "DLT_LTALK",
     }
 
+    # Size of the frames given to libpcap when a BPF filter is compiled with pcapy
+    BPF_SNAPLEN = 65535
+
     def __init__(self):
-        pass
+        self.__tcpReassembler = None
+        self.__packetFilter = None
+        self.__bpfFilter = None
+        self.__bpfPrograms = dict()
+        self.__sampler = None
+        self.__incrementalMessages = None
+        self.__fileStates = dict()
 
-    @typeCheck(str, str, int)
-    def __readMessagesFromFile(self, filePath, bpfFilter, nbPackets):
-        """Internal methods to read all messages from a given PCAP file."""
+    def __openPacketReader(self, filePath, nbPackets):
+        """Internal method that opens a PCAP (or pcapng) file and verifies
+        its datalink can be imported. It returns the opened
+        :class:`PCAPReader <netzob.Import.PCAPImporter.PCAPReader.PCAPReader>`."""
         if (filePath is None):
             raise TypeError("filePath cannot be None")
         if (nbPackets < 0):
@@ -175,152 +252,278 @@ class PCAPImporter(object):
             else:
                 raise e
 
-        # Check (and configure) the bpf filter
-        packetReader = pcapy.open_offline(filePath)
-        try:
-            packetReader.setfilter(bpfFilter)
-        except:
-            raise ValueError(
-                "The provided BPF filter is not valid (it should follow the BPF format)"
-            )
+        packetReader = PCAPReader(filePath)
+        packetReader.open()
+
+        # Check the datalink (the interfaces of a pcapng file may have
+        # different datalinks, their packets are verified when decoded)
+        self.datalink = packetReader.linkType
+        if packetReader.fileFormat == "pcap":
+            try:
+                self.__verifyDatalink()
+            except:
+                packetReader.close()
+                raise
 
-        # Check the datalink
-        self.datalink = packetReader.datalink()
+        return packetReader
+
+    def __verifyDatalink(self):
+        """Internal method that verifies the datalink of the current file
+        can be decoded up to the import layer."""
         if self.datalink not in list(PCAPImporter.SUPPORTED_DATALINKS.keys()):
             self._logger.debug("Unkown datalinks")
 
-        if self.importLayer > 1 and self.datalink != pcapy.DLT_EN10MB and self.datalink != pcapy.DLT_LINUX_SLL and self.datalink != PCAPImporter.PROTOCOL201:
+        if self.importLayer > 1 and self.datalink != PCAPImporter.LINKTYPE_EN10MB and self.datalink != PCAPImporter.LINKTYPE_LINUX_SLL and self.datalink != PCAPImporter.PROTOCOL201:
             errorMessage = _("This pcap cannot be imported since the " +
                              "layer 2 is not supported ({0})").format(
                                  str(self.datalink))
             raise NetzobImportException("PCAP", errorMessage,
                                         self.INVALID_LAYER2)
-        else:
-            packetReader.loop(nbPackets, self.__packetHandler)
 
-    def __packetHandler(self, header, payload):
-        """Internal callback executed on each packet when parsing the pcap"""
-        (secs, usecs) = header.getts()
-        epoch = secs + (usecs / 1000000.0)
+    def __initPacketFilter(self, bpfFilter):
+        """Internal method that compiles the BPF filter. Filters that
+        :class:`PacketFilter <netzob.Import.PCAPImporter.PacketFilter.PacketFilter>`
+        supports are evaluated on the decoded header fields, others are
+        compiled with pcapy (if available) and evaluated on the frames."""
 
-        if self.importLayer == 1 or self.importLayer == 2:
-            try:
-                (l2Proto, l2SrcAddr, l2DstAddr, l2Payload,
-                 etherType) = self.__decodeLayer2(header, payload)
-            except NetzobImportException as e:
-                self._logger.warn(
-                    "An error occured while decoding layer2 of a packet: {0}".
+        self.__packetFilter = None
+        self.__bpfFilter = None
+        self.__bpfPrograms = dict()
+        if len(bpfFilter) == 0:
+            return
+
+        try:
+            self.__packetFilter = PacketFilter(bpfFilter)
+            return
+        except ValueError as e:
+            if pcapy is None:
+                raise ValueError(
+                    "The provided BPF filter is not supported ({0}), pcapy is required to use the complete BPF format".
                     format(e))
+
+        self.__bpfFilter = bpfFilter
+        self.__compileBPFFilter(PCAPImporter.LINKTYPE_EN10MB)
+
+    def __compileBPFFilter(self, linkType):
+        """Internal method that compiles (once per link type) the BPF
+        filter with pcapy."""
+        if linkType not in self.__bpfPrograms:
+            try:
+                self.__bpfPrograms[linkType] = pcapy.compile(
+                    linkType, PCAPImporter.BPF_SNAPLEN, self.__bpfFilter, 1,
+                    0)
+            except:
+                raise ValueError(
+                    "The provided BPF filter is not valid (it should follow the BPF format)"
+                )
+        return self.__bpfPrograms[linkType]
+
+    def __readFile(self, filePath, nbPackets, startOffset=None,
+                   endOffset=None, incremental=False):
+        """Internal generator that reads the frames of a PCAP (or pcapng)
+        file, or of the byte range [startOffset, endOffset) of a classic
+        PCAP file, and yields the records of each frame accepted by the
+        BPF filter. At most nbPackets frames are accepted (0 means no
+        limit).
+
+        If incremental is True, the file is read from the offset where
+        the previous incremental read stopped, and the number of frames
+        already accepted counts in nbPackets."""
+
+        # the reader is already opened, it is closed once the file is read
+        packetReader = self.__openPacketReader(filePath, nbPackets)
+        nbReadPackets = 0
+        try:
+            if incremental:
+                (startOffset, nbReadPackets) = self.__resumeFile(
+                    filePath, packetReader)
+            if nbPackets > 0 and nbReadPackets >= nbPackets:
                 return
-            if len(l2Payload) == 0:
-                return
+            for (epoch, linkType, payload) in packetReader.records(
+                    startOffset, endOffset):
+                records = self.__decodeFrame(epoch, linkType, payload)
+                if records is None:
+                    continue
+                yield records
+                nbReadPackets += 1
+                if nbReadPackets == nbPackets:
+                    break
+        finally:
+            if incremental and packetReader.offset is not None:
+                self.__fileStates[filePath] = (packetReader.offset,
+                                               nbReadPackets)
+            packetReader.close()
 
-            # Build the L2NetworkMessage
-            l2Message = L2NetworkMessage(payload, epoch, l2Proto, l2SrcAddr,
-                                         l2DstAddr)
+    def __resumeFile(self, filePath, packetReader):
+        """Internal method that returns the offset where the previous
+        incremental read of the file stopped and the number of frames it
+        accepted. The file is read from its beginning if it is read for the
+        first time, or if it is smaller than it was (i.e. it was replaced)."""
+        (offset, nbReadPackets) = self.__fileStates.get(filePath, (None, 0))
+        if offset is not None and offset > packetReader.fileSize:
+            self._logger.info(
+                "{0} is smaller than when it was last imported, it is imported again".
+                format(filePath))
+            return (None, 0)
+        return (offset, nbReadPackets)
+
+    @staticmethod
+    def _buildMessages(records):
+        """Build the messages described by a list of records
+        (messageClass, arguments)."""
+        return [
+            messageClass(*arguments) for (messageClass, arguments) in records
+        ]
 
-            self.messages.add(l2Message)
+    def __decodeFrame(self, epoch, linkType, payload):
+        """Internal method that decodes a frame captured at the specified
+        date. It returns the records (messageClass, arguments) of the
+        messages that correspond to the import layer, or None if the frame
+        is rejected by the BPF filter. The list of records is empty if the
+        frame cannot be imported (or if it does not complete a TCP PDU when
+        TCP streams are reassembled). Records only contain bytes, str and
+        numbers so they are cheap to transfer between processes."""
 
-        elif self.importLayer == 3:
-            try:
-                (l2Proto, l2SrcAddr, l2DstAddr, l2Payload,
-                 etherType) = self.__decodeLayer2(header, payload)
+        if self.__bpfFilter is not None and self.__compileBPFFilter(
+                linkType).filter(bytes(payload)) == 0:
+            return None
+
+        # Decode the layers required by the import layer and the filter
+        importedLayer = min(max(self.importLayer, 2), 4)
+        decodedLayer = importedLayer
+        if self.__packetFilter is not None:
+            decodedLayer = max(decodedLayer, self.__packetFilter.layer)
+
+        l3Proto = l3SrcAddr = l3DstAddr = None
+        l4Proto = l4SrcPort = l4DstPort = None
+        layer = 2
+        try:
+            (l2Proto, l2SrcAddr, l2DstAddr, l2Payload,
+             etherType) = self.__decodeLayer2(linkType, payload)
+            if decodedLayer >= 3:
+                layer = 3
                 (l3Proto, l3SrcAddr, l3DstAddr, l3Payload,
                  ipProtocolNum) = self.__decodeLayer3(etherType, l2Payload)
-            except NetzobImportException as e:
+            if decodedLayer >= 4:
+                layer = 4
+                (l4Proto, l4SrcPort, l4DstPort, l4Payload, tcpSeq,
+                 tcpFlags) = self.__decodeLayer4(ipProtocolNum, l3Payload)
+        except NetzobImportException as e:
+            if self.__packetFilter is not None and not self.__packetFilter.match(
+                    l3Proto, l3SrcAddr, l3DstAddr, l4Proto, l4SrcPort,
+                    l4DstPort):
+                return None
+            if layer <= importedLayer:
                 self._logger.warn(
-                    "An error occured while decoding layer2 and layer3 of a packet: {0}".
-                    format(e))
-                return
+                    "An error occured while decoding layer{0} of a packet: {1}".
+                    format(layer, e))
+                return []
+
+        if self.__packetFilter is not None and not self.__packetFilter.match(
+                l3Proto, l3SrcAddr, l3DstAddr, l4Proto, l4SrcPort, l4DstPort):
+            return None
+
+        if self.importLayer == 1 or self.importLayer == 2:
+            if len(l2Payload) == 0:
+                return []
 
+            # Build the L2NetworkMessage
+            return [(L2NetworkMessage, (bytes(payload), epoch, l2Proto,
+                                        l2SrcAddr, l2DstAddr))]
+
+        elif self.importLayer == 3:
             if len(l3Payload) == 0:
-                return
+                return []
 
             # Build the L3NetworkMessage
-            l3Message = L3NetworkMessage(l2Payload, epoch, l2Proto, l2SrcAddr,
-                                         l2DstAddr, l3Proto, l3SrcAddr,
-                                         l3DstAddr)
-            self.messages.add(l3Message)
+            return [(L3NetworkMessage, (bytes(l2Payload), epoch, l2Proto,
+                                        l2SrcAddr, l2DstAddr, l3Proto,
+                                        l3SrcAddr, l3DstAddr))]
 
         elif self.importLayer == 4:
-            try:
-                (l2Proto, l2SrcAddr, l2DstAddr, l2Payload,
-                 etherType) = self.__decodeLayer2(header, payload)
-                (l3Proto, l3SrcAddr, l3DstAddr, l3Payload,
-                 ipProtocolNum) = self.__decodeLayer3(etherType, l2Payload)
-                (l4Proto, l4SrcPort, l4DstPort,
-                 l4Payload) = self.__decodeLayer4(ipProtocolNum, l3Payload)
-            except NetzobImportException as e:
-                self._logger.warn(
-                    "An error occured while decoding layer2, layer3 or layer4 of a packet: {0}".
-                    format(e))
-                return
             if len(l4Payload) == 0:
-                return
+                return []
 
             # Build the L4NetworkMessage
-            l4Message = L4NetworkMessage(
-                l3Payload, epoch, l2Proto, l2SrcAddr, l2DstAddr, l3Proto,
-                l3SrcAddr, l3DstAddr, l4Proto, l4SrcPort, l4DstPort)
-
-            self.messages.add(l4Message)
+            return [(L4NetworkMessage, (
+                bytes(l3Payload), epoch, l2Proto, l2SrcAddr, l2DstAddr,
+                l3Proto, l3SrcAddr, l3DstAddr, l4Proto, l4SrcPort,
+                l4DstPort))]
 
         else:
-            try:
-                (l2Proto, l2SrcAddr, l2DstAddr, l2Payload,
-                 etherType) = self.__decodeLayer2(header, payload)
-                (l3Proto, l3SrcAddr, l3DstAddr, l3Payload,
-                 ipProtocolNum) = self.__decodeLayer3(etherType, l2Payload)
-                (l4Proto, l4SrcPort, l4DstPort,
-                 l4Payload) = self.__decodeLayer4(ipProtocolNum, l3Payload)
-            except NetzobImportException as e:
-                self._logger.warn(
-                    "An error occured while decoding layer2, layer3, layer4 or layer5 of a packet: {0}".
-                    format(e))
-                return
+            context = (l2Proto, l2SrcAddr, l2DstAddr, l3Proto, l3SrcAddr,
+                       l3DstAddr, l4Proto, l4SrcPort, l4DstPort)
+            if self.__tcpReassembler is not None and l4Proto == "TCP":
+                pdus = self.__tcpReassembler.addSegment(
+                    (l3SrcAddr, l4SrcPort), (l3DstAddr, l4DstPort),
+                    tcpSeq, bytes(l4Payload), epoch, context,
+                    syn=tcpFlags & PCAPImporter.TCP_FLAG_SYN != 0,
+                    fin=tcpFlags & PCAPImporter.TCP_FLAG_FIN != 0,
+                    rst=tcpFlags & PCAPImporter.TCP_FLAG_RST != 0)
+                return [self.__buildL5Record(pdu) for pdu in pdus]
+
             if len(l4Payload) == 0:
-                return
+                return []
+
+            return [self.__buildL5Record((epoch, bytes(l4Payload), context))]
 
-            l5Message = L4NetworkMessage(
-                l4Payload, epoch, l2Proto, l2SrcAddr, l2DstAddr, l3Proto,
-                l3SrcAddr, l3DstAddr, l4Proto, l4SrcPort, l4DstPort)
-            
-            self.messages.add(l5Message)
+    def __buildL5Record(self, pdu):
+        """Internal method that builds the record of an applicative message
+        out of a tuple (date, payload, context) where context contains the
+        layer 2 to 4 properties."""
+        (epoch, l5Payload, context) = pdu
+        return (L4NetworkMessage, (l5Payload, epoch) + context)
 
-    def __decodeLayer2(self, header, payload):
+
+    def __decodeLayer2(self, linkType, payload):
         """Internal method that parses the specified header and extracts
-        layer2 related proprieties."""
+        layer2 related proprieties according to the link type of the frame.
 
-        def formatMacAddress(arrayMac):
-            return ":".join("{0:0>2}".format(hex(b)[2:])
-                            for b in arrayMac.tolist())
+        Header fields are directly read from the frame buffer, the
+        ImpactPacket objects are only built by :meth:`getMessageDetails`."""
 
-        if self.datalink == pcapy.DLT_EN10MB:
-            l2Decoder = Decoders.EthDecoder()
+        if linkType == PCAPImporter.LINKTYPE_EN10MB:
+            if len(payload) < 14:
+                raise NetzobImportException("PCAP",
+                                            "Truncated Ethernet header",
+                                            self.INVALID_LAYER2)
             l2Proto = "Ethernet"
-            layer2 = l2Decoder.decode(payload)
-            l2SrcAddr = formatMacAddress(layer2.get_ether_shost())
-            l2DstAddr = formatMacAddress(layer2.get_ether_dhost())
-            l2Payload = payload[layer2.get_header_size():]
-            etherType = layer2.get_ether_type()
-        elif self.datalink == pcapy.DLT_LINUX_SLL:
-            l2Decoder = Decoders.LinuxSLLDecoder()
+            (l2DstMac, l2SrcMac,
+             etherType) = PCAPImporter.ETHERNET_HEADER.unpack_from(payload)
+            l2SrcAddr = PCAPImporter.MAC_ADDRESS_FORMAT.format(*l2SrcMac)
+            l2DstAddr = PCAPImporter.MAC_ADDRESS_FORMAT.format(*l2DstMac)
+            # Skip the VLAN tags
+            headerSize = 14
+            while etherType in PCAPImporter.VLAN_ETHERTYPES and len(
+                    payload) >= headerSize + 4:
+                (etherType, ) = PCAPImporter.ETHERTYPE.unpack_from(
+                    payload, headerSize + 2)
+                headerSize += 4
+            l2Payload = payload[headerSize:]
+        elif linkType == PCAPImporter.LINKTYPE_LINUX_SLL:
+            if len(payload) < 16:
+                raise NetzobImportException("PCAP",
+                                            "Truncated Linux SLL header",
+                                            self.INVALID_LAYER2)
             l2Proto = "Linux SLL"
-            layer2 = l2Decoder.decode(payload)
-            l2SrcAddr = layer2.get_addr()
+            (packetType, arpHeader, addrLength, l2SrcAddr,
+             etherType) = PCAPImporter.SLL_HEADER.unpack_from(payload)
             l2DstAddr = None
-            l2Payload = payload[layer2.get_header_size():]
-            etherType = layer2.get_ether_type()
-        elif self.datalink == PCAPImporter.PROTOCOL201:
+            l2Payload = payload[16:]
+        elif linkType == PCAPImporter.PROTOCOL201:
             l2Proto = "Protocol 201"
-            hdr = payload.encode('hex')[0:8]
-            if hdr[6:] == "01":
+            if payload[3:4] == b"\x01":
                 l2SrcAddr = "Received"
             else:
                 l2SrcAddr = "Sent"
             l2DstAddr = None
             l2Payload = payload[8:]
-            etherType = payload[4:6]
+            etherType = bytes(payload[4:6])
+        else:
+            raise NetzobImportException(
+                "PCAP",
+                "Unsupported layer 2 ({0})".format(str(linkType)),
+                self.INVALID_LAYER2)
 
         return (l2Proto, l2SrcAddr, l2DstAddr, l2Payload, etherType)
 
@@ -328,64 +531,178 @@ class PCAPImporter(object):
         """Internal method that parses the specified header and extracts
         layer3 related proprieties."""
 
-        if etherType == Packets.IP.ethertype:
+        if etherType == PCAPImporter.ETHERTYPE_IPV4:
+            if len(l2Payload) < 20:
+                raise NetzobImportException("PCAP", "Truncated IP header",
+                                            self.INVALID_LAYER3)
             l3Proto = "IP"
-            l3Decoder = Decoders.IPDecoder()
-            layer3 = l3Decoder.decode(l2Payload)
-            paddingSize = len(l2Payload) - layer3.get_ip_len()
+            (versionAndHeaderLength, tos, totalLength, identification,
+             fragmentOffset, ttl, ipProtocolNum, checksum, l3SrcAddr,
+             l3DstAddr) = PCAPImporter.IPV4_HEADER.unpack_from(l2Payload)
+            headerSize = (versionAndHeaderLength & 0x0F) * 4
+            if headerSize < 20 or len(l2Payload) < headerSize:
+                raise NetzobImportException("PCAP",
+                                            "Invalid IP header length",
+                                            self.INVALID_LAYER3)
+            paddingSize = len(l2Payload) - totalLength
 
-            l3SrcAddr = layer3.get_ip_src()
-            l3DstAddr = layer3.get_ip_dst()
-            l3Payload = l2Payload[layer3.get_header_size():]
+            l3SrcAddr = socket.inet_ntoa(l3SrcAddr)
+            l3DstAddr = socket.inet_ntoa(l3DstAddr)
+            l3Payload = l2Payload[headerSize:]
             if paddingSize > 0 and len(l3Payload) > paddingSize:
                 l3Payload = l3Payload[:len(l3Payload) - paddingSize]
-            ipProtocolNum = layer3.get_ip_p()
+            return (l3Proto, l3SrcAddr, l3DstAddr, l3Payload, ipProtocolNum)
+        elif etherType == PCAPImporter.ETHERTYPE_IPV6:
+            if len(l2Payload) < 40:
+                raise NetzobImportException("PCAP", "Truncated IPv6 header",
+                                            self.INVALID_LAYER3)
+            l3Proto = "IPv6"
+            (versionAndFlow, payloadLength, ipProtocolNum, hopLimit,
+             l3SrcAddr,
+             l3DstAddr) = PCAPImporter.IPV6_HEADER.unpack_from(l2Payload)
+            # Skip the extension headers
+            headerSize = 40
+            while ipProtocolNum in PCAPImporter.IPV6_EXTENSION_HEADERS:
+                if len(l2Payload) < headerSize + 8:
+                    raise NetzobImportException(
+                        "PCAP", "Truncated IPv6 extension header",
+                        self.INVALID_LAYER3)
+                if ipProtocolNum == PCAPImporter.IPV6_FRAGMENT_HEADER:
+                    extensionSize = 8
+                else:
+                    extensionSize = (l2Payload[headerSize + 1] + 1) * 8
+                ipProtocolNum = l2Payload[headerSize]
+                headerSize += extensionSize
+
+            l3SrcAddr = socket.inet_ntop(socket.AF_INET6, l3SrcAddr)
+            l3DstAddr = socket.inet_ntop(socket.AF_INET6, l3DstAddr)
+            if payloadLength > 0:
+                l3Payload = l2Payload[headerSize:40 + payloadLength]
+            else:
+                # jumbogram or unspecified length
+                l3Payload = l2Payload[headerSize:]
             return (l3Proto, l3SrcAddr, l3DstAddr, l3Payload, ipProtocolNum)
         else:
             warnMessage = _("Cannot import one of the provided packets since "
-                            + "its layer 3 is unsupported (Only IP is " +
-                            "currently supported, packet ethernet " +
+                            + "its layer 3 is unsupported (Only IP and IPv6 "
+                            + "are currently supported, packet ethernet " +
                             "type = {0})").format(etherType)
-            self._logger.warn(warnMessage)
             raise NetzobImportException("PCAP", warnMessage,
                                         self.INVALID_LAYER3)
 
     def __decodeLayer4(self, ipProtocolNum, l3Payload):
         """Internal method that parses the specified header and extracts
-        layer4 related proprieties."""
+        layer4 related proprieties. For TCP segments, the sequence number
+        and the flags are also returned (None otherwise)."""
 
-        if ipProtocolNum == Packets.UDP.protocol:
+        if ipProtocolNum == PCAPImporter.IP_PROTOCOL_UDP:
+            if len(l3Payload) < 8:
+                raise NetzobImportException("PCAP", "Truncated UDP header",
+                                            self.INVALID_LAYER4)
             l4Proto = "UDP"
-            l4Decoder = Decoders.UDPDecoder()
-            layer4 = l4Decoder.decode(l3Payload)
-            l4SrcPort = layer4.get_uh_sport()
-            l4DstPort = layer4.get_uh_dport()
-            l4Payload = layer4.get_data_as_string()
-            return (l4Proto, l4SrcPort, l4DstPort, l4Payload)
-        elif ipProtocolNum == Packets.TCP.protocol:
+            (l4SrcPort, l4DstPort) = PCAPImporter.PORTS.unpack_from(l3Payload)
+            l4Payload = l3Payload[8:]
+            return (l4Proto, l4SrcPort, l4DstPort, l4Payload, None, None)
+        elif ipProtocolNum == PCAPImporter.IP_PROTOCOL_TCP:
+            if len(l3Payload) < 20:
+                raise NetzobImportException("PCAP", "Truncated TCP header",
+                                            self.INVALID_LAYER4)
             l4Proto = "TCP"
-            l4Decoder = Decoders.TCPDecoder()
-            layer4 = l4Decoder.decode(l3Payload)
-            l4SrcPort = layer4.get_th_sport()
-            l4DstPort = layer4.get_th_dport()
-            l4Payload = layer4.get_data_as_string()
-            return (l4Proto, l4SrcPort, l4DstPort, l4Payload)
+            (l4SrcPort, l4DstPort, tcpSeq, tcpAck, dataOffset,
+             tcpFlags) = PCAPImporter.TCP_HEADER.unpack_from(l3Payload)
+            headerSize = (dataOffset >> 4) * 4
+            if headerSize < 20 or len(l3Payload) < headerSize:
+                raise NetzobImportException("PCAP",
+                                            "Invalid TCP header length",
+                                            self.INVALID_LAYER4)
+            l4Payload = l3Payload[headerSize:]
+            return (l4Proto, l4SrcPort, l4DstPort, l4Payload, tcpSeq,
+                    tcpFlags)
         else:
             warnMessage = _("Cannot import one of the provided packets since "
                             + "its layer 4 is unsupported (Only UDP and TCP " +
                             "are currently supported, packet IP protocol " +
                             "number = {0})").format(ipProtocolNum)
-            self._logger.warn(warnMessage)
             raise NetzobImportException("PCAP", warnMessage,
                                         self.INVALID_LAYER4)
 
-    @typeCheck(list, str, int, int, bool)
+    def _verifyFiles(self, filePathList):
+        """Internal method that verifies the existence of input files."""
+        errorMessageList = []
+        for filePath in filePathList:
+            try:
+                fp = open(filePath)
+                fp.close()
+            except IOError as e:
+                errorMessage = _("Error while trying to open the " +
+                                 "file {0}.").format(filePath)
+                if e.errno == errno.EACCES:
+                    errorMessage = _("Error while trying to open the file " +
+                                     "{0}, more permissions are required for "
+                                     + "reading it.").format(filePath)
+                errorMessageList.append(errorMessage)
+                self._logger.warn(errorMessage)
+
+        if errorMessageList != []:
+            raise NetzobImportException("PCAP", "\n".join(errorMessageList))
+
+    def _verifyImportLayer(self, importLayer):
+        """Internal method that verifies and sets the expected import layer."""
+        availableLayers = [1, 2, 3, 4, 5]
+        if not importLayer in availableLayers:
+            raise Exception(
+                "Only layers level {0} are available.".format(availableLayers))
+        self.importLayer = importLayer
+
+    def __initTCPReassembler(self, reassembleTCPStreams):
+        """Internal method that creates (if requested) the TCP reassembler
+        used when importing the applicative layer."""
+        if reassembleTCPStreams and self.importLayer == 5:
+            self.__tcpReassembler = TCPStreamReassembler()
+        else:
+            self.__tcpReassembler = None
+
+    def __flushTCPReassembler(self):
+        """Internal method that returns the records of the PDUs that remain
+        in the TCP reassembler."""
+        if self.__tcpReassembler is None:
+            return []
+        return [
+            self.__buildL5Record(pdu) for pdu in self.__tcpReassembler.flush()
+        ]
+
+    def __initSampler(self, sampler):
+        """Internal method that prepares (if requested) the sampler applied
+        to the decoded records."""
+        self.__sampler = sampler
+        if sampler is not None:
+            sampler.reset()
+
+    def __sampleRecords(self, records):
+        """Internal method that returns the records selected by the sampler
+        (all of them if no sampler is used)."""
+        if self.__sampler is None:
+            return records
+        return self.__sampler.sample(records)
+
+    def __flushSampler(self):
+        """Internal method that returns the records that remain in the
+        sampler."""
+        if self.__sampler is None:
+            return []
+        return self.__sampler.flush()
+
+    @typeCheck(list, str, int, int, bool, bool, bool, FlowSampler, bool)
     def readMessages(self,
                      filePathList,
                      bpfFilter="",
                      importLayer=5,
                      nbPackets=0,
                      mergePacketsInFlow=False,
+                     reassembleTCPStreams=False,
+                     columnar=False,
+                     sampler=None,
+                     incremental=False,
                     ):
         """Read all messages from a list of PCAP files. A BPF filter
         can be set to limit the captured packets. The layer of import
@@ -396,6 +713,43 @@ class PCAPImporter(object):
           - If layer=5, we capture at the applicative layer (such as the TCP or UDP payload).
          Finally, the number of packets to capture can be specified.
 
+        Files that grow while they are analyzed can be imported
+        incrementally: the importer remembers where it stopped in each
+        file, and the following incremental imports only decode the
+        records appended since then. Their messages are merged in the
+        collection returned by the first incremental import, which is
+        returned again. The number of packets to capture applies to all
+        the incremental imports of a file. The TCP streams and the sampler
+        need the whole capture, they cannot be used with incremental imports.
+
+        >>> import os, shutil, tempfile
+        >>> from netzob.all import *
+        >>> filePath = os.path.join(tempfile.mkdtemp(), "capture.pcap")
+        >>> with open("./test/resources/pcaps/test_import_udp.pcap", "rb") as capture:
+        ...     content = capture.read()
+        >>> with open(filePath, "wb") as growingCapture:
+        ...     nbBytes = growingCapture.write(content[:500])
+        >>> importer = PCAPImporter()
+        >>> messages = importer.readMessages([filePath], incremental=True)
+        >>> print(len(messages.values()))
+        6
+        >>> with open(filePath, "ab") as growingCapture:
+        ...     nbBytes = growingCapture.write(content[500:])
+        >>> importer.readMessages([filePath], incremental=True) is messages
+        True
+        >>> print(len(messages.values()))
+        14
+        >>> print([m.data for m in messages.values()] == [m.data for m in PCAPImporter.readFile("./test/resources/pcaps/test_import_udp.pcap").values()])
+        True
+        >>> importer.readMessages([filePath], reassembleTCPStreams=True, incremental=True)
+        Traceback (most recent call last):
+        ...
+        ValueError: TCP streams cannot be reassembled when they are imported incrementally
+        >>> importer.readMessages([filePath], sampler=FlowSampler(nbMessagesPerFlow=2), incremental=True)
+        Traceback (most recent call last):
+        ...
+        ValueError: Messages cannot be sampled when they are imported incrementally
+
         :param filePathList: the messages to cluster.
         :type filePathList: a list of :class:`str`
         :param bpfFilter: a string representing a BPF filter.
@@ -406,58 +760,233 @@ class PCAPImporter(object):
         :type nbPackets: :class:`int`
         :param mergePacketsInFlow: if True, consecutive packets with same source and destination ar merged (i.e. to mimic a flow) 
         :type mergePacketsInFlow: :class:`bool`
+        :param reassembleTCPStreams: if True and layer=5, TCP payloads are reassembled using sequence numbers and one message is produced per PDU
+        :type reassembleTCPStreams: :class:`bool`
+        :param columnar: if True, messages are returned in a :class:`MessageStore <netzob.Model.Vocabulary.Messages.MessageStore.MessageStore>`
+        :type columnar: :class:`bool`
+        :param sampler: if set, only the messages selected by the sampler are imported. They are selected before being built.
+        :type sampler: :class:`FlowSampler <netzob.Import.PCAPImporter.FlowSampler.FlowSampler>`
+        :param incremental: if True, only the records appended to the files since the previous incremental import are decoded
+        :type incremental: :class:`bool`
         :return: a list of captured messages
         :rtype: a list of :class:`netzob.Model.Vocabulary.Messages.AbstractMessage`
         """
 
-        # Verify the existence of input files
-        errorMessageList = []
-        for filePath in filePathList:
-            try:
-                fp = open(filePath)
-                fp.close()
-            except IOError as e:
-                errorMessage = _("Error while trying to open the " +
-                                 "file {0}.").format(filePath)
-                if e.errno == errno.EACCES:
-                    errorMessage = _("Error while trying to open the file " +
-                                     "{0}, more permissions are required for "
-                                     + "reading it.").format(filePath)
-                errorMessageList.append(errorMessage)
-                self._logger.warn(errorMessage)
-
-        if errorMessageList != []:
-            raise NetzobImportException("PCAP", "\n".join(errorMessageList))
+        # the flows, the TCP streams and the sampling of a file that grows
+        # cannot be complete until its capture ends
+        if incremental:
+            if mergePacketsInFlow:
+                raise ValueError(
+                    "Packets cannot be merged in flows when they are imported incrementally")
+            if reassembleTCPStreams:
+                raise ValueError(
+                    "TCP streams cannot be reassembled when they are imported incrementally")
+            if sampler is not None:
+                raise ValueError(
+                    "Messages cannot be sampled when they are imported incrementally")
 
-        # Verify the expected import layer
-        availableLayers = [1, 2, 3, 4, 5]
-        if not importLayer in availableLayers:
-            raise Exception(
-                "Only layers level {0} are available.".format(availableLayers))
-        self.importLayer = importLayer
+        self._verifyFiles(filePathList)
+        self._verifyImportLayer(importLayer)
+        self.__initPacketFilter(bpfFilter)
+        self.__initTCPReassembler(reassembleTCPStreams)
+        self.__initSampler(sampler)
 
-        # Call the method that does the import job for each PCAP file
-        self.messages = SortedTypedList(AbstractMessage)
+        # Decode the frames of each PCAP file
+        if incremental:
+            self.__initIncrementalMessages(columnar)
+            self.messages = self.__incrementalMessages
+        elif columnar:
+            self.messages = MessageStore()
+        else:
+            self.messages = SortedTypedList(AbstractMessage)
         for filePath in filePathList:
-            self.__readMessagesFromFile(filePath, bpfFilter, nbPackets)
+            for records in self.__readFile(filePath, nbPackets,
+                                           incremental=incremental):
+                self.__storeRecords(self.__sampleRecords(records))
+
+        # Emit the PDUs of the TCP streams that are still open
+        self.__storeRecords(
+            self.__sampleRecords(self.__flushTCPReassembler()))
+
+        # Emit the messages kept by the sampler until the end of the import
+        self.__storeRecords(self.__flushSampler())
         
         # if requested, we merge consecutive messages that share same source and destination
         if mergePacketsInFlow:
-            mergedMessages = SortedTypedList(AbstractMessage)
-            previousMessage = None
-            for message in self.messages.values():
-                if previousMessage is not None and message.source == previousMessage.source and message.destination == previousMessage.destination:
-                    previousMessage.data += message.data
-                else:
-                    mergedMessages.add(message)
-                    previousMessage = message
-            self.messages = mergedMessages
-            
+            self.messages = PCAPImporter._mergePacketsInFlow(self.messages)
+
         return self.messages
 
+    def __initIncrementalMessages(self, columnar):
+        """Internal method that creates the collection of the messages
+        imported incrementally, unless it exists with the requested type.
+        The states of the files are forgotten with the previous collection."""
+        if columnar:
+            messagesType = MessageStore
+        else:
+            messagesType = SortedTypedList
+        if not isinstance(self.__incrementalMessages, messagesType):
+            if columnar:
+                self.__incrementalMessages = MessageStore()
+            else:
+                self.__incrementalMessages = SortedTypedList(AbstractMessage)
+            self.__fileStates = dict()
+
+    def __storeRecords(self, records):
+        """Internal method that adds the messages described by records to
+        the imported messages. Messages are not built if they are imported
+        in a MessageStore."""
+        if isinstance(self.messages, MessageStore):
+            self.messages.addRecords(records)
+        else:
+            self.messages._extendTrusted(PCAPImporter._buildMessages(records))
+
+    @staticmethod
+    def _mergePacketsInFlow(messages):
+        """Merge consecutive messages that share the same source and
+        destination. It returns a new SortedTypedList (or a new
+        MessageStore if messages are stored in a MessageStore)."""
+        if isinstance(messages, MessageStore):
+            records = []
+            previousFlow = None
+            for (message, (messageClass, arguments)) in zip(
+                    messages, messages.records()):
+                flow = (message.source, message.destination)
+                if flow == previousFlow:
+                    records[-1][1][0] += arguments[0]
+                else:
+                    records.append((messageClass, [bytearray(arguments[0])] +
+                                    list(arguments[1:])))
+                    previousFlow = flow
+            mergedMessages = MessageStore()
+            mergedMessages.addRecords(records)
+            return mergedMessages
+
+        mergedMessages = []
+        previousMessage = None
+        for message in messages.values():
+            if previousMessage is not None and message.source == previousMessage.source and message.destination == previousMessage.destination:
+                previousMessage.data += message.data
+            else:
+                mergedMessages.append(message)
+                previousMessage = message
+        return SortedTypedList._fromTrusted(AbstractMessage, mergedMessages)
+
+    def _readRecords(self,
+                     filePath,
+                     bpfFilter="",
+                     importLayer=5,
+                     nbPackets=0,
+                     reassembleTCPStreams=False,
+                     startOffset=None,
+                     endOffset=None):
+        """Read the records (messageClass, arguments) of the messages found
+        in a PCAP file or, if offsets are specified, in the byte range
+        [startOffset, endOffset) of a classic PCAP file. This range must be
+        aligned on records boundaries (see :meth:`_splitFile`).
+
+        This method is used by :class:`ParallelPCAPImporter` whose workers
+        return records instead of messages, as they are cheaper to transfer
+        between processes."""
+
+        self._verifyImportLayer(importLayer)
+        self.__initPacketFilter(bpfFilter)
+        self.__initTCPReassembler(reassembleTCPStreams)
+
+        records = []
+        for frameRecords in self.__readFile(filePath, nbPackets, startOffset,
+                                            endOffset):
+            records.extend(frameRecords)
+
+        records.extend(self.__flushTCPReassembler())
+        return records
+
+    @staticmethod
+    def _splitFile(filePath, nbRanges):
+        """Split a classic PCAP file in (at most) nbRanges byte ranges
+        (startOffset, endOffset) aligned on records boundaries. Only
+        records headers are read. It returns None if the file is not a
+        classic PCAP file (e.g. a pcapng file)."""
+
+        with PCAPReader(filePath) as packetReader:
+            return packetReader.split(nbRanges)
+
+    @typeCheck(list, str, int, int, int, bool, FlowSampler)
+    def iterMessages(self,
+                     filePathList,
+                     bpfFilter="",
+                     importLayer=5,
+                     nbPackets=0,
+                     batchSize=1000,
+                     reassembleTCPStreams=False,
+                     sampler=None):
+        """Lazily read messages from a list of PCAP files. Instead of
+        building the whole list of messages before returning it, this method
+        returns a generator that yields lists of at most `batchSize`
+        messages, in the order they appear in the PCAP files. Packets are
+        only read and decoded when the next batch is requested, so the
+        memory consumption is bounded by the size of a batch and not by
+        the size of the capture.
+
+        Parameters `bpfFilter`, `importLayer`, `nbPackets`,
+        `reassembleTCPStreams` and `sampler` share the semantic of
+        :meth:`readMessages`. When TCP streams are reassembled, messages are
+        yielded when their PDU is completed. Messages kept in the reservoirs
+        of a sampler are yielded at the end.
+
+        :param filePathList: a list of pcap files to read
+        :type filePathList: a list of :class:`str`
+        :param bpfFilter: a string representing a BPF filter.
+        :type bpfFilter: :class:`str`
+        :param importLayer: an integer representing the protocol layer to start importing.
+        :type importLayer: :class:`int`
+        :param nbPackets: the number of packets to import per file
+        :type nbPackets: :class:`int`
+        :param batchSize: the maximum number of messages in each yielded batch
+        :type batchSize: :class:`int`
+        :param reassembleTCPStreams: if True and layer=5, TCP payloads are reassembled using sequence numbers and one message is produced per PDU
+        :type reassembleTCPStreams: :class:`bool`
+        :param sampler: if set, only the messages selected by the sampler are imported
+        :type sampler: :class:`FlowSampler <netzob.Import.PCAPImporter.FlowSampler.FlowSampler>`
+        :return: a generator of lists of captured messages
+        :rtype: a generator of list of :class:`netzob.Model.Vocabulary.Messages.AbstractMessage`
+        """
+
+        if batchSize is None or batchSize <= 0:
+            raise ValueError("A strictly positive batch size is required.")
+        self._verifyFiles(filePathList)
+        self._verifyImportLayer(importLayer)
+        self.__initPacketFilter(bpfFilter)
+        self.__initTCPReassembler(reassembleTCPStreams)
+        self.__initSampler(sampler)
+
+        return self.__iterMessagesFromFiles(filePathList, nbPackets,
+                                            batchSize)
+
+    def __iterMessagesFromFiles(self, filePathList, nbPackets, batchSize):
+        """Internal generator that reads the packets of each PCAP file one
+        by one and yields the decoded messages by batches."""
+
+        batch = []
+        for filePath in filePathList:
+            for records in self.__readFile(filePath, nbPackets):
+                batch.extend(
+                    PCAPImporter._buildMessages(self.__sampleRecords(records)))
+                while len(batch) >= batchSize:
+                    yield batch[:batchSize]
+                    batch = batch[batchSize:]
+
+        batch.extend(
+            PCAPImporter._buildMessages(
+                self.__sampleRecords(self.__flushTCPReassembler())))
+        batch.extend(PCAPImporter._buildMessages(self.__flushSampler()))
+        while len(batch) > 0:
+            yield batch[:batchSize]
+            batch = batch[batchSize:]
+
     @staticmethod
-    @typeCheck(list, str, int, int, bool)
-    def readFiles(filePathList, bpfFilter="", importLayer=5, nbPackets=0, mergePacketsInFlow=False):
+    @typeCheck(list, str, int, int, bool, bool, int, bool, FlowSampler)
+    def readFiles(filePathList, bpfFilter="", importLayer=5, nbPackets=0, mergePacketsInFlow=False, reassembleTCPStreams=False, nbThread=1, columnar=False, sampler=None):
         """Read all messages from a list of PCAP files. A BPF filter
         can be set to limit the captured packets. The layer of import
         can also be specified:
@@ -476,17 +1005,34 @@ class PCAPImporter(object):
         :param nbPackets: the number of packets to import
         :type nbPackets: :class:`int`
         :param mergePacketsInFlow: if True, consecutive packets with same source and destination ar merged (i.e. to mimic a flow) 
-        :type mergePacketsInFlow: :class:`bool`        
+        :type mergePacketsInFlow: :class:`bool`
+        :param reassembleTCPStreams: if True and layer=5, TCP payloads are reassembled using sequence numbers and one message is produced per PDU
+        :type reassembleTCPStreams: :class:`bool`
+        :param nbThread: the number of processes used to import the files (None means one per CPU, see :class:`ParallelPCAPImporter`)
+        :type nbThread: :class:`int`
+        :param columnar: if True, messages are returned in a :class:`MessageStore <netzob.Model.Vocabulary.Messages.MessageStore.MessageStore>` (see :meth:`readMessages`)
+        :type columnar: :class:`bool`
+        :param sampler: if set, only the messages selected by the sampler are imported (see :meth:`readMessages`)
+        :type sampler: :class:`FlowSampler <netzob.Import.PCAPImporter.FlowSampler.FlowSampler>`
         :return: a list of captured messages
         :rtype: a list of :class:`netzob.Model.Vocabulary.Messages.AbstractMessage`
         """
 
+        if nbThread != 1:
+            from netzob.Import.PCAPImporter.ParallelPCAPImporter import ParallelPCAPImporter
+            importer = ParallelPCAPImporter(
+                bpfFilter, importLayer, nbPackets, mergePacketsInFlow,
+                reassembleTCPStreams, nbThread, columnar, sampler)
+            return importer.execute(filePathList)
+
         importer = PCAPImporter()
-        return importer.readMessages(filePathList,bpfFilter, importLayer, nbPackets, mergePacketsInFlow)
+        return importer.readMessages(filePathList, bpfFilter, importLayer,
+                                     nbPackets, mergePacketsInFlow,
+                                     reassembleTCPStreams, columnar, sampler)
 
     @staticmethod
-    @typeCheck(str, str, int, int, bool)
-    def readFile(filePath, bpfFilter="", importLayer=5, nbPackets=0, mergePacketsInFlow=False):
+    @typeCheck(str, str, int, int, bool, bool, int, bool, FlowSampler)
+    def readFile(filePath, bpfFilter="", importLayer=5, nbPackets=0, mergePacketsInFlow=False, reassembleTCPStreams=False, nbThread=1, columnar=False, sampler=None):
         """Read all messages from the specified PCAP file. A BPF filter
         can be set to limit the captured packets. The layer of import
         can also be specified:
@@ -496,6 +1042,27 @@ class PCAPImporter(object):
           - If layer=5, we capture at the applicative layer (such as the TCP or UDP payload) and merge consecutive messages with same source and destination.
          Finally, the number of packets to capture can be specified.
 
+        The file is opened once and closed when it is read.
+
+        >>> import gc, warnings
+        >>> from netzob.all import *
+        >>> from netzob.Import.PCAPImporter.PCAPReader import PCAPReader
+        >>> openedReaders = []
+        >>> readerOpen = PCAPReader.open
+        >>> def countedOpen(reader):
+        ...     openedReaders.append(reader)
+        ...     readerOpen(reader)
+        >>> PCAPReader.open = countedOpen
+        >>> with warnings.catch_warnings(record=True) as caughtWarnings:
+        ...     warnings.simplefilter("always", ResourceWarning)
+        ...     messages = PCAPImporter.readFile("./test/resources/pcaps/test_import_udp.pcap")
+        ...     collected = gc.collect()
+        >>> PCAPReader.open = readerOpen
+        >>> print(len(openedReaders))
+        1
+        >>> print([w for w in caughtWarnings if issubclass(w.category, ResourceWarning)])
+        []
+
         :param filePath: the pcap path
         :type filePath: :class:`str`
         :param bpfFilter: a string representing a BPF filter.
@@ -506,13 +1073,64 @@ class PCAPImporter(object):
         :type nbPackets: :class:`int`
         :param mergePacketsInFlow: if True, consecutive packets with same source and destination ar merged (i.e. to mimic a flow) 
         :type mergePacketsInFlow: :class:`bool`
+        :param reassembleTCPStreams: if True and layer=5, TCP payloads are reassembled using sequence numbers and one message is produced per PDU
+        :type reassembleTCPStreams: :class:`bool`
+        :param nbThread: the number of processes used to import the file (None means one per CPU, see :class:`ParallelPCAPImporter`)
+        :type nbThread: :class:`int`
+        :param columnar: if True, messages are returned in a :class:`MessageStore <netzob.Model.Vocabulary.Messages.MessageStore.MessageStore>` (see :meth:`readMessages`)
+        :type columnar: :class:`bool`
+        :param sampler: if set, only the messages selected by the sampler are imported (see :meth:`readMessages`)
+        :type sampler: :class:`FlowSampler <netzob.Import.PCAPImporter.FlowSampler.FlowSampler>`
         :return: a list of captured messages
         :rtype: a list of :class:`netzob.Model.Vocabulary.Messages.AbstractMessage`
         """
 
+        return PCAPImporter.readFiles([filePath], bpfFilter, importLayer,
+                                      nbPackets, mergePacketsInFlow,
+                                      reassembleTCPStreams, nbThread,
+                                      columnar, sampler)
+
+    @staticmethod
+    @typeCheck(list, str, int, int, int, bool, FlowSampler)
+    def iterFiles(filePathList, bpfFilter="", importLayer=5, nbPackets=0, batchSize=1000, reassembleTCPStreams=False, sampler=None):
+        """Lazily read messages from a list of PCAP files by batches of at
+        most `batchSize` messages. Refer to :meth:`iterMessages` for
+        the description of the parameters.
+
+        >>> from netzob.all import *
+        >>> batches = PCAPImporter.iterFiles(["./test/resources/pcaps/test_import_udp.pcap"], batchSize=5)
+        >>> print([len(batch) for batch in batches])
+        [5, 5, 4]
+
+        :return: a generator of lists of captured messages
+        :rtype: a generator of list of :class:`netzob.Model.Vocabulary.Messages.AbstractMessage`
+        """
+
         importer = PCAPImporter()
-        return importer.readFiles([filePath], bpfFilter, importLayer,
-                                  nbPackets, mergePacketsInFlow)
+        return importer.iterMessages(filePathList, bpfFilter, importLayer,
+                                     nbPackets, batchSize,
+                                     reassembleTCPStreams, sampler)
+
+    @staticmethod
+    @typeCheck(str, str, int, int, int, bool, FlowSampler)
+    def iterFile(filePath, bpfFilter="", importLayer=5, nbPackets=0, batchSize=1000, reassembleTCPStreams=False, sampler=None):
+        """Lazily read messages from the specified PCAP file by batches of
+        at most `batchSize` messages. Refer to :meth:`iterMessages` for
+        the description of the parameters.
+
+        >>> from netzob.all import *
+        >>> for batch in PCAPImporter.iterFile("./test/resources/pcaps/test_import_udp.pcap", nbPackets=3, batchSize=2):
+        ...    print([m.data for m in batch])
+        [b'CMDidentify#\\x07\\x00\\x00\\x00Roberto', b'RESidentify#\\x00\\x00\\x00\\x00\\x00\\x00\\x00\\x00']
+        [b'CMDinfo#\\x00\\x00\\x00\\x00']
+
+        :return: a generator of lists of captured messages
+        :rtype: a generator of list of :class:`netzob.Model.Vocabulary.Messages.AbstractMessage`
+        """
+
+        return PCAPImporter.iterFiles([filePath], bpfFilter, importLayer,
+                                      nbPackets, batchSize,
+                                      reassembleTCPStreams, sampler)
 
     @staticmethod
     @typeCheck(L2NetworkMessage)
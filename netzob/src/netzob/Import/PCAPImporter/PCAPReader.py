@@ -0,0 +1,398 @@
+# -*- coding: utf-8 -*-
+
+#+---------------------------------------------------------------------------+
+#|          01001110 01100101 01110100 01111010 01101111 01100010            |
+#|                                                                           |
+#|               Netzob : Inferring communication protocols                  |
+#+---------------------------------------------------------------------------+
+#| Copyright (C) 2011-2017 Georges Bossert and Frédéric Guihéry              |
+#| This program is free software: you can redistribute it and/or modify      |
+#| it under the terms of the GNU General Public License as published by      |
+#| the Free Software Foundation, either version 3 of the License, or         |
+#| (at your option) any later version.                                       |
+#|                                                                           |
+#| This program is distributed in the hope that it will be useful,           |
+#| but WITHOUT ANY WARRANTY; without even the implied warranty of            |
+#| MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the              |
+#| GNU General Public License for more details.                              |
+#|                                                                           |
+#| You should have received a copy of the GNU General Public License         |
+#| along with this program. If not, see <http://www.gnu.org/licenses/>.      |
+#+---------------------------------------------------------------------------+
+#| @url      : http://www.netzob.org                                         |
+#| @contact  : contact@netzob.org                                            |
+#| @sponsors : Amossys, http://www.amossys.fr                                |
+#|             Supélec, http://www.rennes.supelec.fr/ren/rd/cidre/           |
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| Standard library imports
+#+---------------------------------------------------------------------------+
+import mmap
+import os
+import struct
+
+#+---------------------------------------------------------------------------+
+#| Related third party imports
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| Local application imports
+#+---------------------------------------------------------------------------+
+from netzob.Common.Utils.Decorators import NetzobLogger
+from netzob.Common.NetzobException import NetzobImportException
+
+
+@NetzobLogger
+class PCAPReader(object):
+    """Reads the frames of a classic PCAP or pcapng file without libpcap.
+
+    The file is memory mapped and its records headers are parsed in
+    place: each frame is returned as a tuple (date, linkType, payload)
+    where payload is a memoryview on the mapped file. A payload is only
+    valid while the reader is open, it must be copied (e.g. with
+    :func:`bytes`) to be kept.
+
+    pcapng files can hold several sections and interfaces, each with its
+    own link type and timestamp resolution. Enhanced, simple and
+    (obsolete) packet blocks are read, other blocks are skipped.
+    Timestamps are truncated to the microsecond like libpcap does.
+
+    >>> from netzob.Import.PCAPImporter.PCAPReader import PCAPReader
+    >>> with PCAPReader("./test/resources/pcaps/test_import_udp.pcap") as reader:
+    ...     frames = [(date, linkType, bytes(payload)) for (date, linkType, payload) in reader.records()]
+    >>> print(reader.fileFormat, reader.linkType, len(frames))
+    pcap 1 14
+    >>> print(frames[0][0], frames[0][2][-7:])
+    1388154953.318295 b'Roberto'
+
+    >>> with PCAPReader("./test/resources/pcaps/test_import_multi_interfaces.pcapng") as reader:
+    ...     frames = [(date, linkType, len(payload)) for (date, linkType, payload) in reader.records()]
+    >>> print(reader.fileFormat, reader.linkType)
+    pcapng 1
+    >>> for frame in frames:
+    ...     print(frame)
+    (1500000000.000001, 1, 47)
+    (1500000000.000002, 113, 49)
+    (1500000001.5, 1, 59)
+    (1500000002.0, 1, 42)
+
+    Classic PCAP files can be split in byte ranges aligned on records
+    boundaries, which can be read independently:
+
+    >>> with PCAPReader("./test/resources/pcaps/test_import_udp.pcap") as reader:
+    ...     ranges = reader.split(3)
+    ...     print([len(list(reader.records(*r))) for r in ranges])
+    [5, 5, 4]
+
+    The offset following the last frame returned is kept, so the frames
+    appended later to a file can be read without reading the others
+    again. A truncated frame at the end of the file (e.g. not completely
+    written yet) is not returned and is not included in this offset:
+
+    >>> with PCAPReader("./test/resources/pcaps/test_import_multi_interfaces.pcapng") as reader:
+    ...     frames = reader.records()
+    ...     firstFrames = (next(frames), next(frames))
+    ...     offset = reader.offset
+    ...     print([date for (date, linkType, payload) in reader.records(offset)])
+    [1500000001.5, 1500000002.0]
+
+    """
+
+    # Layout of classic PCAP files headers and magic numbers (byte order,
+    # number of timestamp fractions per second)
+    PCAP_GLOBAL_HEADER_FORMAT = "IHHiIII"
+    PCAP_GLOBAL_HEADER_SIZE = 24
+    PCAP_RECORD_HEADER_FORMAT = "IIII"
+    PCAP_MAGIC_NUMBERS = {
+        b"\xd4\xc3\xb2\xa1": ("<", 1000000),
+        b"\xa1\xb2\xc3\xd4": (">", 1000000),
+        b"\x4d\x3c\xb2\xa1": ("<", 1000000000),
+        b"\xa1\xb2\x3c\x4d": (">", 1000000000),
+    }
+
+    # pcapng blocks types, byte order magics and options
+    PCAPNG_SECTION_HEADER_MAGIC = b"\x0a\x0d\x0d\x0a"
+    PCAPNG_SECTION_HEADER_BLOCK = 0x0A0D0D0A
+    PCAPNG_BYTE_ORDER_MAGICS = {
+        b"\x4d\x3c\x2b\x1a": "<",
+        b"\x1a\x2b\x3c\x4d": ">",
+    }
+    PCAPNG_INTERFACE_DESCRIPTION_BLOCK = 1
+    PCAPNG_PACKET_BLOCK = 2
+    PCAPNG_SIMPLE_PACKET_BLOCK = 3
+    PCAPNG_ENHANCED_PACKET_BLOCK = 6
+    PCAPNG_OPTION_END = 0
+    PCAPNG_OPTION_TSRESOL = 9
+    PCAPNG_OPTION_TSOFFSET = 14
+
+    # The upper bits of link types may hold additional information
+    # (e.g. the FCS length)
+    LINKTYPE_MASK = 0x03FFFFFF
+
+    def __init__(self, filePath):
+        self.filePath = filePath
+        self.fileFormat = None
+        self.linkType = None
+        self.offset = None
+        self.__file = None
+        self.__map = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+
+    def open(self):
+        """Maps the file in memory and parses its first headers to find
+        its format and the link type of its first interface."""
+
+        self.__file = open(self.filePath, 'rb')
+        try:
+            if os.fstat(self.__file.fileno()).st_size < 4:
+                raise NetzobImportException(
+                    "PCAP", "{0} is not a PCAP file".format(self.filePath))
+            self.__map = mmap.mmap(
+                self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+
+            magic = self.__map[:4]
+            if magic in PCAPReader.PCAP_MAGIC_NUMBERS:
+                self.fileFormat = "pcap"
+                self.__openPCAP(magic)
+            elif magic == PCAPReader.PCAPNG_SECTION_HEADER_MAGIC:
+                self.fileFormat = "pcapng"
+                for (blockType, byteOrder, start, end) in self.__pcapngBlocks():
+                    if blockType == PCAPReader.PCAPNG_INTERFACE_DESCRIPTION_BLOCK:
+                        self.linkType = self.__parseInterface(byteOrder, start,
+                                                              end)[0]
+                        break
+            else:
+                raise NetzobImportException(
+                    "PCAP", "{0} is not a PCAP or a pcapng file".format(
+                        self.filePath))
+        except:
+            self.close()
+            raise
+
+    def close(self):
+        """Unmaps and closes the file."""
+        if self.__map is not None:
+            try:
+                self.__map.close()
+            except BufferError:
+                # Some payloads are still referenced, the mapping is
+                # released with them
+                pass
+            self.__map = None
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+
+    def records(self, startOffset=None, endOffset=None):
+        """Generator of the frames (date, linkType, payload) of the file.
+        The byte range [startOffset, endOffset) to read can be specified,
+        it must be aligned on records (or blocks) boundaries (see
+        :meth:`split` and :attr:`offset`). The blocks of a pcapng file
+        which precede the range are scanned to find its interfaces.
+
+        Before a frame is returned, :attr:`offset` is set to the offset
+        that follows it."""
+
+        if self.__map is None:
+            raise ValueError("The PCAP reader is not opened")
+        if self.fileFormat == "pcap":
+            return self.__pcapRecords(startOffset, endOffset)
+        return self.__pcapngRecords(startOffset, endOffset)
+
+    @property
+    def fileSize(self):
+        """The size (in bytes) of the file when it was opened.
+
+        :type: :class:`int`
+        """
+        if self.__map is None:
+            raise ValueError("The PCAP reader is not opened")
+        return len(self.__map)
+
+    def split(self, nbRanges):
+        """Split a classic PCAP file in (at most) nbRanges byte ranges
+        (startOffset, endOffset) aligned on records boundaries. It returns
+        None for pcapng files."""
+
+        if self.fileFormat != "pcap":
+            return None
+
+        fileSize = len(self.__map)
+        recordHeader = self.__recordHeader
+        rangeSize = max(
+            1, (fileSize - PCAPReader.PCAP_GLOBAL_HEADER_SIZE) // nbRanges)
+
+        ranges = []
+        startOffset = offset = PCAPReader.PCAP_GLOBAL_HEADER_SIZE
+        while offset + recordHeader.size <= fileSize:
+            capLen = recordHeader.unpack_from(self.__map, offset)[2]
+            offset += recordHeader.size + capLen
+            if offset - startOffset >= rangeSize and len(
+                    ranges) < nbRanges - 1:
+                ranges.append((startOffset, offset))
+                startOffset = offset
+        if offset > startOffset:
+            ranges.append((startOffset, offset))
+        return ranges
+
+    def __openPCAP(self, magic):
+        """Internal method that parses the global header of a classic
+        PCAP file."""
+        if len(self.__map) < PCAPReader.PCAP_GLOBAL_HEADER_SIZE:
+            raise NetzobImportException(
+                "PCAP", "Truncated PCAP header in {0}".format(self.filePath))
+        (byteOrder, self.__resolution) = PCAPReader.PCAP_MAGIC_NUMBERS[magic]
+        (magic, versionMajor, versionMinor, thisZone, sigFigs, snapLen,
+         linkType) = struct.unpack_from(
+             byteOrder + PCAPReader.PCAP_GLOBAL_HEADER_FORMAT, self.__map)
+        self.linkType = linkType & PCAPReader.LINKTYPE_MASK
+        self.__recordHeader = struct.Struct(
+            byteOrder + PCAPReader.PCAP_RECORD_HEADER_FORMAT)
+
+    def __pcapRecords(self, startOffset, endOffset):
+        """Internal generator of the frames of a classic PCAP file."""
+
+        view = memoryview(self.__map)
+        fileSize = len(view)
+        if startOffset is None:
+            startOffset = PCAPReader.PCAP_GLOBAL_HEADER_SIZE
+        if endOffset is None or endOffset > fileSize:
+            endOffset = fileSize
+        recordHeader = self.__recordHeader
+        resolution = self.__resolution
+        linkType = self.linkType
+
+        offset = self.offset = startOffset
+        while offset + recordHeader.size <= endOffset:
+            (secs, fraction, capLen,
+             wireLen) = recordHeader.unpack_from(view, offset)
+            dataOffset = offset + recordHeader.size
+            if dataOffset + capLen > fileSize:
+                self._logger.warn("Truncated record in {0}".format(
+                    self.filePath))
+                break
+            offset = self.offset = dataOffset + capLen
+            usecs = fraction * 1000000 // resolution
+            yield (secs + (usecs / 1000000.0), linkType,
+                   view[dataOffset:offset])
+
+    def __pcapngBlocks(self):
+        """Internal generator of the blocks (blockType, byteOrder,
+        bodyStart, bodyEnd) of a pcapng file. A block starts 8 bytes
+        before its body and ends 4 bytes after it."""
+
+        fileSize = len(self.__map)
+        byteOrder = None
+        offset = 0
+        while offset + 12 <= fileSize:
+            if self.__map[offset:offset + 4] == PCAPReader.PCAPNG_SECTION_HEADER_MAGIC:
+                byteOrder = PCAPReader.PCAPNG_BYTE_ORDER_MAGICS.get(
+                    self.__map[offset + 8:offset + 12])
+            if byteOrder is None:
+                raise NetzobImportException(
+                    "PCAP", "Invalid pcapng section in {0}".format(
+                        self.filePath))
+            (blockType, blockLength) = struct.unpack_from(
+                byteOrder + "II", self.__map, offset)
+            if blockLength < 12 or offset + blockLength > fileSize:
+                self._logger.warn("Truncated block in {0}".format(
+                    self.filePath))
+                break
+            yield (blockType, byteOrder, offset + 8,
+                   offset + blockLength - 4)
+            offset += blockLength
+
+    def __parseInterface(self, byteOrder, start, end):
+        """Internal method that parses an interface description block. It
+        returns the link type, the snapshot length, the number of
+        timestamp units per second and the timestamp offset (in seconds)
+        of the interface."""
+
+        (linkType, reserved, snapLen) = struct.unpack_from(
+            byteOrder + "HHI", self.__map, start)
+        resolution = 1000000
+        tsOffset = 0
+
+        offset = start + 8
+        while offset + 4 <= end:
+            (code, length) = struct.unpack_from(byteOrder + "HH", self.__map,
+                                                offset)
+            if code == PCAPReader.PCAPNG_OPTION_END:
+                break
+            if code == PCAPReader.PCAPNG_OPTION_TSRESOL and length >= 1:
+                value = self.__map[offset + 4]
+                if value & 0x80:
+                    resolution = 2**(value & 0x7F)
+                else:
+                    resolution = 10**value
+            elif code == PCAPReader.PCAPNG_OPTION_TSOFFSET and length >= 8:
+                (tsOffset, ) = struct.unpack_from(byteOrder + "q",
+                                                  self.__map, offset + 4)
+            offset += 4 + ((length + 3) & ~3)
+
+        return (linkType & PCAPReader.LINKTYPE_MASK, snapLen, resolution,
+                tsOffset)
+
+    def __pcapngRecords(self, startOffset, endOffset):
+        """Internal generator of the frames of a pcapng file."""
+
+        view = memoryview(self.__map)
+        if startOffset is None:
+            startOffset = 0
+        self.offset = startOffset
+        interfaces = []
+        for (blockType, byteOrder, start, end) in self.__pcapngBlocks():
+            if endOffset is not None and start - 8 >= endOffset:
+                break
+            if start - 8 >= startOffset:
+                self.offset = end + 4
+            elif blockType not in (
+                    PCAPReader.PCAPNG_SECTION_HEADER_BLOCK,
+                    PCAPReader.PCAPNG_INTERFACE_DESCRIPTION_BLOCK):
+                continue
+
+            if blockType == PCAPReader.PCAPNG_SECTION_HEADER_BLOCK:
+                # Interfaces are numbered per section
+                interfaces = []
+                continue
+            if blockType == PCAPReader.PCAPNG_INTERFACE_DESCRIPTION_BLOCK:
+                interfaces.append(self.__parseInterface(byteOrder, start,
+                                                        end))
+                continue
+
+            if blockType == PCAPReader.PCAPNG_ENHANCED_PACKET_BLOCK:
+                (interfaceId, tsHigh, tsLow, capLen,
+                 wireLen) = struct.unpack_from(byteOrder + "IIIII", view,
+                                               start)
+                dataOffset = start + 20
+            elif blockType == PCAPReader.PCAPNG_PACKET_BLOCK:
+                (interfaceId, dropsCount, tsHigh, tsLow, capLen,
+                 wireLen) = struct.unpack_from(byteOrder + "HHIIII", view,
+                                               start)
+                dataOffset = start + 20
+            elif blockType == PCAPReader.PCAPNG_SIMPLE_PACKET_BLOCK:
+                (wireLen, ) = struct.unpack_from(byteOrder + "I", view, start)
+                (interfaceId, tsHigh, tsLow) = (0, 0, 0)
+                dataOffset = start + 4
+                capLen = min(wireLen, end - dataOffset)
+                if len(interfaces) > 0 and interfaces[0][1] > 0:
+                    capLen = min(capLen, interfaces[0][1])
+            else:
+                continue
+
+            if interfaceId >= len(interfaces) or dataOffset + capLen > end:
+                self._logger.warn("Invalid packet block in {0}".format(
+                    self.filePath))
+                continue
+            (linkType, snapLen, resolution, tsOffset) = interfaces[interfaceId]
+            (secs, fraction) = divmod((tsHigh << 32) | tsLow, resolution)
+            usecs = fraction * 1000000 // resolution
+            yield (secs + tsOffset + (usecs / 1000000.0), linkType,
+                   view[dataOffset:dataOffset + capLen])
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+
+#+---------------------------------------------------------------------------+
+#|          01001110 01100101 01110100 01111010 01101111 01100010            |
+#|                                                                           |
+#|               Netzob : Inferring communication protocols                  |
+#+---------------------------------------------------------------------------+
+#| Copyright (C) 2011-2017 Georges Bossert and Frédéric Guihéry              |
+#| This program is free software: you can redistribute it and/or modify      |
+#| it under the terms of the GNU General Public License as published by      |
+#| the Free Software Foundation, either version 3 of the License, or         |
+#| (at your option) any later version.                                       |
+#|                                                                           |
+#| This program is distributed in the hope that it will be useful,           |
+#| but WITHOUT ANY WARRANTY; without even the implied warranty of            |
+#| MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the              |
+#| GNU General Public License for more details.                              |
+#|                                                                           |
+#| You should have received a copy of the GNU General Public License         |
+#| along with this program. If not, see <http://www.gnu.org/licenses/>.      |
+#+---------------------------------------------------------------------------+
+#| @url      : http://www.netzob.org                                         |
+#| @contact  : contact@netzob.org                                            |
+#| @sponsors : Amossys, http://www.amossys.fr                                |
+#|             Supélec, http://www.rennes.supelec.fr/ren/rd/cidre/           |
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| Standard library imports
+#+---------------------------------------------------------------------------+
+import ipaddress
+import re
+
+#+---------------------------------------------------------------------------+
+#| Related third party imports
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| Local application imports
+#+---------------------------------------------------------------------------+
+from netzob.Common.Utils.Decorators import NetzobLogger
+
+
+@NetzobLogger
+class PacketFilter(object):
+    """A packet filter that accepts a subset of the BPF syntax and is
+    evaluated on the header fields decoded by the
+    :class:`PCAPImporter <netzob.Import.PCAPImporter.PCAPImporter.PCAPImporter>`,
+    i.e. without copying the frames to libpcap.
+
+    The supported primitives are `ip`, `ip6`, `tcp`, `udp`,
+    `[src|dst] host <address>`, `[src|dst] net <network>` and
+    `[src|dst] port <number>`, optionally prefixed by a protocol
+    (e.g. `tcp port 80`). Primitives can be combined with `and` (`&&`),
+    `or` (`||`), `not` (`!`) and parentheses. A ValueError is raised if
+    the expression uses another part of the BPF syntax.
+
+    >>> from netzob.Import.PCAPImporter.PacketFilter import PacketFilter
+    >>> packetFilter = PacketFilter("tcp and (port 80 or dst host 10.0.0.1)")
+    >>> packetFilter.layer
+    4
+    >>> packetFilter.match("IP", "10.0.0.2", "10.0.0.3", "TCP", 1025, 80)
+    True
+    >>> packetFilter.match("IP", "10.0.0.2", "10.0.0.1", "TCP", 1025, 8080)
+    True
+    >>> packetFilter.match("IP", "10.0.0.2", "10.0.0.1", "UDP", 1025, 80)
+    False
+    >>> packetFilter = PacketFilter("not src net 192.168.0.0/16")
+    >>> packetFilter.layer
+    3
+    >>> packetFilter.match("IP", "192.168.1.1", "10.0.0.1", None, None, None)
+    False
+    >>> packetFilter.match("IPv6", "fe80::1", "fe80::2", None, None, None)
+    True
+    >>> PacketFilter("greater 100")
+    Traceback (most recent call last):
+    ...
+    ValueError: Unsupported BPF primitive: greater
+
+    """
+
+    TOKENS = re.compile(r"\(|\)|&&|\|\||!|[^\s()!]+")
+
+    PROTOCOLS = {
+        "ip": (3, 0, "IP"),
+        "ip6": (3, 0, "IPv6"),
+        "tcp": (4, 3, "TCP"),
+        "udp": (4, 3, "UDP"),
+    }
+    DIRECTIONS = ("src", "dst")
+    KINDS = ("host", "net", "port")
+
+    def __init__(self, expression):
+        self.expression = expression
+        self.layer = 3
+        self.__tokens = PacketFilter.TOKENS.findall(expression)
+        self.__position = 0
+        if len(self.__tokens) == 0:
+            raise ValueError("The BPF filter is empty")
+        self.__predicate = self.__parseOr()
+        if self.__position < len(self.__tokens):
+            raise ValueError("Unexpected token in BPF filter: {0}".format(
+                self.__tokens[self.__position]))
+
+    def match(self, l3Proto, l3SrcAddr, l3DstAddr, l4Proto, l4SrcPort,
+              l4DstPort):
+        """Returns True if a packet with the specified header fields is
+        accepted by the filter. Fields of the layers that could not be
+        decoded are None and never match a primitive."""
+        return self.__predicate((l3Proto, l3SrcAddr, l3DstAddr, l4Proto,
+                                 l4SrcPort, l4DstPort))
+
+    def __peek(self):
+        if self.__position < len(self.__tokens):
+            return self.__tokens[self.__position]
+        return None
+
+    def __next(self):
+        token = self.__peek()
+        if token is None:
+            raise ValueError("Unexpected end of BPF filter")
+        self.__position += 1
+        return token
+
+    def __parseOr(self):
+        predicates = [self.__parseAnd()]
+        while self.__peek() in ("or", "||"):
+            self.__next()
+            predicates.append(self.__parseAnd())
+        if len(predicates) == 1:
+            return predicates[0]
+        return lambda fields: any(predicate(fields) for predicate in predicates)
+
+    def __parseAnd(self):
+        predicates = [self.__parseNot()]
+        while self.__peek() in ("and", "&&"):
+            self.__next()
+            predicates.append(self.__parseNot())
+        if len(predicates) == 1:
+            return predicates[0]
+        return lambda fields: all(predicate(fields) for predicate in predicates)
+
+    def __parseNot(self):
+        token = self.__peek()
+        if token in ("not", "!"):
+            self.__next()
+            predicate = self.__parseNot()
+            return lambda fields: not predicate(fields)
+        if token == "(":
+            self.__next()
+            predicate = self.__parseOr()
+            if self.__next() != ")":
+                raise ValueError("Unbalanced parentheses in BPF filter")
+            return predicate
+        return self.__parsePrimitive()
+
+    def __parsePrimitive(self):
+        predicates = []
+        if self.__peek() in PacketFilter.PROTOCOLS:
+            (layer, index, value) = PacketFilter.PROTOCOLS[self.__next()]
+            self.layer = max(self.layer, layer)
+            predicates.append(
+                lambda fields: fields[index] == value)
+
+        direction = None
+        if self.__peek() in PacketFilter.DIRECTIONS:
+            direction = self.__next()
+
+        kind = None
+        if self.__peek() in PacketFilter.KINDS:
+            kind = self.__next()
+        elif direction is not None:
+            kind = "host"
+
+        if kind is not None:
+            predicates.append(self.__buildPredicate(kind, direction,
+                                                    self.__next()))
+        elif len(predicates) == 0:
+            raise ValueError(
+                "Unsupported BPF primitive: {0}".format(self.__peek()))
+
+        if len(predicates) == 1:
+            return predicates[0]
+        return lambda fields: all(predicate(fields) for predicate in predicates)
+
+    def __buildPredicate(self, kind, direction, value):
+        """Internal method that builds the predicate of a host, net or port
+        primitive."""
+
+        if kind == "port":
+            if not value.isdigit():
+                raise ValueError("Invalid port in BPF filter: {0}".format(value))
+            self.layer = 4
+            (srcIndex, dstIndex, value) = (4, 5, int(value))
+
+            def matchValue(fieldValue):
+                return fieldValue == value
+        else:
+            (srcIndex, dstIndex) = (1, 2)
+            try:
+                if kind == "host":
+                    value = str(ipaddress.ip_address(value))
+
+                    def matchValue(fieldValue):
+                        return fieldValue == value
+                else:
+                    network = ipaddress.ip_network(value, strict=False)
+
+                    def matchValue(fieldValue):
+                        return fieldValue is not None and ipaddress.ip_address(
+                            fieldValue) in network
+            except ValueError:
+                raise ValueError("Invalid {0} in BPF filter: {1}".format(
+                    kind, value))
+
+        if direction == "src":
+            return lambda fields: matchValue(fields[srcIndex])
+        if direction == "dst":
+            return lambda fields: matchValue(fields[dstIndex])
+        return lambda fields: matchValue(fields[srcIndex]) or matchValue(fields[dstIndex])
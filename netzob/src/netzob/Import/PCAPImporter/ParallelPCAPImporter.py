@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+
+#+---------------------------------------------------------------------------+
+#|          01001110 01100101 01110100 01111010 01101111 01100010            |
+#|                                                                           |
+#|               Netzob : Inferring communication protocols                  |
+#+---------------------------------------------------------------------------+
+#| Copyright (C) 2011-2017 Georges Bossert and Frédéric Guihéry              |
+#| This program is free software: you can redistribute it and/or modify      |
+#| it under the terms of the GNU General Public License as published by      |
+#| the Free Software Foundation, either version 3 of the License, or         |
+#| (at your option) any later version.                                       |
+#|                                                                           |
+#| This program is distributed in the hope that it will be useful,           |
+#| but WITHOUT ANY WARRANTY; without even the implied warranty of            |
+#| MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the              |
+#| GNU General Public License for more details.                              |
+#|                                                                           |
+#| You should have received a copy of the GNU General Public License         |
+#| along with this program. If not, see <http://www.gnu.org/licenses/>.      |
+#+---------------------------------------------------------------------------+
+#| @url      : http://www.netzob.org                                         |
+#| @contact  : contact@netzob.org                                            |
+#| @sponsors : Amossys, http://www.amossys.fr                                |
+#|             Supélec, http://www.rennes.supelec.fr/ren/rd/cidre/           |
+#+---------------------------------------------------------------------------+
+
+
+#+---------------------------------------------------------------------------+
+#| Standard library imports
+#+---------------------------------------------------------------------------+
+import heapq
+import multiprocessing
+
+#+---------------------------------------------------------------------------+
+#| Related third party imports
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| Local application imports
+#+---------------------------------------------------------------------------+
+from netzob.Common.Utils.Decorators import typeCheck, NetzobLogger
+from netzob.Common.Utils.SortedTypedList import SortedTypedList
+from netzob.Import.PCAPImporter.PCAPImporter import PCAPImporter
+from netzob.Model.Vocabulary.Messages.AbstractMessage import AbstractMessage
+from netzob.Model.Vocabulary.Messages.MessageStore import MessageStore
+
+
+def _executePCAPImport(arg, **kwargs):
+    """Wrapper used to parallelize the import of PCAP files using
+    a pool of processes. It returns the records of the imported messages.
+    """
+    (filePath, startOffset, endOffset, bpfFilter, importLayer, nbPackets,
+     reassembleTCPStreams) = arg
+    importer = PCAPImporter()
+    return importer._readRecords(filePath, bpfFilter, importLayer, nbPackets,
+                                 reassembleTCPStreams, startOffset, endOffset)
+
+
+@NetzobLogger
+class ParallelPCAPImporter(object):
+    """Imports PCAP files using a pool of processes.
+
+    The work is split by file or, when there are fewer files than
+    processes, by byte ranges of each file (aligned on record boundaries).
+    Workers return compact records of the decoded messages which are merged
+    according to their timestamp to build the final list of messages.
+
+    A file cannot be split by byte ranges if it is not a classic PCAP file,
+    if a number of packets to import is specified or if TCP streams are
+    reassembled. In these cases, each file is handled by a single process.
+
+    >>> from netzob.all import *
+    >>> importer = ParallelPCAPImporter(nbThread=4)
+    >>> messages = importer.execute(["./test/resources/pcaps/test_import_http.pcap"]).values()
+    >>> print(len(messages))
+    62
+    >>> sequentialMessages = PCAPImporter.readFile("./test/resources/pcaps/test_import_http.pcap").values()
+    >>> print([m.data for m in messages] == [m.data for m in sequentialMessages])
+    True
+
+    The parallel import is also available through the parameter `nbThread`
+    of :meth:`PCAPImporter.readFiles` and :meth:`PCAPImporter.readFile`.
+
+    >>> files = ["./test/resources/pcaps/test_import_udp.pcap", "./test/resources/pcaps/test_import_http.pcap"]
+    >>> messages = PCAPImporter.readFiles(files, bpfFilter="udp", nbThread=2).values()
+    >>> print(len(messages))
+    14
+    >>> messages = PCAPImporter.readFile(files[1], importLayer=3, bpfFilter="src port 80", nbThread=3).values()
+    >>> sequentialMessages = PCAPImporter.readFile(files[1], importLayer=3, bpfFilter="src port 80").values()
+    >>> print([m.data for m in messages] == [m.data for m in sequentialMessages])
+    True
+
+    With `columnar`, the records are directly stored in a
+    :class:`MessageStore <netzob.Model.Vocabulary.Messages.MessageStore.MessageStore>`,
+    messages are only built when they are accessed.
+
+    >>> messages = ParallelPCAPImporter(nbThread=2, columnar=True).execute(files)
+    >>> print(type(messages).__name__, len(messages))
+    MessageStore 76
+
+    """
+
+    def __init__(self,
+                 bpfFilter="",
+                 importLayer=5,
+                 nbPackets=0,
+                 mergePacketsInFlow=False,
+                 reassembleTCPStreams=False,
+                 nbThread=None,
+                 columnar=False,
+                 sampler=None):
+        """Constructor.
+
+        :keyword bpfFilter: a string representing a BPF filter.
+        :type bpfFilter: :class:`str`
+        :keyword importLayer: an integer representing the protocol layer to start importing.
+        :type importLayer: :class:`int`
+        :keyword nbPackets: the number of packets to import per file
+        :type nbPackets: :class:`int`
+        :keyword mergePacketsInFlow: if True, consecutive packets with same source and destination are merged
+        :type mergePacketsInFlow: :class:`bool`
+        :keyword reassembleTCPStreams: if True and layer=5, TCP payloads are reassembled using sequence numbers
+        :type reassembleTCPStreams: :class:`bool`
+        :keyword nbThread: the maximum number of processes that will be used (default is the number of CPUs).
+        :type nbThread: :class:`int`
+        :keyword columnar: if True, messages are returned in a :class:`MessageStore <netzob.Model.Vocabulary.Messages.MessageStore.MessageStore>`
+        :type columnar: :class:`bool`
+        :keyword sampler: if set, only the messages selected by the sampler are imported. Records are sampled in the order of their timestamps once the workers are done.
+        :type sampler: :class:`FlowSampler <netzob.Import.PCAPImporter.FlowSampler.FlowSampler>`
+        """
+        self.bpfFilter = bpfFilter
+        self.importLayer = importLayer
+        self.nbPackets = nbPackets
+        self.mergePacketsInFlow = mergePacketsInFlow
+        self.reassembleTCPStreams = reassembleTCPStreams
+        self.nbThread = nbThread
+        self.columnar = columnar
+        self.sampler = sampler
+
+    @typeCheck(list)
+    def execute(self, filePathList):
+        """Import the messages of the specified PCAP files.
+
+        An empty list of files produces an empty collection of messages,
+        as with a single process.
+
+        >>> from netzob.all import *
+        >>> print(len(ParallelPCAPImporter(nbThread=None).execute([])))
+        0
+        >>> print(len(PCAPImporter.readFiles([], nbThread=4, columnar=True)))
+        0
+
+        :param filePathList: a list of pcap files to read
+        :type filePathList: a list of :class:`str`
+        :return: a list of captured messages
+        :rtype: a :class:`netzob.Common.Utils.SortedTypedList.SortedTypedList` (or a :class:`netzob.Model.Vocabulary.Messages.MessageStore.MessageStore`) of :class:`netzob.Model.Vocabulary.Messages.AbstractMessage`
+        """
+        importer = PCAPImporter()
+        importer._verifyFiles(filePathList)
+        importer._verifyImportLayer(self.importLayer)
+
+        nbThread = self.nbThread
+        if nbThread is None:
+            nbThread = multiprocessing.cpu_count()
+
+        if len(filePathList) == 0:
+            # no process is needed to import nothing
+            results = []
+        else:
+            tasks = self.__computeTasks(filePathList, nbThread)
+            self._logger.debug("Import {0} file(s) using {1} task(s)".format(
+                len(filePathList), len(tasks)))
+
+            # Create a pool of 'nbThead' threads (process)
+            pool = multiprocessing.Pool(min(nbThread, len(tasks)))
+            try:
+                results = pool.map(_executePCAPImport, tasks)
+            finally:
+                pool.close()
+                pool.join()
+
+        # Merge the records of each task according to their timestamp
+        records = heapq.merge(*results, key=lambda record: record[1][1])
+        if self.sampler is not None:
+            self.sampler.reset()
+            records = self.sampler.sample(records) + self.sampler.flush()
+        if self.columnar:
+            messages = MessageStore()
+            messages.addRecords(records)
+        else:
+            messages = SortedTypedList._fromTrusted(
+                AbstractMessage, PCAPImporter._buildMessages(records))
+
+        if self.mergePacketsInFlow:
+            messages = PCAPImporter._mergePacketsInFlow(messages)
+
+        return messages
+
+    def __computeTasks(self, filePathList, nbThread):
+        """Split the import of the files in tasks, each task covering a
+        file or a byte range of a file."""
+
+        nbRangesPerFile = 1
+        if self.nbPackets == 0 and not self.reassembleTCPStreams and len(
+                filePathList) < nbThread:
+            nbRangesPerFile = -(-nbThread // len(filePathList))
+
+        tasks = []
+        for filePath in filePathList:
+            ranges = None
+            if nbRangesPerFile > 1:
+                ranges = PCAPImporter._splitFile(filePath, nbRangesPerFile)
+            if ranges is None:
+                ranges = [(None, None)]
+            for (startOffset, endOffset) in ranges:
+                tasks.append((filePath, startOffset, endOffset,
+                              self.bpfFilter, self.importLayer,
+                              self.nbPackets, self.reassembleTCPStreams))
+        return tasks
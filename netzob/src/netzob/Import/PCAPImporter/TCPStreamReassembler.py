@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+
+#+---------------------------------------------------------------------------+
+#|          01001110 01100101 01110100 01111010 01101111 01100010            |
+#|                                                                           |
+#|               Netzob : Inferring communication protocols                  |
+#+---------------------------------------------------------------------------+
+#| Copyright (C) 2011-2017 Georges Bossert and Frédéric Guihéry              |
+#| This program is free software: you can redistribute it and/or modify      |
+#| it under the terms of the GNU General Public License as published by      |
+#| the Free Software Foundation, either version 3 of the License, or         |
+#| (at your option) any later version.                                       |
+#|                                                                           |
+#| This program is distributed in the hope that it will be useful,           |
+#| but WITHOUT ANY WARRANTY; without even the implied warranty of            |
+#| MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the              |
+#| GNU General Public License for more details.                              |
+#|                                                                           |
+#| You should have received a copy of the GNU General Public License         |
+#| along with this program. If not, see <http://www.gnu.org/licenses/>.      |
+#+---------------------------------------------------------------------------+
+#| @url      : http://www.netzob.org                                         |
+#| @contact  : contact@netzob.org                                            |
+#| @sponsors : Amossys, http://www.amossys.fr                                |
+#|             Supélec, http://www.rennes.supelec.fr/ren/rd/cidre/           |
+#+---------------------------------------------------------------------------+
+
+
+#+---------------------------------------------------------------------------+
+#| Standard library imports
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| Related third party imports
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| Local application imports
+#+---------------------------------------------------------------------------+
+from netzob.Common.Utils.Decorators import NetzobLogger
+
+
+class TCPHalfStream(object):
+    """Reassembly state of one direction of a TCP connection."""
+
+    def __init__(self):
+        self.nextSeq = None
+        self.buffer = bytearray()
+        self.date = None
+        self.context = None
+        self.pending = dict()
+        self.closed = False
+
+
+@NetzobLogger
+class TCPStreamReassembler(object):
+    """Reassembles the payloads of TCP segments into application PDUs.
+
+    The state of each direction of a TCP connection is stored in a
+    dict keyed by its 4-tuple (source endpoint, destination endpoint).
+    Segments are ordered using their sequence numbers: retransmitted data
+    is dropped, overlapping data is trimmed and out-of-order segments are
+    kept aside until the missing data is received. A PDU is emitted when
+    the peer starts sending data (i.e. the direction of the connection
+    changes), when the connection is closed or when the buffer of the
+    direction reaches `maxBufferSize` bytes. If more than
+    `maxPendingSegments` out-of-order segments are waiting for missing
+    data, the hole is considered lost and the reassembly resumes after it.
+
+    Each PDU is returned as a tuple (date, data, context) where date is
+    the date of the first segment of the PDU and context is the object
+    given with this segment.
+
+    >>> from netzob.Import.PCAPImporter.TCPStreamReassembler import TCPStreamReassembler
+    >>> reassembler = TCPStreamReassembler()
+    >>> client = ("10.0.0.1", 1025)
+    >>> server = ("10.0.0.2", 80)
+    >>> reassembler.addSegment(client, server, 999, b"", 0.9, syn=True)
+    []
+    >>> reassembler.addSegment(client, server, 1000, b"GET / HT", 1.0)
+    []
+    >>> reassembler.addSegment(client, server, 1014, b"\\r\\n\\r\\n", 1.2)
+    []
+    >>> reassembler.addSegment(client, server, 1008, b"TP/1.1", 1.1)
+    []
+    >>> reassembler.addSegment(client, server, 1000, b"GET / HT", 1.3)
+    []
+    >>> reassembler.addSegment(server, client, 5000, b"HTTP/1.1 200 OK", 1.4, context="response")
+    [(1.0, b'GET / HTTP/1.1\\r\\n\\r\\n', None)]
+    >>> reassembler.addSegment(server, client, 5009, b"200 OK\\r\\n", 1.5)
+    []
+    >>> reassembler.addSegment(server, client, 5017, b"", 1.6, fin=True)
+    [(1.4, b'HTTP/1.1 200 OK\\r\\n', 'response')]
+    >>> reassembler.flush()
+    []
+
+    Buffers are bounded, a PDU is emitted as soon as its size reaches `maxBufferSize`.
+
+    >>> reassembler = TCPStreamReassembler(maxBufferSize=4)
+    >>> reassembler.addSegment(client, server, 0, b"abc", 1.0)
+    []
+    >>> reassembler.addSegment(client, server, 3, b"def", 2.0)
+    [(1.0, b'abcdef', None)]
+
+    """
+
+    SEQ_MODULO = 2**32
+    SEQ_HALF = 2**31
+
+    def __init__(self, maxBufferSize=1024 * 1024, maxPendingSegments=128):
+        if maxBufferSize <= 0:
+            raise ValueError("Maximum buffer size must be strictly positive")
+        if maxPendingSegments < 0:
+            raise ValueError("Maximum number of pending segments cannot be negative")
+        self.maxBufferSize = maxBufferSize
+        self.maxPendingSegments = maxPendingSegments
+        self.__streams = dict()
+
+    def addSegment(self,
+                   source,
+                   destination,
+                   seq,
+                   payload,
+                   date,
+                   context=None,
+                   syn=False,
+                   fin=False,
+                   rst=False):
+        """Process a TCP segment and return the list of PDUs it completes.
+
+        :param source: the source endpoint of the segment, for instance a tuple (address, port)
+        :type source: a hashable object
+        :param destination: the destination endpoint of the segment
+        :type destination: a hashable object
+        :param seq: the sequence number of the segment
+        :type seq: :class:`int`
+        :param payload: the payload of the segment
+        :type payload: :class:`bytes`
+        :param date: the capture date of the segment
+        :type date: :class:`float`
+        :param context: an object attached to the PDU if this segment starts it
+        :param syn: True if the SYN flag is set
+        :type syn: :class:`bool`
+        :param fin: True if the FIN flag is set
+        :type fin: :class:`bool`
+        :param rst: True if the RST flag is set
+        :type rst: :class:`bool`
+        :return: the completed PDUs
+        :rtype: a list of tuple (date, data, context)
+        """
+        key = (source, destination)
+        reverseKey = (destination, source)
+        pdus = []
+
+        if rst:
+            # the connection is aborted, emit what has been received so far
+            pdus.extend(self.__closeStream(key))
+            pdus.extend(self.__closeStream(reverseKey))
+            return pdus
+
+        stream = self.__streams.get(key)
+        if stream is None:
+            stream = TCPHalfStream()
+            self.__streams[key] = stream
+
+        if stream.closed:
+            return pdus
+
+        if syn:
+            # SYN consumes one sequence number
+            seq = (seq + 1) % self.SEQ_MODULO
+            if stream.nextSeq is None:
+                stream.nextSeq = seq
+
+        if len(payload) > 0:
+            if stream.nextSeq is None:
+                # the capture started after the handshake
+                stream.nextSeq = seq
+
+            # the peer stops talking, its pending data is a complete PDU
+            reverseStream = self.__streams.get(reverseKey)
+            if reverseStream is not None:
+                pdus.extend(self.__emit(reverseStream))
+
+            pdus.extend(self.__insert(stream, seq, payload, date, context))
+
+        if fin:
+            pdus.extend(self.__drain(stream))
+            stream.closed = True
+            reverseStream = self.__streams.get(reverseKey)
+            if reverseStream is None or reverseStream.closed:
+                self.__streams.pop(key, None)
+                self.__streams.pop(reverseKey, None)
+
+        return pdus
+
+    def flush(self):
+        """Emit all the data that remains in the buffers (including the
+        out-of-order segments still waiting for missing data) and reset
+        the state of the reassembler.
+
+        :return: the remaining PDUs sorted by date
+        :rtype: a list of tuple (date, data, context)
+        """
+        pdus = []
+        for stream in self.__streams.values():
+            pdus.extend(self.__drain(stream))
+        self.__streams.clear()
+        return sorted(pdus, key=lambda pdu: pdu[0])
+
+    def __closeStream(self, key):
+        """Drain and forget the specified direction of a connection."""
+        stream = self.__streams.pop(key, None)
+        if stream is None:
+            return []
+        return self.__drain(stream)
+
+    def __drain(self, stream):
+        """Emit the buffer of a stream and all its pending segments, skipping
+        the holes that will never be filled."""
+        pdus = self.__emit(stream)
+        while len(stream.pending) > 0:
+            stream.nextSeq = min(stream.pending,
+                                 key=lambda s: self.__offset(stream, s))
+            pdus.extend(self.__reorder(stream))
+            pdus.extend(self.__emit(stream))
+        return pdus
+
+    def __emit(self, stream):
+        """Emit the buffered data of a stream as a PDU."""
+        if len(stream.buffer) == 0:
+            return []
+        pdu = (stream.date, bytes(stream.buffer), stream.context)
+        stream.buffer = bytearray()
+        stream.date = None
+        stream.context = None
+        return [pdu]
+
+    def __offset(self, stream, seq):
+        """Distance from the next expected sequence number to seq, negative
+        if seq is before it."""
+        offset = (seq - stream.nextSeq) % self.SEQ_MODULO
+        if offset >= self.SEQ_HALF:
+            offset -= self.SEQ_MODULO
+        return offset
+
+    def __insert(self, stream, seq, payload, date, context):
+        """Insert the payload of a segment in a stream."""
+        offset = self.__offset(stream, seq)
+
+        if offset > 0:
+            # out-of-order segment, keep the largest payload seen for its seq
+            previous = stream.pending.get(seq)
+            if previous is None or len(previous[0]) < len(payload):
+                stream.pending[seq] = (payload, date, context)
+
+            if len(stream.pending) <= self.maxPendingSegments:
+                return []
+
+            # too many segments wait for missing data: skip the hole
+            self._logger.debug(
+                "Missing TCP data, resuming reassembly after the hole")
+            pdus = self.__emit(stream)
+            stream.nextSeq = min(stream.pending,
+                                 key=lambda s: self.__offset(stream, s))
+            pdus.extend(self.__reorder(stream))
+            return pdus
+
+        if -offset >= len(payload):
+            # retransmission of already received data
+            return []
+
+        pdus = self.__append(stream, payload[-offset:], date, context)
+        pdus.extend(self.__reorder(stream))
+        return pdus
+
+    def __reorder(self, stream):
+        """Append the pending segments that now follow the received data."""
+        pdus = []
+        found = True
+        while found and len(stream.pending) > 0:
+            found = False
+            for seq in list(stream.pending.keys()):
+                offset = self.__offset(stream, seq)
+                if offset > 0:
+                    continue
+                (payload, date, context) = stream.pending.pop(seq)
+                if -offset < len(payload):
+                    pdus.extend(
+                        self.__append(stream, payload[-offset:], date,
+                                      context))
+                found = True
+        return pdus
+
+    def __append(self, stream, payload, date, context):
+        """Append in-order data to the buffer of a stream."""
+        if len(stream.buffer) == 0:
+            stream.date = date
+            stream.context = context
+        stream.buffer.extend(payload)
+        stream.nextSeq = (stream.nextSeq + len(payload)) % self.SEQ_MODULO
+
+        if len(stream.buffer) >= self.maxBufferSize:
+            return self.__emit(stream)
+        return []
@@ -232,14 +232,12 @@ class CorrelationFinder(object):
         return result
 
     def _generateDataValues(self, cellsData):
-        result = []
-        for data in cellsData:
-            if len(data) > 0:
-                result.append(TypeConverter.convert(
-                    data[:8], Raw, Integer))  # We take only the first 8 octets
-            else:
-                result.append(0)
-        return result
+        # We take only the first 8 octets of the cells which are not empty
+        values = iter(
+            TypeConverter.convertColumn(
+                [data[:8] for data in cellsData if len(data) > 0], Raw,
+                Integer))
+        return [next(values) if len(data) > 0 else 0 for data in cellsData]
 
     def _generateSizeValues(self, cellsData):
         result = []
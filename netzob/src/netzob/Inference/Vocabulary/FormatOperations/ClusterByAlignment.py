@@ -46,6 +46,7 @@ from collections import OrderedDict
 from netzob.Common.Utils.Decorators import typeCheck, NetzobLogger
 from netzob.Model.Vocabulary.Symbol import Symbol
 from netzob.Model.Vocabulary.Messages.AbstractMessage import AbstractMessage
+from netzob.Common.Utils.TypedList import TypedList
 from netzob.Common.C_Extensions.WrapperArgsFactory import WrapperArgsFactory
 
 # +---------------------------------------------------------------------------+
@@ -162,7 +163,10 @@ class ClusterByAlignment(object):
                     format(str(m)))
 
         # We create one symbol for each message
-        initialSymbols = [Symbol(messages=[message]) for message in messages]
+        initialSymbols = [
+            Symbol(messages=TypedList._fromTrusted(AbstractMessage, [message]))
+            for message in messages
+        ]
 
         self._logger.debug("Computing the associated matrix")
 
@@ -255,9 +259,8 @@ class ClusterByAlignment(object):
             symbol2 = symbols.pop(i_maximum)
 
         # Merge the symbols i and j
-        messages = []
-        messages.extend(symbol1.messages)
-        messages.extend(symbol2.messages)
+        messages = TypedList._fromTrusted(AbstractMessage, symbol1.messages)
+        messages._extendTrusted(symbol2.messages)
 
         newSymbol = Symbol(messages=messages)
 
@@ -47,6 +47,8 @@ from netzob.Common.Utils.Decorators import typeCheck, NetzobLogger
 from netzob.Model.Vocabulary.AbstractField import AbstractField
 from netzob.Model.Vocabulary.Field import Field
 from netzob.Model.Vocabulary.Symbol import Symbol
+from netzob.Model.Vocabulary.Messages.AbstractMessage import AbstractMessage
+from netzob.Common.Utils.TypedList import TypedList
 from netzob.Model.Vocabulary.Types.TypeConverter import TypeConverter
 from netzob.Model.Vocabulary.Types.HexaString import HexaString
 from netzob.Model.Vocabulary.Types.ASCII import ASCII
@@ -142,7 +144,9 @@ class ClusterByKeyField(object):
                     symbolName = "Symbol_{0}".format(
                         keyFieldValue.decode("utf-8"))
                 newSymbols[keyFieldValue] = Symbol(
-                    name=symbolName, messages=[message])
+                    name=symbolName,
+                    messages=TypedList._fromTrusted(AbstractMessage,
+                                                    [message]))
                 splittedMessages = DataAlignment.align(
                     [message.data], field, encoded=False)
                 newSymbolsSplittedMessages[
@@ -232,10 +232,8 @@ class FieldSplitStatic(object):
 
         if field is None:
             raise TypeError("The field cannot be None")
-        fieldValues = [
-            TypeConverter.convert(data, Raw, HexaString)
-            for data in field.getValues(encoded=False)
-        ]
+        fieldValues = TypeConverter.convertColumn(
+            field.getValues(encoded=False), Raw, HexaString)
 
         if len(fieldValues) == 0:
             raise Exception("No value found in the field.")
@@ -310,8 +308,9 @@ class FieldSplitStatic(object):
         for (i, val) in enumerate(indexedValues):
             fName = "Field-{0}".format(i)
             fDomain = DomainFactory.normalizeDomain([
-                Raw(TypeConverter.convert(v, HexaString, BitArray))
-                for v in set(val)
+                Raw(v)
+                for v in TypeConverter.convertColumn(
+                    set(val), HexaString, BitArray)
             ])
             newFields.append(Field(domain=fDomain, name=fName))
 
@@ -396,20 +396,27 @@ class RelationFinder(object):
         return result
 
     def _generateDataValues(self, cellsData):
-        result = []
-        for data in cellsData:
+        result = [0] * len(cellsData)
+
+        # Cells are converted by groups of cells sharing the same unit size
+        cellsByUnitSize = dict()
+        for i, data in enumerate(cellsData):
             if len(data) > 0:
                 data = data[:8]  # We take at most 8 bytes
                 unitSize = int(AbstractType.UNITSIZE_8) * len(data)
                 unitSize = int(pow(2, math.ceil(math.log(
                     unitSize, 2))))  # Round to the nearest upper power of 2
-                result.append(
-                    Integer.encode(
-                        data,
-                        endianness=AbstractType.ENDIAN_BIG,
-                        unitSize=str(unitSize)))
-            else:
-                result.append(0)
+                cellsByUnitSize.setdefault(unitSize, []).append((i, data))
+
+        for unitSize, cells in cellsByUnitSize.items():
+            values = TypeConverter.convertColumn(
+                [data for (i, data) in cells],
+                Raw,
+                Integer,
+                dst_unitSize=str(unitSize),
+                dst_endianness=AbstractType.ENDIAN_BIG)
+            for (i, data), value in zip(cells, values):
+                result[i] = value
         return result
 
     def _generateSizeValues(self, cellsData):
@@ -34,7 +34,7 @@
 #+---------------------------------------------------------------------------+
 #| Standard library imports                                                  |
 #+---------------------------------------------------------------------------+
-import itertools
+import collections
 import multiprocessing
 
 #+---------------------------------------------------------------------------+
@@ -61,14 +61,12 @@ def _executeSearch(arg, **kwargs):
     a pool of threads.
     """
 
-    data = arg[0]
+    searchPlan = arg[0]
     message = arg[1]
-    addTags = arg[2]
-    dataLabels = arg[3]
+    dataLabels = arg[2]
 
     se = SearchEngine()
-    c = se.searchDataInMessage(
-        data, message, addTags=addTags, dataLabels=dataLabels)
+    c = se._searchWithPlan(searchPlan, message, dataLabels=dataLabels)
     return c
 
 
@@ -209,6 +207,9 @@ class SearchEngine(object):
         # Remove any duplicate data
         noDuplicateDatas = list(set(datas))
 
+        # The mutations of the data are computed once for all the messages
+        searchPlan = self._buildSearchPlan(noDuplicateDatas)
+
         results = SearchResults()
         if not inParallel:
             # Measure start time
@@ -216,8 +217,7 @@ class SearchEngine(object):
 
             for message in messages:
                 results.extend(
-                    self.searchDataInMessage(noDuplicateDatas, message,
-                                             addTags, dataLabels))
+                    self._searchWithPlan(searchPlan, message, dataLabels))
             # Measure end time
             # end = time.time()
 
@@ -237,9 +237,8 @@ class SearchEngine(object):
             pool.map_async(
                 _executeSearch,
                 list(
-                    zip([noDuplicateDatas] * len(messages), messages, [
-                        addTags
-                    ] * len(messages), [dataLabels] * len(messages))),
+                    zip([searchPlan] * len(messages), messages,
+                        [dataLabels] * len(messages))),
                 callback=self.__collectResults_cb)
 
             # Waits all alignment tasks finish
@@ -294,27 +293,9 @@ class SearchEngine(object):
         if message is None:
             raise TypeError("Message cannot be None")
 
-        searchTasks = []
-        for d in data:
-            # normalize the given data
-            normedData = AbstractType.normalize(d)
-
-            # build search tasks
-            props = dict()
-            props['message'] = message
-            props['data'] = d
-            if dataLabels is not None and d in list(dataLabels.keys()):
-                props['label'] = dataLabels[d]
-
-            searchTasks.extend(self.__buildSearchTasks(normedData, props))
-
-        # fetch the content of the message and convert it to bitarray
-        target = TypeConverter.convert(message.data, Raw, BitArray)
+        searchPlan = self._buildSearchPlan(data)
 
-        # Generate search cases
-        searchCases = itertools.product([target], searchTasks)
-
-        searchResults = self.__search(searchCases)
+        searchResults = self._searchWithPlan(searchPlan, message, dataLabels)
 
         # If requested, we tag the results in the message using visualization functions
         # if addTags:
@@ -324,55 +305,105 @@ class SearchEngine(object):
         #             message.visualizationFunctions.append(HighlightFunction(startPos, endPos))
         return searchResults
 
-    def __search(self, searchCases):
-        """Execute the different search cases and build
-        search results that will be returned.
+    @typeCheck(list)
+    def _buildSearchPlan(self, datas):
+        """Computes the encoding mutations of the specified data and
+        gathers them by searched pattern. A pattern produced by several
+        mutations, of the same data or of different data, is then only
+        searched once in each message.
+
+        >>> from netzob.all import *
+        >>> se = SearchEngine()
+        >>> (mutations, patterns) = se._buildSearchPlan([ASCII("netzob"), Raw(b"netzob"), ASCII("NETZOB")])
+        >>> len(mutations)
+        18
+        >>> len(patterns) < len(mutations)
+        True
+
+        :parameter datas: the data from which the mutations are computed
+        :type datas: a list of :class:`netzob.Model.Vocabulary.Types.AbstractType.AbstractType`
+        :return: the list of mutations (data, description, pattern key) and the dict of patterns indexed by their key
+        :rtype: a :class:`tuple`
+        """
+        mutations = []
+        patterns = collections.OrderedDict()
 
-        :parameter searchCases: an iterable of tupple (bitarray, :class:`netzob.Inference.Vocabulary.Search.SearchTask.SearchTask`)
-        :type searchCases: a list
+        # Mutations computed for each (type, value)
+        typeMutations = dict()
+
+        for data in datas:
+            # normalize the given data
+            normedData = AbstractType.normalize(data)
+
+            # data without value generate random mutations, so they
+            # cannot be shared
+            if normedData.value is None:
+                key = None
+                dataMutations = None
+            else:
+                key = (normedData.__class__, normedData.value.to01(),
+                       normedData.unitSize, normedData.endianness,
+                       normedData.sign)
+                dataMutations = typeMutations.get(key)
+
+            if dataMutations is None:
+                dataMutations = []
+                for mutationType, mutation in normedData.mutate().items():
+                    patternKey = mutation.to01()
+                    if patternKey not in patterns:
+                        patterns[patternKey] = mutation
+                    dataMutations.append((mutationType, patternKey))
+                if key is not None:
+                    typeMutations[key] = dataMutations
+
+            for mutationType, patternKey in dataMutations:
+                mutations.append((data, mutationType, patternKey))
+
+        return (mutations, patterns)
+
+    def _searchWithPlan(self, searchPlan, message, dataLabels=None):
+        """Searches each pattern of the search plan in the specified
+        message and builds a search result for each mutation found.
+
+        :parameter searchPlan: the search plan, as computed by :meth:`_buildSearchPlan`
+        :type searchPlan: a :class:`tuple`
+        :parameter message: the message in which the search will take place
+        :type message: :class:`netzob.Model.Vocabulary.Messages.AbstractMessage`
+        :keyword dataLabels: an optionnal dict to attach to each data a label to simplify search results identification
+        :type dataLabels: dict
         :return: the obtained results
         :rtype: a list of :class:`netzob.Inference.Vocabulary.Search.SearchResult.SearchResult`
-
         """
-        if searchCases is None:
-            raise TypeError("There should be at least one search case.")
+        (mutations, patterns) = searchPlan
 
-        results = SearchResults()
-        for (target, searchTask) in searchCases:
-            if target is None or not isinstance(
-                    target, bitarray) or searchTask is None or not isinstance(
-                        searchTask, SearchTask):
-                raise TypeError(
-                    "Each search case must a tupple made of a bitarray and a SearchTask instance"
-                )
+        # fetch the content of the message and convert it to bitarray
+        target = TypeConverter.convert(message.data, Raw, BitArray)
 
+        patternsRanges = dict()
+        for patternKey, pattern in patterns.items():
             ranges = []
-            for startIndex in target.search(searchTask.data):
-                self._logger.debug("Search found {}: {}>{}".format(
-                    searchTask.data, startIndex, len(searchTask.data)))
-                ranges.append((startIndex, startIndex + len(searchTask.data)))
-
+            for startIndex in target.search(pattern):
+                self._logger.debug("Search found %s: %s>%s", pattern,
+                                   startIndex, len(pattern))
+                ranges.append((startIndex, startIndex + len(pattern)))
             if len(ranges) > 0:
-                results.append(SearchResult(target, searchTask, ranges))
+                patternsRanges[patternKey] = ranges
 
-        return results
+        results = SearchResults()
+        for (data, mutationType, patternKey) in mutations:
+            ranges = patternsRanges.get(patternKey)
+            if ranges is None:
+                continue
 
-    @typeCheck(AbstractType, dict)
-    def __buildSearchTasks(self, data, properties=None):
-        """Builds a search tasks for each possible encoding mutations of the
-        specified data.
-
-        :parameter data: the data from wich it must create search tasks
-        :type data: :class:`netzob.Model.Vocabulary.Types.AbstractType.AbstractType`
-        :keyword properties: a dict of properties {name, value} to attach to each built searchTask
-        :type properties: a dict
-        :return: a list of search tasks
-        :rtype: a :class:`list` of :class:`netzob.Inference.Vocabulary.SearchEngine.SearchTask.SearchTask`
-        """
-        if data is None:
-            raise TypeError("The data cannot be None")
+            # build search tasks
+            props = dict()
+            props['message'] = message
+            props['data'] = data
+            if dataLabels is not None and data in list(dataLabels.keys()):
+                props['label'] = dataLabels[data]
 
-        return [
-            SearchTask(mutation, mutationType, properties=properties)
-            for mutationType, mutation in list(data.mutate().items())
-        ]
+            searchTask = SearchTask(
+                patterns[patternKey], mutationType, properties=props)
+            results.append(SearchResult(target, searchTask, list(ranges)))
+
+        return results
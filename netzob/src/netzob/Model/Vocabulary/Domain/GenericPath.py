@@ -82,6 +82,10 @@ class GenericPath(object):
         else:
             self._dataAssignedToVariable = dataAssignedToVariable
 
+        # the assigned data and the callbacks can be shared with
+        # duplicated paths until one of them modifies them
+        self._sharedData = False
+
     def addResult(self, variable, result):
         """This method can be use to register the bitarray obtained after having parsed a variable
 
@@ -162,6 +166,7 @@ class GenericPath(object):
         if field is None:
             raise Exception("Field cannot be None")
 
+        self._unshareData()
         self._dataAssignedToField[field.id] = data
 
     def isDataAvailableForField(self, field):
@@ -191,6 +196,7 @@ class GenericPath(object):
 
         if field is None:
             raise Exception("Field cannot be None")
+        self._unshareData()
         del self._dataAssignedToField[field.id]
 
     @typeCheck(AbstractVariable)
@@ -229,6 +235,7 @@ class GenericPath(object):
         if variable is None:
             raise Exception("Variable cannot be None")
 
+        self._unshareData()
         self._dataAssignedToVariable[variable.id] = data
 
     @typeCheck(AbstractVariable)
@@ -236,6 +243,7 @@ class GenericPath(object):
         if variable is None:
             raise Exception("Variable cannot be None")
 
+        self._unshareData()
         del self._dataAssignedToVariable[variable.id]
 
     def registerFieldCallBack(self, fields, variable, parsingCB=True):
@@ -248,10 +256,12 @@ class GenericPath(object):
             raise Exception(
                 "At least one field must be defined in the callback")
 
+        self._unshareData()
         self._fieldsCallbacks.append((fields, variable, parsingCB))
 
     def _triggerFieldCallbacks(self, field):
 
+        self._unshareData()
         moreCallBackFound = True
 
         # Try n-times to trigger callbacks as there can have deadlocks
@@ -293,6 +303,26 @@ class GenericPath(object):
                 self._fieldsCallbacks.remove(callBackToExecute)
         return True
 
+    def _shareDataWith(self, path):
+        """Makes the specified path use the assigned data and the callbacks
+        of the current path. They are copied by the first of both paths
+        that modifies them. The assigned data must not be modified in
+        place."""
+        path._dataAssignedToField = self._dataAssignedToField
+        path._dataAssignedToVariable = self._dataAssignedToVariable
+        path._fieldsCallbacks = self._fieldsCallbacks
+        path._sharedData = True
+        self._sharedData = True
+
+    def _unshareData(self):
+        """Copies the assigned data and the callbacks if they are shared
+        with another path"""
+        if self._sharedData:
+            self._dataAssignedToField = dict(self._dataAssignedToField)
+            self._dataAssignedToVariable = dict(self._dataAssignedToVariable)
+            self._fieldsCallbacks = list(self._fieldsCallbacks)
+            self._sharedData = False
+
     @property
     def name(self):
         """Returns the name of the path (mostly for debug purposes)"""
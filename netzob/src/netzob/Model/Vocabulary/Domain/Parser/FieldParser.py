@@ -178,9 +178,12 @@ class FieldParser():
 
     """
 
-    def __init__(self, field, lastField=False):
+    def __init__(self, field, lastField=False, reservedSize=0):
         self.field = field
         self.lastField = lastField
+        # size of the data needed by the following fields, it cannot be
+        # consumed by the field
+        self.reservedSize = reservedSize
 
     @typeCheck(ParsingPath)
     def parse(self, parsingPath):
@@ -201,11 +204,17 @@ class FieldParser():
         # check we have something to parse
         data = parsingPath.getDataAssignedToField(self.field)
 
-        self._logger.debug("Parses '{0}' with field '{1}' specifications".
-                           format(data, self.field.name))
+        self._logger.debug("Parses '%s' with field '%s' specifications",
+                           data, self.field.name)
 
-        # we assign this data to the field's variable
-        parsingPath.assignDataToVariable(data.copy(), self.field.domain)
+        # the data needed by the following fields is not given to the
+        # field's variable
+        if self.reservedSize > 0:
+            data = data[:max(0, len(data) - self.reservedSize)]
+
+        # we assign this data to the field's variable, parsed data are
+        # never modified in place so it can be shared
+        parsingPath.assignDataToVariable(data, self.field.domain)
 
         # we create a first VariableParser and uses it to parse the domain
         variableParser = VariableParser(domain)
@@ -221,8 +230,7 @@ class FieldParser():
                     yield resultParsingPath
                 except Exception as e:
                     self._logger.debug(
-                        "An error occurred while parsing variable : {}".format(
-                            e))
+                        "An error occurred while parsing variable : %s", e)
 
     @property
     def field(self):
@@ -184,29 +184,33 @@ class FlowParser(object):
         data_to_parse_raw = message.data
         data_to_parse_bitarray = TypeConverter.convert(data_to_parse_raw, Raw,
                                                        BitArray)
+        # the symbols are compiled once for all the parsed parts of the flow
+        plans = [MessageParser.compile(symbol) for symbol in symbols]
+
         for result in self._parseFlow_internal(data_to_parse_bitarray, symbols,
-                                               self.memory):
+                                               self.memory, plans):
             return result
 
         raise InvalidParsingPathException(
             "No parsing path returned while parsing {}".format(
                 repr(data_to_parse_raw)))
 
-    def _parseFlow_internal(self, data_to_parse_bitarray, symbols, memory):
+    def _parseFlow_internal(self, data_to_parse_bitarray, symbols, memory,
+                            plans):
         """Parses the specified data"""
 
         if data_to_parse_bitarray is None or len(data_to_parse_bitarray) == 0:
             raise Exception("Nothing to parse")
 
-        for symbol in symbols:
-            self._logger.debug("Parsing '{}' with Symbol '{}'".format(
-                data_to_parse_bitarray, symbol.name))
+        for symbol, plan in zip(symbols, plans):
+            self._logger.debug("Parsing '%s' with Symbol '%s'",
+                               data_to_parse_bitarray, symbol.name)
             flow_parsing_results = []
             try:
                 mp = MessageParser(memory=memory)
                 results = mp.parseBitarray(
-                    data_to_parse_bitarray.copy(),
-                    symbol.getLeafFields(),
+                    data_to_parse_bitarray,
+                    plan,
                     must_consume_everything=False)
 
                 for parse_result in results:
@@ -218,12 +222,12 @@ class FlowParser(object):
 
                     if len(remainings_bitarray) > 0:
                         self._logger.debug(
-                            "Try to parse the remaining data '{}' with another symbol".
-                            format(remainings_bitarray))
+                            "Try to parse the remaining data '%s' with another symbol",
+                            remainings_bitarray)
                         try:
                             child_flow_parsings = self._parseFlow_internal(
                                 remainings_bitarray, symbols,
-                                memory.duplicate())
+                                memory.duplicate(), plans)
                             for child_flow_parsing in child_flow_parsings:
                                 flow_parsing_results = [(symbol, parse_result)
                                                         ] + child_flow_parsing
@@ -41,13 +41,14 @@
 # +---------------------------------------------------------------------------+
 from netzob.Common.Utils.Decorators import typeCheck, NetzobLogger
 from netzob.Model.Vocabulary.Domain.Variables.Memory import Memory
+from netzob.Model.Vocabulary.Domain.Variables.SVAS import SVAS
 from netzob.Model.Vocabulary.Messages.AbstractMessage import AbstractMessage
 from netzob.Model.Vocabulary.Symbol import Symbol
 from netzob.Model.Vocabulary.Domain.Parser.ParsingPath import ParsingPath
 from netzob.Model.Vocabulary.Types.TypeConverter import TypeConverter
 from netzob.Model.Vocabulary.Types.BitArray import BitArray
 from netzob.Model.Vocabulary.Types.Raw import Raw
-from netzob.Model.Vocabulary.Domain.Parser.FieldParser import FieldParser
+from netzob.Model.Vocabulary.Domain.Parser.ParsingPlan import ParsingPlan
 
 
 class InvalidParsingPathException(Exception):
@@ -184,6 +185,32 @@ class MessageParser(object):
         fields = symbol.getLeafFields()
         return next(self.parseRaw(dataToParse, fields))
 
+    @staticmethod
+    def compile(fields):
+        """Computes the parsing plan of the specified fields (or of the
+        leaf fields of the specified symbol). The plan can be given to
+        :meth:`parseRaw` and :meth:`parseBitarray` in place of the fields
+        to parse many messages without walking the fields again.
+
+        >>> from netzob.all import *
+        >>> s = Symbol(fields=[Field(ASCII(nbChars=(1, 10))), Field("!")])
+        >>> plan = MessageParser.compile(s)
+        >>> for data in [b"hello!", b"netzob!"]:
+        ...     print(next(MessageParser().parseRaw(data, plan)))
+        [bitarray('0110100001100101011011000110110001101111'), bitarray('00100001')]
+        [bitarray('011011100110010101110100011110100110111101100010'), bitarray('00100001')]
+
+        :param fields: the fields, or the symbol, used to parse messages
+        :type fields: a :class:`list` of :class:`netzob.Model.Vocabulary.Field.Field` or a :class:`netzob.Model.Vocabulary.Symbol.Symbol`
+        :return: the parsing plan
+        :rtype: :class:`netzob.Model.Vocabulary.Domain.Parser.ParsingPlan.ParsingPlan`
+        """
+        if isinstance(fields, ParsingPlan):
+            return fields
+        if isinstance(fields, Symbol):
+            fields = fields.getLeafFields()
+        return ParsingPlan(fields)
+
     @typeCheck(object)
     def parseRaw(self, dataToParse, fields):
         """This method parses the specified raw against the specification of the provided symbol."""
@@ -191,7 +218,7 @@ class MessageParser(object):
             raise Exception("Specified data to parse is empty (or None)")
         if fields is None:
             raise Exception("Specified fields is None")
-        if len(fields) == 0:
+        if not isinstance(fields, ParsingPlan) and len(fields) == 0:
             raise Exception("No field specified")
 
         bitArrayToParse = TypeConverter.convert(dataToParse, Raw, BitArray)
@@ -203,32 +230,48 @@ class MessageParser(object):
                       fields,
                       must_consume_everything=True):
         """This method parses the specified bitarray according to the specification of
-        the specified fields.
+        the specified fields (or of their parsing plan).
 
         It returns an iterator over all the valid parsing path that can be found.
         
         """
 
-        self._logger.debug(
-            "New parsing method executed on {}".format(bitArrayToParse))
+        self._logger.debug("New parsing method executed on %s",
+                           bitArrayToParse)
+
+        plan = MessageParser.compile(fields)
+
+        if self._acceptsFixedLayout(plan, must_consume_everything):
+            result = self._parseFixedLayout(bitArrayToParse, plan,
+                                            must_consume_everything)
+            if result is not None:
+                yield result
+            raise InvalidParsingPathException(
+                "No parsing path returned while parsing '{}'".format(
+                    TypeConverter.convert(bitArrayToParse, BitArray, Raw)))
 
         # building a new parsing path
-        currentParsingPath = ParsingPath(bitArrayToParse.copy(),
+        currentParsingPath = ParsingPath(bitArrayToParse,
                                          self.memory.duplicate())
-        currentParsingPath.assignDataToField(bitArrayToParse.copy(), fields[0])
+        currentParsingPath.assignDataToField(bitArrayToParse, plan.fields[0])
 
         # field iterator
         i_current_field = 0
 
-        parsingResults = self._parseBitArrayWithField(
-            currentParsingPath,
-            fields,
-            i_current_field,
-            must_consume_everything=must_consume_everything)
+        if plan.acceptsRemainingSize(i_current_field,
+                                     len(bitArrayToParse),
+                                     must_consume_everything):
+            parsingResults = self._parseBitArrayWithField(
+                currentParsingPath,
+                plan,
+                i_current_field,
+                must_consume_everything=must_consume_everything)
+        else:
+            parsingResults = []
 
         for parsingResult in parsingResults:
             result = []
-            for field in fields:
+            for field in plan.fields:
                 result.append(parsingResult.getDataAssignedToField(field))
 
             self.memory = parsingResult.memory
@@ -239,56 +282,137 @@ class MessageParser(object):
             "No parsing path returned while parsing '{}'".format(
                 TypeConverter.convert(bitArrayToParse, BitArray, Raw)))
 
+    def _acceptsFixedLayout(self, plan, must_consume_everything=True):
+        """Computes if the messages can be parsed by slicing them at the
+        offsets of the plan's fields: a last field of variable size
+        must consume the end of the message and constant fields must not
+        have a value in memory."""
+        if not plan.fixedLayout:
+            return False
+        (lastMinSize, lastMaxSize) = plan.fieldSizes[-1]
+        if not must_consume_everything and lastMinSize != lastMaxSize:
+            return False
+        for field, canParse in zip(plan.fields, plan.fieldValidators):
+            if canParse is None and self.memory.hasValue(field.domain):
+                return False
+        return True
+
+    def _parseFixedLayout(self,
+                          bitArrayToParse,
+                          plan,
+                          must_consume_everything=True):
+        """Parses the specified bitarray by slicing it at the offsets of the
+        plan's fields. It returns the data of each field or None if the
+        bitarray cannot be parsed.
+
+        >>> from netzob.all import *
+        >>> f0 = Field(Integer(unitSize=AbstractType.UNITSIZE_8), name="F0")
+        >>> f1 = Field(":", name="F1")
+        >>> f2 = Field(ASCII(nbChars=(1, 10)), name="F2")
+        >>> f0.domain.svas = SVAS.EPHEMERAL
+        >>> plan = MessageParser.compile([f0, f1, f2])
+        >>> mp = MessageParser()
+        >>> data = TypeConverter.convert(b"\\x05:netzob", Raw, BitArray)
+        >>> print(mp._parseFixedLayout(data, plan))
+        [bitarray('00000101'), bitarray('00111010'), bitarray('011011100110010101110100011110100110111101100010')]
+        >>> print(mp.memory.getValue(f0.domain))
+        bitarray('00000101')
+        >>> data = TypeConverter.convert(b"\\x05;netzob", Raw, BitArray)
+        >>> print(mp._parseFixedLayout(data, plan))
+        None
+        """
+        if not plan.acceptsRemainingSize(0,
+                                         len(bitArrayToParse),
+                                         must_consume_everything):
+            return None
+
+        memory = self.memory.duplicate()
+        result = []
+        for i_field, field in enumerate(plan.fields):
+            variable = field.domain
+            start = plan.fixedPrefixOffsets[i_field]
+            if must_consume_everything and i_field == len(plan.fields) - 1:
+                end = len(bitArrayToParse)
+            else:
+                end = start + plan.fieldSizes[i_field][0]
+            value = bitArrayToParse[start:end]
+
+            canParse = plan.fieldValidators[i_field]
+            if canParse is None:
+                if value != variable.currentValue:
+                    return None
+            elif len(value) > 0 and not canParse(value):
+                # empty data deals with 'optional' data
+                return None
+
+            if variable.svas == SVAS.EPHEMERAL:
+                memory.memorize(variable, value)
+            result.append(value)
+
+        self.memory = memory
+        return result
+
     def _parseBitArrayWithField(self,
                                 parsingPath,
-                                fields,
+                                plan,
                                 i_current_field,
                                 must_consume_everything=True):
         self._logger.debug(
-            "_parseBitArrayWithField executed for field {} with path : {}".
-            format(i_current_field, parsingPath))
+            "_parseBitArrayWithField executed for field %s with path : %s",
+            i_current_field, parsingPath)
+        fields = plan.fields
         currentField = fields[i_current_field]
 
         carnivorous_parsing = (i_current_field == len(fields) - 1)
         if must_consume_everything is False:
             carnivorous_parsing = False
 
-        fp = FieldParser(currentField, carnivorous_parsing)
+        if carnivorous_parsing:
+            fp = plan.lastFieldParser
+        else:
+            fp = plan.fieldParsers[i_current_field]
         value_before_parsing = parsingPath.getDataAssignedToField(
-            currentField).copy()
+            currentField)
 
         for newParsingPath in fp.parse(parsingPath):
 
             try:
                 value_after_parsing = newParsingPath.getDataAssignedToField(
                     currentField)
-                remainingValue = value_before_parsing[len(
-                    value_after_parsing):].copy()
+                remainingSize = len(value_before_parsing) - len(
+                    value_after_parsing)
 
                 if i_current_field < len(fields) - 1:
+                    # the following fields cannot parse the remaining data
+                    if not plan.acceptsRemainingSize(
+                            i_current_field + 1,
+                            remainingSize, must_consume_everything):
+                        continue
+
+                    # the remaining data is only sliced for the kept paths
                     newParsingPath.assignDataToField(
-                        remainingValue, fields[i_current_field + 1])
+                        value_before_parsing[len(value_after_parsing):],
+                        fields[i_current_field + 1])
 
                     if must_consume_everything is False:
                         generator = self._parseBitArrayWithField(
                             newParsingPath,
-                            fields,
+                            plan,
                             i_current_field + 1,
                             must_consume_everything=False)
                     else:
                         generator = self._parseBitArrayWithField(
-                            newParsingPath, fields, i_current_field + 1)
+                            newParsingPath, plan, i_current_field + 1)
                     for x in generator:
                         yield x
 
-                elif not must_consume_everything and len(remainingValue) >= 0:
+                elif not must_consume_everything and remainingSize >= 0:
                     yield newParsingPath
-                elif len(remainingValue) == 0:
+                elif remainingSize == 0:
                     # valid parsing path must consume everything
                     yield newParsingPath
 
             except InvalidParsingPathException:
                 pass
 
-        raise StopIteration()
         # InvalidParsingPathException("No parsing path returned while parsing '{}'".format(TypeConverter.convert(value_before_parsing, BitArray, Raw)))
@@ -64,7 +64,9 @@ class ParsingPath(GenericPath):
             dataAssignedToField=dataAssignedToField,
             dataAssignedToVariable=dataAssignedToVariable,
             fieldsCallbacks=fieldsCallbacks)
-        self.originalDataToParse = dataToParse.copy()
+        # the data to parse is never modified, so it is shared by the
+        # duplicated paths
+        self.originalDataToParse = dataToParse
         if ok is None:
             self.__ok = True
         else:
@@ -85,28 +87,33 @@ class ParsingPath(GenericPath):
             if parsedMessage is None:
                 parsedMessage = self.getDataAssignedToField(field).copy()
             else:
-                parsedMessage += self.getDataAssignedToField(field).copy()
+                parsedMessage += self.getDataAssignedToField(field)
 
         return parsedMessage == bitArrayMessage
 
     def duplicate(self):
-        dField = {}
-        for key, value in list(self._dataAssignedToField.items()):
-            dField[key] = value.copy()
-
-        dVariable = {}
-        for key, value in list(self._dataAssignedToVariable.items()):
-            dVariable[key] = value.copy()
-
-        fCall = [x for x in self._fieldsCallbacks]
-
+        """Duplicates the parsing path. Parsed data are never modified in
+        place, so the new path shares the assigned data and the memory of
+        the current one: they are only copied when one of both paths
+        modifies them.
+
+        >>> from netzob.all import *
+        >>> f0 = Field(ASCII("a"))
+        >>> f1 = Field(ASCII("b"))
+        >>> path = ParsingPath(bitarray('0'), Memory())
+        >>> path.assignDataToField(bitarray('0'), f0)
+        >>> newPath = path.duplicate()
+        >>> newPath.assignDataToField(bitarray('1'), f1)
+        >>> newPath.getDataAssignedToField(f0) is path.getDataAssignedToField(f0)
+        True
+        >>> path.isDataAvailableForField(f1)
+        False
+        """
         result = ParsingPath(
             self.originalDataToParse,
-            memory=self.memory.duplicate(),
-            dataAssignedToField=dField,
-            dataAssignedToVariable=dVariable,
-            fieldsCallbacks=fCall,
+            memory=self.memory.duplicate(copyValues=False),
             ok=self.ok())
+        self._shareDataWith(result)
 
         return result
 
@@ -0,0 +1,271 @@
+#-*- coding: utf-8 -*-
+
+#+---------------------------------------------------------------------------+
+#|          01001110 01100101 01110100 01111010 01101111 01100010            |
+#|                                                                           |
+#|               Netzob : Inferring communication protocols                  |
+#+---------------------------------------------------------------------------+
+#| Copyright (C) 2011-2017 Georges Bossert and Frédéric Guihéry              |
+#| This program is free software: you can redistribute it and/or modify      |
+#| it under the terms of the GNU General Public License as published by      |
+#| the Free Software Foundation, either version 3 of the License, or         |
+#| (at your option) any later version.                                       |
+#|                                                                           |
+#| This program is distributed in the hope that it will be useful,           |
+#| but WITHOUT ANY WARRANTY; without even the implied warranty of            |
+#| MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the              |
+#| GNU General Public License for more details.                              |
+#|                                                                           |
+#| You should have received a copy of the GNU General Public License         |
+#| along with this program. If not, see <http://www.gnu.org/licenses/>.      |
+#+---------------------------------------------------------------------------+
+#| @url      : http://www.netzob.org                                         |
+#| @contact  : contact@netzob.org                                            |
+#| @sponsors : Amossys, http://www.amossys.fr                                |
+#|             Supélec, http://www.rennes.supelec.fr/ren/rd/cidre/           |
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| File contributors :                                                       |
+#|       - Georges Bossert <georges.bossert (a) supelec.fr>                  |
+#|       - Frédéric Guihéry <frederic.guihery (a) amossys.fr>                |
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| Standard library imports                                                  |
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| Related third party imports                                               |
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| Local application imports                                                 |
+#+---------------------------------------------------------------------------+
+from netzob.Common.Utils.Decorators import NetzobLogger
+from netzob.Model.Vocabulary.Domain.Variables.SVAS import SVAS
+from netzob.Model.Vocabulary.Domain.Parser.FieldParser import FieldParser
+
+
+@NetzobLogger
+class ParsingPlan(object):
+    """A parsing plan gathers what the message parser needs to know
+    about a list of fields before parsing messages with them: the
+    field parsers and the minimum and maximum sizes of the data each
+    field and its followers can consume. It is computed once and can
+    be reused to parse any number of messages.
+
+    >>> from netzob.all import *
+    >>> f0 = Field(Integer(unitSize=AbstractType.UNITSIZE_16), name="F0")
+    >>> f1 = Field(ASCII(nbChars=(2, 5)), name="F1")
+    >>> f2 = Field(";", name="F2")
+    >>> plan = ParsingPlan([f0, f1, f2])
+    >>> plan.fieldSizes
+    [(16, 16), (16, 40), (8, 8)]
+    >>> plan.minRemainingSizes
+    [40, 24, 8, 0]
+    >>> plan.maxRemainingSizes
+    [64, 48, 8, 0]
+    >>> plan.fixedPrefixOffsets
+    [0, 16]
+    >>> plan.fixedLayout
+    False
+
+    Symbols with a fixed layout, that is made only of data fields
+    of a fixed size except for the last one, are parsed by slicing the
+    messages at the known offsets of the fields. Other symbols are
+    parsed by exploring every possible parsing path.
+
+    >>> ParsingPlan([f0, f2, f1]).fixedLayout
+    True
+    >>> ParsingPlan([f1, f2]).fixedLayout
+    False
+    >>> ParsingPlan([f0, Field(Size(f2))]).fixedLayout
+    False
+
+    The plan can be given to the message parser in place of the fields.
+
+    >>> mp = MessageParser()
+    >>> print(next(mp.parseRaw(b"\\x00\\x01abc;", plan)))
+    [bitarray('0000000000000001'), bitarray('011000010110001001100011'), bitarray('00111011')]
+
+    :param fields: the fields the messages will be parsed with
+    :type fields: a :class:`list` of :class:`netzob.Model.Vocabulary.Field.Field`
+    """
+
+    def __init__(self, fields):
+        if fields is None:
+            raise Exception("Specified fields is None")
+        if len(fields) == 0:
+            raise Exception("No field specified")
+
+        self.fields = list(fields)
+
+        # (min, max) sizes in bits of each field, max is None if unknown
+        self.fieldSizes = [
+            ParsingPlan.computeSizeBounds(field.domain)
+            for field in self.fields
+        ]
+
+        # (min, max) sizes of the data left for the fields starting at
+        # each position
+        self.minRemainingSizes = [0]
+        self.maxRemainingSizes = [0]
+        for (minSize, maxSize) in reversed(self.fieldSizes):
+            self.minRemainingSizes.insert(0,
+                                          minSize + self.minRemainingSizes[0])
+            if maxSize is None or self.maxRemainingSizes[0] is None:
+                self.maxRemainingSizes.insert(0, None)
+            else:
+                self.maxRemainingSizes.insert(
+                    0, maxSize + self.maxRemainingSizes[0])
+
+        # parsers of the fields, the last field can be parsed carnivorously
+        self.fieldParsers = [
+            FieldParser(
+                field,
+                reservedSize=self.__computeReservedSize(i_field))
+            for (i_field, field) in enumerate(self.fields)
+        ]
+        self.lastFieldParser = FieldParser(self.fields[-1], True)
+
+        # offsets of the fields which only follow fixed-size fields
+        self.fixedPrefixOffsets = [0]
+        for (minSize, maxSize) in self.fieldSizes[:-1]:
+            if minSize != maxSize:
+                break
+            self.fixedPrefixOffsets.append(self.fixedPrefixOffsets[-1] +
+                                           minSize)
+
+        # validators of the data fields, None for constant ones
+        self.fieldValidators = self.__buildFieldValidators()
+        self.fixedLayout = (
+            self.fieldValidators is not None and
+            len(self.fixedPrefixOffsets) == len(self.fields))
+
+    def acceptsRemainingSize(self, i_field, size, must_consume_everything=True):
+        """Computes if data of the specified size can be parsed by the
+        fields starting at the specified position.
+
+        >>> from netzob.all import *
+        >>> plan = ParsingPlan([Field(ASCII(nbChars=(2, 5))), Field(";")])
+        >>> plan.acceptsRemainingSize(0, 16)
+        False
+        >>> plan.acceptsRemainingSize(0, 24)
+        True
+        >>> plan.acceptsRemainingSize(0, 56)
+        False
+        >>> plan.acceptsRemainingSize(0, 56, must_consume_everything=False)
+        True
+        """
+        if size < self.minRemainingSizes[i_field]:
+            return False
+        if not must_consume_everything:
+            return True
+        maxSize = self.maxRemainingSizes[i_field]
+        return maxSize is None or size <= maxSize
+
+    def __computeReservedSize(self, i_field):
+        """Computes the size of the data a data field cannot consume as it
+        is needed by the following fields. Other fields are given all the
+        remaining data as their relations may need to look beyond their
+        own value."""
+        from netzob.Model.Vocabulary.Domain.Variables.Leafs.Data import Data
+
+        if not isinstance(self.fields[i_field].domain, Data):
+            return 0
+        return self.minRemainingSizes[i_field + 1]
+
+    def __buildFieldValidators(self):
+        """Builds the functions validating the data of each field if all
+        the fields are data that can be parsed without exploring several
+        parsing paths. Returns None otherwise."""
+        from netzob.Model.Vocabulary.Domain.Variables.Leafs.Data import Data
+
+        validators = []
+        for field in self.fields:
+            variable = field.domain
+            if not isinstance(variable, Data):
+                return None
+            if variable.svas == SVAS.CONSTANT:
+                if variable.currentValue is None:
+                    return None
+                validators.append(None)
+            elif variable.svas in (SVAS.EPHEMERAL, SVAS.VOLATILE):
+                validators.append(variable.dataType.buildCanParse())
+            else:
+                # persistent data are parsed according to the memory
+                return None
+        return validators
+
+    @staticmethod
+    def computeSizeBounds(variable):
+        """Computes the minimum and maximum sizes in bits of the data the
+        specified variable can consume while parsing. The maximum size is
+        None if it cannot be known before parsing.
+
+        >>> from netzob.all import *
+        >>> ParsingPlan.computeSizeBounds(Data(Raw(nbBytes=(1, 3))))
+        (8, 24)
+        >>> ParsingPlan.computeSizeBounds(Agg([ASCII("a"), Raw(nbBytes=(1, 3))]))
+        (16, 32)
+        >>> ParsingPlan.computeSizeBounds(Alt([ASCII("a"), ASCII("bcd")]))
+        (8, 24)
+        >>> ParsingPlan.computeSizeBounds(Repeat(ASCII("a"), nbRepeat=(1, 3)))
+        (0, None)
+
+        :param variable: the variable
+        :type variable: :class:`netzob.Model.Vocabulary.Domain.Variables.AbstractVariable.AbstractVariable`
+        :return: the minimum and maximum sizes
+        :rtype: a :class:`tuple`
+        """
+        from netzob.Model.Vocabulary.Domain.Variables.Leafs.Data import Data
+        from netzob.Model.Vocabulary.Domain.Variables.Leafs.Size import Size
+        from netzob.Model.Vocabulary.Domain.Variables.Leafs.InternetChecksum import InternetChecksum
+        from netzob.Model.Vocabulary.Domain.Variables.Nodes.Agg import Agg
+        from netzob.Model.Vocabulary.Domain.Variables.Nodes.Alt import Alt
+
+        if isinstance(variable, Data):
+            if variable.svas == SVAS.CONSTANT:
+                # constant data can only be parsed with their value
+                if variable.currentValue is None:
+                    return (0, None)
+                return (len(variable.currentValue),
+                        len(variable.currentValue))
+            if variable.svas == SVAS.PERSISTENT:
+                # persistent data can be parsed with a memorized value
+                return (0, None)
+            (minSize, maxSize) = variable.dataType.size
+            if minSize is None:
+                minSize = 0
+            return (minSize, maxSize)
+        elif isinstance(variable, (Size, InternetChecksum)):
+            # relations can consume less data than their size while their
+            # value cannot be computed
+            return (0, variable.dataType.size[1])
+        elif isinstance(variable, Agg):
+            minSize = 0
+            maxSize = 0
+            for child in variable.children:
+                (childMinSize,
+                 childMaxSize) = ParsingPlan.computeSizeBounds(child)
+                minSize += childMinSize
+                if maxSize is not None and childMaxSize is not None:
+                    maxSize += childMaxSize
+                else:
+                    maxSize = None
+            return (minSize, maxSize)
+        elif isinstance(variable, Alt):
+            bounds = [
+                ParsingPlan.computeSizeBounds(child)
+                for child in variable.children
+            ]
+            if len(bounds) == 0:
+                return (0, None)
+            minSize = min(childMinSize for (childMinSize, _) in bounds)
+            if any(childMaxSize is None for (_, childMaxSize) in bounds):
+                return (minSize, None)
+            return (minSize, max(childMaxSize for (_, childMaxSize) in bounds))
+
+        # the size of other variables depends on the parsed data
+        return (0, None)
@@ -128,7 +128,7 @@ class FieldSpecializer(object):
         if specializingPath is None:
             specializingPath = SpecializingPath(memory=Memory())
 
-        self._logger.debug("Specialize field {0}".format(self.field.name))
+        self._logger.debug("Specialize field %s", self.field.name)
 
         # does an arbitrary value is specified ?
         if self.arbitraryValue is not None:
@@ -165,7 +165,7 @@ class FieldSpecializer(object):
                 if value is None:
                     value = childResult.copy()
                 else:
-                    value += childResult.copy()
+                    value += childResult
 
             resultPath.addResult(self.field.domain, value)
             resultPath.addResultToField(self.field, value)
@@ -203,8 +203,7 @@ class FieldSpecializer(object):
                 resultSpecializingPath.addResult(self.field.domain,
                                                  assignedData)
 
-            self._logger.debug(
-                "FieldSpecializer Result: {0}".format(assignedData))
+            self._logger.debug("FieldSpecializer Result: %s", assignedData)
             resultSpecializingPath.addResultToField(self.field, assignedData)
 
         return resultSpecializingPaths
@@ -35,6 +35,8 @@
 # +---------------------------------------------------------------------------+
 # | Standard library imports                                                  |
 # +---------------------------------------------------------------------------+
+import logging
+
 from bitarray import bitarray
 
 # +---------------------------------------------------------------------------+
@@ -111,7 +113,7 @@ class MessageSpecializer(object):
         if symbol is None:
             raise Exception("Specified symbol is None")
 
-        self._logger.debug("Specifies symbol '{0}'.".format(symbol.name))
+        self._logger.debug("Specifies symbol '%s'.", symbol.name)
 
         self._update_presets(symbol)
 
@@ -119,7 +121,7 @@ class MessageSpecializer(object):
         specializingPaths = [SpecializingPath(memory=self.memory)]
 
         for field in symbol.fields:
-            self._logger.debug("Specializing field {0}".format(field.name))
+            self._logger.debug("Specializing field %s", field.name)
 
             fieldDomain = field.domain
             if fieldDomain is None:
@@ -167,7 +169,7 @@ class MessageSpecializer(object):
                             child.domain).copy()
                     else:
                         d += retainedPath.getDataAssignedToVariable(
-                            child.domain).copy()
+                            child.domain)
 
             else:
                 d = retainedPath.getDataAssignedToVariable(field.domain)
@@ -175,13 +177,15 @@ class MessageSpecializer(object):
             if generatedContent is None:
                 generatedContent = d.copy()
             else:
-                generatedContent += d.copy()
+                generatedContent += d
 
         retainedPath.generatedContent = generatedContent
 
-        self._logger.debug("Specialized message: {0}".format(
-            TypeConverter.convert(retainedPath.generatedContent, BitArray,
-                                  ASCII)))
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("Specialized message: %s",
+                               TypeConverter.convert(
+                                   retainedPath.generatedContent, BitArray,
+                                   ASCII))
         self.memory = retainedPath.memory
 
         return retainedPath
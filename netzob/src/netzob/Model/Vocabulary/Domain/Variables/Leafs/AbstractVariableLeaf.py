@@ -82,8 +82,8 @@ class AbstractVariableLeaf(AbstractVariable):
         else:
             if self.svas == SVAS.CONSTANT:
                 self._logger.debug(
-                    "Cannot parse '{0}' as svas is CONSTANT and no value is available.".
-                    format(self))
+                    "Cannot parse '%s' as svas is CONSTANT and no value is available.",
+                    self)
                 return []
             elif self.svas == SVAS.EPHEMERAL or self.svas == SVAS.PERSISTENT:
                 return self.learn(
@@ -129,8 +129,8 @@ class AbstractVariableLeaf(AbstractVariable):
         else:
             if self.svas == SVAS.CONSTANT:
                 self._logger.debug(
-                    "Cannot specialize '{0}' as svas is CONSTANT and no value is available.".
-                    format(self))
+                    "Cannot specialize '%s' as svas is CONSTANT and no value is available.",
+                    self)
                 return []
             elif self.svas == SVAS.EPHEMERAL or self.svas == SVAS.PERSISTENT:
                 return self.regenerateAndMemorize(parsingPath, acceptCallBack)
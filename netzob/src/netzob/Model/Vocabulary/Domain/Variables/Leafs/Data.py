@@ -355,17 +355,14 @@ class Data(AbstractVariableLeaf):
 
         content = parsingPath.getDataAssignedToVariable(self)
 
-        self._logger.debug(
-            "DomainCMP {0} with {1}".format(content, self.dataType))
+        self._logger.debug("DomainCMP %s with %s", content, self.dataType)
 
         (minSize, maxSize) = self.dataType.size
-        if maxSize is None:
-            maxSize = len(content)
 
         if len(content) < minSize:
             self._logger.debug(
-                "Length of the content is too short ({0}), expect data of at least {1} bits".
-                format(len(content), minSize))
+                "Length of the content is too short (%s), expect data of at least %s bits",
+                len(content), minSize)
         else:
 
             # if carnivorous:
@@ -398,14 +395,14 @@ class Data(AbstractVariableLeaf):
             #         newParsingPath.addResult(self, content[:size].copy())
             #         yield newParsingPath
 
-            for size in range(min(maxSize, len(content)), minSize - 1, -1):
-                # size == 0 : deals with 'optional' data
-                if size == 0 or self.dataType.canParse(content[:size]):
-                    # we create a new parsing path and returns it
-                    newParsingPath = parsingPath.duplicate()
+            # only the sizes the type can parse are generated
+            parsableSizes = self.dataType.buildParsableSizes()
+            for size in parsableSizes(content):
+                # we create a new parsing path and returns it
+                newParsingPath = parsingPath.duplicate()
 
-                    newParsingPath.addResult(self, content[:size].copy())
-                    yield newParsingPath
+                newParsingPath.addResult(self, content[:size])
+                yield newParsingPath
 
     @typeCheck(ParsingPath)
     def valueCMP(self, parsingPath, acceptCallBack=True, carnivorous=False):
@@ -437,8 +434,8 @@ class Data(AbstractVariableLeaf):
             parsingPath.addResult(self, expectedValue.copy())
             results.append(parsingPath)
         else:
-            self._logger.debug("{0} cannot be parsed with variable {1}".format(
-                content, self.id))
+            self._logger.debug("%s cannot be parsed with variable %s",
+                               content, self.id)
         return results
 
     @typeCheck(ParsingPath)
@@ -449,31 +446,29 @@ class Data(AbstractVariableLeaf):
 
         content = parsingPath.getDataAssignedToVariable(self)
 
-        self._logger.debug("Learn {0} with {1}".format(content, self.dataType))
+        self._logger.debug("Learn %s with %s", content, self.dataType)
 
         (minSize, maxSize) = self.dataType.size
-        if maxSize is None:
-            maxSize = len(content)
-
 
         if len(content) < minSize:
             self._logger.debug(
-                "Length of the content is too short ({0}), expect data of at least {1} bits".
-                format(len(content), minSize))
+                "Length of the content is too short (%s), expect data of at least %s bits",
+                len(content), minSize)
         else:
 
             #        if carnivorous:
             #            minSize = len(content)
             #            maxSize = len(content)
 
-            for size in range(min(maxSize, len(content)), minSize - 1, -1):
-                # size == 0 : deals with 'optional' data
-                if size == 0 or self.dataType.canParse(content[:size]):
-                    # we create a new parsing path and returns it
-                    newParsingPath = parsingPath.duplicate()
-                    newParsingPath.addResult(self, content[:size].copy())
-                    newParsingPath.memory.memorize(self, content[:size].copy())
-                    yield newParsingPath
+            # only the sizes the type can parse are generated
+            parsableSizes = self.dataType.buildParsableSizes()
+            for size in parsableSizes(content):
+                # we create a new parsing path and returns it
+                value = content[:size]
+                newParsingPath = parsingPath.duplicate()
+                newParsingPath.addResult(self, value)
+                newParsingPath.memory.memorize(self, value)
+                yield newParsingPath
 
     @typeCheck(SpecializingPath)
     def use(self, variableSpecializerPath, acceptCallBack=True):
@@ -503,7 +498,7 @@ class Data(AbstractVariableLeaf):
         It creates a VariableSpecializerResult in the provided path that
         contains a generated value that follows the definition of the Data
         """
-        self._logger.debug("Regenerate Variable {0}".format(self))
+        self._logger.debug("Regenerate Variable %s", self)
 
         if variableSpecializerPath is None:
             raise Exception("VariableSpecializerPath cannot be None")
@@ -521,7 +516,7 @@ class Data(AbstractVariableLeaf):
         It memorizes the value present in the path of the variable
         """
 
-        self._logger.debug("RegenerateAndMemorize Variable {0}".format(self))
+        self._logger.debug("RegenerateAndMemorize Variable %s", self)
 
         if variableSpecializerPath is None:
             raise Exception("VariableSpecializerPath cannot be None")
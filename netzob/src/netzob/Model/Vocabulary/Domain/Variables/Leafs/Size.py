@@ -207,8 +207,7 @@ class Size(AbstractRelationVariableLeaf):
 
         content = parsingPath.getDataAssignedToVariable(self)
         possibleValue = content[:sizeOfPossibleValue[1]]
-        self._logger.warn(
-            "Possible value of size field: {0}".format(possibleValue))
+        self._logger.warn("Possible value of size field: %s", possibleValue)
 
         expectedValue = self._computeExpectedValue(parsingPath)
         if expectedValue is None:
@@ -236,8 +235,8 @@ class Size(AbstractRelationVariableLeaf):
         the remainingData (or some if it) follows the type definition"""
 
         results = []
-        self._logger.debug(
-            "domainCMP executed on {0} by a size domain".format(parsingPath))
+        self._logger.debug("domainCMP executed on %s by a size domain",
+                           parsingPath)
 
         minSize, maxSize = self.dataType.size
         if minSize != maxSize:
@@ -263,7 +262,7 @@ class Size(AbstractRelationVariableLeaf):
                 # we add a callback
                 self._addCallBacksOnUndefinedFields(parsingPath)
                 # register the remaining data
-                parsingPath.addResult(self, possibleValue.copy())
+                parsingPath.addResult(self, possibleValue)
                 results.append(parsingPath)
             else:
                 raise Exception("no more callback accepted.")
@@ -305,7 +304,9 @@ class Size(AbstractRelationVariableLeaf):
                 if parsingPath.isDataAvailableForVariable(field.domain):
                     remainingFields.append(field)
                 else:
-                    self._logger.debug("The following field domain has no value: '{0}'".format(field.domain))
+                    self._logger.debug(
+                        "The following field domain has no value: '%s'",
+                        field.domain)
                     hasNeededData = False
                     break
 
@@ -346,7 +347,7 @@ class Size(AbstractRelationVariableLeaf):
         while len(b) > self.dataType.size[0]:
             b.remove(0)
 
-        self._logger.debug("computed value for Size field: '{}'".format(b))
+        self._logger.debug("computed value for Size field: '%s'", b)
         return b
 
     @typeCheck(SpecializingPath)
@@ -356,7 +357,7 @@ class Size(AbstractRelationVariableLeaf):
         It creates a VariableSpecializerResult in the provided path that
         contains a generated value that follows the definition of the Data
         """
-        self._logger.debug("Regenerate size {0}".format(self))
+        self._logger.debug("Regenerate size %s", self)
         if variableSpecializerPath is None:
             raise Exception("VariableSpecializerPath cannot be None")
 
@@ -365,8 +366,8 @@ class Size(AbstractRelationVariableLeaf):
             variableSpecializerPath.addResult(self, newValue)
         except Exception as e:
             self._logger.debug(
-                "Cannot specialize since no value is available for the size dependencies, we create a callback function in case it can be computed later: {0}".
-                format(e))
+                "Cannot specialize since no value is available for the size dependencies, we create a callback function in case it can be computed later: %s",
+                e)
             pendingValue = TypeConverter.convert("PENDING VALUE", ASCII,
                                                  BitArray)
             variableSpecializerPath.addResult(self, pendingValue)
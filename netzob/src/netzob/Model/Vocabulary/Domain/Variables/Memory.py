@@ -67,7 +67,8 @@ class Memory(object):
         Data (ASCII=None ((0, None))): b'hello'
         
         """
-        self.memory[variable] = value
+        self.__unshare()
+        self.__memory[variable] = value
 
     @typeCheck(AbstractVariable)
     def hasValue(self, variable):
@@ -84,7 +85,7 @@ class Memory(object):
         False
 
         """
-        return variable in list(self.memory.keys())
+        return variable in list(self.__memory.keys())
 
     @typeCheck(AbstractVariable)
     def getValue(self, variable):
@@ -98,7 +99,7 @@ class Memory(object):
         b'hello'
 
         """
-        return self.memory[variable]
+        return self.__memory[variable]
 
     @typeCheck(AbstractVariable)
     def forget(self, variable):
@@ -114,10 +115,11 @@ class Memory(object):
         >>> memory.hasValue(variable)
         False
         """
-        if variable in list(self.memory.keys()):
-            self.memory.pop(variable, None)
+        if variable in list(self.__memory.keys()):
+            self.__unshare()
+            self.__memory.pop(variable, None)
 
-    def duplicate(self):
+    def duplicate(self, copyValues=True):
         """Duplicates in a new memory
 
         >>> from netzob.all import *
@@ -137,17 +139,43 @@ class Memory(object):
         >>> m2.getValue(d1)
         bitarray('01100100')
 
+        Values can be shared with the new memory if they are never
+        modified in place, the two memories then only copy their entries
+        when one of them memorizes or forgets a value.
+
+        >>> m3 = m.duplicate(copyValues=False)
+        >>> m3.getValue(d1) is m.getValue(d1)
+        True
+        >>> m3.memorize(d1, TypeConverter.convert(10, Integer, BitArray))
+        >>> m3.getValue(d1)
+        bitarray('00001010')
+        >>> m.getValue(d1)
+        bitarray('00100110')
+
+        :keyword copyValues: if False, the memorized values are shared
+        :type copyValues: :class:`bool`
         :return: a new memory containing the same entries than current one
         :rtype: :class:`netzob.Model.Vocabulary.Domain.Variables.Memory`
         """
         duplicatedMemory = Memory()
-        for k in list(self.memory.keys()):
-            duplicatedMemory.memory[k] = self.memory[k].copy()
+        if copyValues:
+            for k in list(self.__memory.keys()):
+                duplicatedMemory.memory[k] = self.__memory[k].copy()
+        else:
+            self.__shared = True
+            duplicatedMemory.__memory = self.__memory
+            duplicatedMemory.__shared = True
         return duplicatedMemory
 
+    def __unshare(self):
+        """Copies the dict of values if it is shared with another memory"""
+        if self.__shared:
+            self.__memory = dict(self.__memory)
+            self.__shared = False
+
     def __str__(self):
         result = []
-        for var, value in list(self.memory.items()):
+        for var, value in list(self.__memory.items()):
             result.append("{0}: {1}".format(
                 var, TypeConverter.convert(value, BitArray, Raw)))
         return '\n'.join(result)
@@ -158,11 +186,16 @@ class Memory(object):
 
         :type: :class:`dict`
         """
+        # the caller may modify the returned dict
+        self.__unshare()
         return self.__memory
 
     @memory.setter
     def memory(self, memory):
         self.__memory = dict()
+        # the dict of values can be shared with duplicated memories until
+        # one of them modifies it
+        self.__shared = False
         for k, v in list(memory.items()):
             self.__memory[k] = v
 
@@ -119,12 +119,12 @@ class Agg(AbstractVariableNode):
     def parse(self, parsingPath, carnivorous=False):
         """Parse the content with the definition domain of the aggregate.
         """
-        dataToParse = parsingPath.getDataAssignedToVariable(self).copy()
-        self._logger.debug("Parse '{0}' as {1} with parser path '{2}'".format(
-            dataToParse, self, parsingPath))
+        dataToParse = parsingPath.getDataAssignedToVariable(self)
+        self._logger.debug("Parse '%s' as %s with parser path '%s'",
+                           dataToParse, self, parsingPath)
 
         # initialy, there is a unique path to test (the provided one)
-        parsingPath.assignDataToVariable(dataToParse.copy(), self.children[0])
+        parsingPath.assignDataToVariable(dataToParse, self.children[0])
         parsingPaths = [parsingPath]
 
         # we parse all the children with the parserPaths produced by previous children
@@ -138,35 +138,35 @@ class Agg(AbstractVariableNode):
             newParsingPaths = []
 
             for parsingPath in parsingPaths:
-                self._logger.debug(
-                    "Parse {0} with {1}".format(current_child.id, parsingPath))
+                self._logger.debug("Parse %s with %s",
+                                   current_child.id, parsingPath)
                 value_before_parsing = parsingPath.getDataAssignedToVariable(
-                    current_child).copy()
+                    current_child)
                 childParsingPaths = current_child.parse(
                     parsingPath, carnivorous=carnivorous)
 
                 for childParsingPath in childParsingPaths:
                     if childParsingPath.ok():
                         value_after_parsing = childParsingPath.getDataAssignedToVariable(
-                            current_child).copy()
+                            current_child)
                         remainingValue = value_before_parsing[len(
-                            value_after_parsing):].copy()
+                            value_after_parsing):]
                         if next_child is not None:
                             childParsingPath.assignDataToVariable(
                                 remainingValue, next_child)
 
                         # at least one child path managed to parse, we save the valid paths it produced
                         self._logger.debug(
-                            "Children {0} succesfuly applied with the parsingPath {1}".
-                            format(current_child, parsingPath))
+                            "Children %s succesfuly applied with the parsingPath %s",
+                            current_child, parsingPath)
                         newParsingPaths.append(childParsingPath)
 
             parsingPaths = newParsingPaths
 
             if len(parsingPaths) == 0:
                 self._logger.debug(
-                    "Children {0} didn't apply to any of the parser path we have, we stop Agg parser".
-                    format(current_child))
+                    "Children %s didn't apply to any of the parser path we have, we stop Agg parser",
+                    current_child)
                 return []  # return no valid paths
 
         # ok we managed to parse all the children, and it produced some valid parser paths. We return them
@@ -178,7 +178,7 @@ class Agg(AbstractVariableNode):
                         child).copy()
                 else:
                     parsedData += parsingPath.getDataAssignedToVariable(
-                        child).copy()
+                        child)
 
             parsingPath.addResult(self, parsedData)
         return parsingPaths
@@ -194,12 +194,12 @@ class Agg(AbstractVariableNode):
         for child in self.children:
             newSpecializingPaths = []
 
-            self._logger.debug("Specializing AGG child with {0} paths".format(
-                len(specializingPaths)))
+            self._logger.debug("Specializing AGG child with %s paths",
+                               len(specializingPaths))
 
             for specializingPath in specializingPaths:
-                self._logger.debug(
-                    "Spcialize {0} with {1}".format(child, specializingPath))
+                self._logger.debug("Spcialize %s with %s",
+                                   child, specializingPath)
 
                 childSpecializingPaths = child.specialize(specializingPath)
 
@@ -210,13 +210,13 @@ class Agg(AbstractVariableNode):
 
             specializingPaths = newSpecializingPaths
 
-        self._logger.debug("Specializing AGG child has produced {0} paths".
-                           format(len(specializingPaths)))
+        self._logger.debug("Specializing AGG child has produced %s paths",
+                           len(specializingPaths))
 
         if len(specializingPaths) == 0:
             self._logger.debug(
-                "Children {0} didn't apply to any of the specializer path we have, we stop Agg specializer".
-                format(child))
+                "Children %s didn't apply to any of the specializer path we have, we stop Agg specializer",
+                child)
             return []  # return no valid paths
 
         for specializingPath in specializingPaths:
@@ -115,23 +115,23 @@ class Alt(AbstractVariableNode):
             raise Exception("Cannot parse data if ALT has no children")
 
         dataToParse = parsingPath.getDataAssignedToVariable(self)
-        self._logger.debug("Parse '{0}' with '{1}'".format(dataToParse, self))
+        self._logger.debug("Parse '%s' with '%s'", dataToParse, self)
 
         parserPaths = [parsingPath]
-        parsingPath.assignDataToVariable(dataToParse.copy(), self.children[0])
+        parsingPath.assignDataToVariable(dataToParse, self.children[0])
 
         # create a path for each child
         if len(self.children) > 1:
             for child in self.children[1:]:
                 newParsingPath = parsingPath.duplicate()
-                newParsingPath.assignDataToVariable(dataToParse.copy(), child)
+                newParsingPath.assignDataToVariable(dataToParse, child)
                 parserPaths.append(newParsingPath)
 
         # parse each child according to its definition
         for i_child, child in enumerate(self.children):
             parsingPath = parserPaths[i_child]
-            self._logger.debug("ALT Parse of {0}/{1} with {2}".format(
-                i_child + 1, len(self.children), parsingPath))
+            self._logger.debug("ALT Parse of %s/%s with %s",
+                               i_child + 1, len(self.children), parsingPath)
 
             childParsingPaths = child.parse(parsingPath)
             for childParsingPath in childParsingPaths:
@@ -156,16 +156,17 @@ class Alt(AbstractVariableNode):
         # parse each child according to its definition
         for i_child, child in enumerate(self.children):
             newSpecializingPath = specializingPath.duplicate()
-            self._logger.debug("ALT Specialize of {0}/{1} with {2}".format(
-                i_child + 1, len(self.children), newSpecializingPath))
+            self._logger.debug("ALT Specialize of %s/%s with %s",
+                               i_child + 1, len(self.children),
+                               newSpecializingPath)
 
             childSpecializingPaths = child.specialize(newSpecializingPath)
             if len(childSpecializingPaths) == 0:
-                self._logger.debug("Path {0} on child {1} didn't succeed.".
-                                   format(newSpecializingPath, child))
+                self._logger.debug("Path %s on child %s didn't succeed.",
+                                   newSpecializingPath, child)
             else:
-                self._logger.debug("Path {0} on child {1} succeed.".format(
-                    newSpecializingPath, child))
+                self._logger.debug("Path %s on child %s succeed.",
+                                   newSpecializingPath, child)
                 for childSpecializingPath in childSpecializingPaths:
                     childSpecializingPath.addResult(
                         self,
@@ -174,8 +175,8 @@ class Alt(AbstractVariableNode):
                 specializingPaths.extend(childSpecializingPaths)
 
         if len(specializingPaths) == 0:
-            self._logger.debug(
-                "No children of {0} successfuly specialized".format(self))
+            self._logger.debug("No children of %s successfuly specialized",
+                               self)
 
         # lets shuffle this ( :) ) >>> by default we only consider the first valid parsing path.
         random.shuffle(specializingPaths)
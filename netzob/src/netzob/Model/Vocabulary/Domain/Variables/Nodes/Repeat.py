@@ -131,7 +131,7 @@ class Repeat(AbstractVariableNode):
             raise Exception("Parsing path cannot be None")
 
         # retrieve the data to parse
-        dataToParse = parsingPath.getDataAssignedToVariable(self).copy()
+        dataToParse = parsingPath.getDataAssignedToVariable(self)
 
         # remove any data assigned to this variable
         parsingPath.removeAssignedDataToVariable(self)
@@ -143,8 +143,7 @@ class Repeat(AbstractVariableNode):
 
             # initiate a new parsing path based on the current one
             newParsingPath = parsingPath.duplicate()
-            newParsingPath.assignDataToVariable(dataToParse.copy(),
-                                                self.children[0])
+            newParsingPath.assignDataToVariable(dataToParse, self.children[0])
             newParsingPaths = [newParsingPath]
 
             # deal with the case no repetition is accepted
@@ -170,7 +169,7 @@ class Repeat(AbstractVariableNode):
 
                         childParsingPath.addResult(self, newResult)
                         childParsingPath.assignDataToVariable(
-                            dataToParse.copy()[len(newResult):],
+                            dataToParse[len(newResult):],
                             self.children[0])
 
                         # apply delimitor
@@ -178,14 +177,14 @@ class Repeat(AbstractVariableNode):
                             if i_repeat < nb_repeat - 1:
                                 # check the delimitor is available
                                 toParse = childParsingPath.getDataAssignedToVariable(
-                                    self.children[0]).copy()
+                                    self.children[0])
                                 if toParse[:len(
                                         self.delimitor)] == self.delimitor:
                                     newResult = childParsingPath.getDataAssignedToVariable(
-                                        self).copy() + self.delimitor
+                                        self) + self.delimitor
                                     childParsingPath.addResult(self, newResult)
                                     childParsingPath.assignDataToVariable(
-                                        dataToParse.copy()[len(newResult):],
+                                        dataToParse[len(newResult):],
                                         self.children[0])
                                     tmp_result.append(childParsingPath)
                             else:
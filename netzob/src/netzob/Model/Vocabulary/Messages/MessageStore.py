@@ -0,0 +1,443 @@
+# -*- coding: utf-8 -*-
+
+#+---------------------------------------------------------------------------+
+#|          01001110 01100101 01110100 01111010 01101111 01100010            |
+#|                                                                           |
+#|               Netzob : Inferring communication protocols                  |
+#+---------------------------------------------------------------------------+
+#| Copyright (C) 2011-2017 Georges Bossert and Frédéric Guihéry              |
+#| This program is free software: you can redistribute it and/or modify      |
+#| it under the terms of the GNU General Public License as published by      |
+#| the Free Software Foundation, either version 3 of the License, or         |
+#| (at your option) any later version.                                       |
+#|                                                                           |
+#| This program is distributed in the hope that it will be useful,           |
+#| but WITHOUT ANY WARRANTY; without even the implied warranty of            |
+#| MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the              |
+#| GNU General Public License for more details.                              |
+#|                                                                           |
+#| You should have received a copy of the GNU General Public License         |
+#| along with this program. If not, see <http://www.gnu.org/licenses/>.      |
+#+---------------------------------------------------------------------------+
+#| @url      : http://www.netzob.org                                         |
+#| @contact  : contact@netzob.org                                            |
+#| @sponsors : Amossys, http://www.amossys.fr                                |
+#|             Supélec, http://www.rennes.supelec.fr/ren/rd/cidre/           |
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| Standard library imports
+#+---------------------------------------------------------------------------+
+import array
+import collections
+import heapq
+import types
+import uuid
+import weakref
+
+#+---------------------------------------------------------------------------+
+#| Related third party imports
+#+---------------------------------------------------------------------------+
+
+#+---------------------------------------------------------------------------+
+#| Local application imports
+#+---------------------------------------------------------------------------+
+from netzob.Common.Utils.Decorators import typeCheck, NetzobLogger
+from netzob.Model.Vocabulary.Messages.AbstractMessage import AbstractMessage
+from netzob.Model.Vocabulary.Messages.RawMessage import RawMessage
+from netzob.Model.Vocabulary.Messages.L2NetworkMessage import L2NetworkMessage
+from netzob.Model.Vocabulary.Messages.L3NetworkMessage import L3NetworkMessage
+from netzob.Model.Vocabulary.Messages.L4NetworkMessage import L4NetworkMessage
+
+
+class _MessageView(object):
+    """Mixin of the read-only messages built by a :class:`MessageStore`.
+    A view is built with the stored arguments of its message and then
+    frozen: setting one of its attributes, its metadata, its semantic
+    tags or its visualization functions raises an AttributeError."""
+
+    # Class of the stored message
+    _messageClass = None
+
+    def _freeze(self):
+        object.__setattr__(self, "_MessageView__readOnly", True)
+
+    def __raiseReadOnly(self):
+        raise AttributeError(
+            "Messages of a MessageStore are read-only, add a modified copy of the message instead")
+
+    def __setattr__(self, name, value):
+        if self.__dict__.get("_MessageView__readOnly", False):
+            self.__raiseReadOnly()
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name):
+        if self.__dict__.get("_MessageView__readOnly", False):
+            self.__raiseReadOnly()
+        super().__delattr__(name)
+
+    def setMetadata(self, name, value):
+        self.__raiseReadOnly()
+
+    def addSemanticTag(self, position, tag):
+        self.__raiseReadOnly()
+
+    def clearVisualizationFunctions(self):
+        self.__raiseReadOnly()
+
+    @property
+    def metadata(self):
+        return types.MappingProxyType(super().metadata)
+
+    @property
+    def semanticTags(self):
+        return types.MappingProxyType(super().semanticTags)
+
+    @property
+    def visualizationFunctions(self):
+        return tuple(super().visualizationFunctions)
+
+
+class _RawMessageView(_MessageView, RawMessage):
+    _messageClass = RawMessage
+
+
+class _L2NetworkMessageView(_MessageView, L2NetworkMessage):
+    _messageClass = L2NetworkMessage
+
+
+class _L3NetworkMessageView(_MessageView, L3NetworkMessage):
+    _messageClass = L3NetworkMessage
+
+
+class _L4NetworkMessageView(_MessageView, L4NetworkMessage):
+    _messageClass = L4NetworkMessage
+
+
+@NetzobLogger
+class MessageStore(collections.Sequence):
+    """A columnar container of messages, used to hold large traces.
+
+    Instead of keeping one object per message, the store keeps the
+    payloads of all its messages in one contiguous buffer, their dates in
+    an array of floats and their properties (protocols, addresses and
+    ports) in arrays of indexes to a table of distinct values. Messages
+    are only built when they are accessed and they are kept as long as
+    they are referenced, so accessing the same message twice returns the
+    same object. The identifier of a stored message is kept, so a message
+    built by the store has the same :attr:`id` as the message that was
+    added.
+
+    A store is a sequence of messages, sorted by date like a
+    :class:`SortedTypedList <netzob.Common.Utils.SortedTypedList.SortedTypedList>`
+    of messages. It can be used as the messages of a
+    :class:`Symbol <netzob.Model.Vocabulary.Symbol.Symbol>` and
+    :class:`PCAPImporter <netzob.Import.PCAPImporter.PCAPImporter.PCAPImporter>`
+    fills it when its parameter `columnar` is set.
+
+    Only the identifier, the data, the date and the properties given to
+    the constructor of :class:`RawMessage`, :class:`L2NetworkMessage`,
+    :class:`L3NetworkMessage` and :class:`L4NetworkMessage` are stored.
+    Their metadata, semantic tags, visualization functions and sessions
+    are not stored. As the store cannot keep the modifications of its
+    messages, the messages it builds are read-only: setting one of their
+    attributes (or editing their metadata) raises an AttributeError. A
+    modified message must be built and added to the store instead.
+
+    >>> from netzob.all import *
+    >>> store = MessageStore()
+    >>> store.add(L4NetworkMessage(b"hello", date=2.0, l3SourceAddress="10.0.0.1", l3DestinationAddress="10.0.0.2", l4Protocol="UDP", l4SourceAddress=5000, l4DestinationAddress=53))
+    >>> store.add(RawMessage(b"first", date=1.0, source="A", destination="B"))
+    >>> len(store)
+    2
+    >>> print([m.data for m in store])
+    [b'first', b'hello']
+    >>> message = store[1]
+    >>> print(message.source, message.destination, message.date)
+    10.0.0.1:5000 10.0.0.2:53 2.0
+    >>> store[1] is message
+    True
+    >>> isinstance(message, L4NetworkMessage)
+    True
+
+    Stored messages keep their identifier but they cannot be modified:
+
+    >>> raw = RawMessage(b"data", date=4.0)
+    >>> store.add(raw)
+    >>> store[2].id == raw.id
+    True
+    >>> store[2].data = b"other"
+    Traceback (most recent call last):
+    ...
+    AttributeError: Messages of a MessageStore are read-only, add a modified copy of the message instead
+    >>> store[2].setMetadata("key", "value")
+    Traceback (most recent call last):
+    ...
+    AttributeError: Messages of a MessageStore are read-only, add a modified copy of the message instead
+    >>> store[2].metadata["key"] = "value"
+    Traceback (most recent call last):
+    ...
+    TypeError: 'mappingproxy' object does not support item assignment
+    >>> print(store[2].data)
+    b'data'
+
+    A message of a store can be added to another store:
+
+    >>> other = MessageStore([store[2]])
+    >>> other[0].id == raw.id
+    True
+
+    Identifiers are also kept when the store is pickled:
+
+    >>> import pickle
+    >>> pickle.loads(pickle.dumps(store))[2].id == raw.id
+    True
+    >>> store.add(FileMessage(b"content"))
+    Traceback (most recent call last):
+    ...
+    TypeError: Messages of type FileMessage cannot be stored in a MessageStore
+
+    A store can be used as the messages of a symbol:
+
+    >>> symbol = Symbol(messages=store)
+    >>> symbol.messages is store
+    True
+    >>> symbol.messages.append(RawMessage(b"last", date=3.0))
+    >>> print([m.data for m in symbol.messages])
+    [b'first', b'hello', b'last', b'data']
+
+    """
+
+    # Properties stored for each type of message, in the order of the
+    # arguments of their constructors (after the data and the date)
+    MESSAGE_PROPERTIES = collections.OrderedDict([
+        (RawMessage, ("source", "destination")),
+        (L2NetworkMessage, ("l2Protocol", "l2SourceAddress",
+                            "l2DestinationAddress")),
+        (L3NetworkMessage, ("l2Protocol", "l2SourceAddress",
+                            "l2DestinationAddress", "l3Protocol",
+                            "l3SourceAddress", "l3DestinationAddress")),
+        (L4NetworkMessage, ("l2Protocol", "l2SourceAddress",
+                            "l2DestinationAddress", "l3Protocol",
+                            "l3SourceAddress", "l3DestinationAddress",
+                            "l4Protocol", "l4SourceAddress",
+                            "l4DestinationAddress")),
+    ])
+    NB_COLUMNS = 9
+
+    # Read-only classes of the messages built by the store
+    MESSAGE_VIEWS = {
+        RawMessage: _RawMessageView,
+        L2NetworkMessage: _L2NetworkMessageView,
+        L3NetworkMessage: _L3NetworkMessageView,
+        L4NetworkMessage: _L4NetworkMessageView,
+    }
+
+    def __init__(self, messages=None):
+        """
+        :keyword messages: the messages to store
+        :type messages: a :class:`list` of :class:`netzob.Model.Vocabulary.Messages.AbstractMessage.AbstractMessage`
+        """
+        self.id = uuid.uuid4()
+        self.__payloads = bytearray()
+        self.__offsets = array.array('Q', [0])
+        self.__dates = array.array('d')
+        # Identifiers of the messages, split in two 64 bits integers. The
+        # identifier of a message stored without one is derived from the
+        # identifier of the store (see __getId).
+        self.__idsHigh = array.array('Q')
+        self.__idsLow = array.array('Q')
+        self.__types = array.array('B')
+        self.__columns = [array.array('I') for i in range(MessageStore.NB_COLUMNS)]
+        self.__messageClasses = list(MessageStore.MESSAGE_PROPERTIES.keys())
+        self.__values = [None]
+        self.__valueIndexes = {None: 0}
+        self.__order = array.array('L')
+        self.__unsortedRows = []
+        self.__lastPriority = None
+        self.__views = weakref.WeakValueDictionary()
+        if messages is not None:
+            self.addAll(messages)
+
+    def __len__(self):
+        return len(self.__dates)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("MessageStore index out of range")
+
+        row = self.__getOrder()[index]
+        message = self.__views.get(row)
+        if message is None:
+            (messageClass, arguments) = self.__getRecord(row)
+            message = MessageStore.MESSAGE_VIEWS[messageClass](*arguments)
+            message.id = self.__getId(row)
+            message._freeze()
+            self.__views[row] = message
+        return message
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_MessageStore__views"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__views = weakref.WeakValueDictionary()
+
+    @typeCheck(AbstractMessage)
+    def add(self, message):
+        """Store the data and the properties of the specified message.
+
+        :parameter message: the message to store
+        :type message: :class:`netzob.Model.Vocabulary.Messages.AbstractMessage.AbstractMessage`
+        :raises: a TypeError if this type of message cannot be stored
+        """
+        if message is None:
+            raise TypeError("Message cannot be None")
+        messageClass = type(message)
+        if isinstance(message, _MessageView):
+            messageClass = message._messageClass
+        properties = MessageStore.MESSAGE_PROPERTIES.get(messageClass)
+        if properties is None:
+            raise TypeError(
+                "Messages of type {0} cannot be stored in a MessageStore".
+                format(messageClass.__name__))
+        arguments = (message.data, message.date) + tuple(
+            getattr(message, name) for name in properties)
+        self.addRecord(messageClass, arguments, messageId=message.id)
+
+    def append(self, message):
+        """Alias of :meth:`add`, so the store can be used where a list of
+        messages is expected."""
+        self.add(message)
+
+    def addAll(self, messages):
+        """Store all the specified messages."""
+        if messages is None:
+            raise TypeError("Messages cannot be None")
+        for message in messages:
+            self.add(message)
+
+    def addRecord(self, messageClass, arguments, messageId=None):
+        """Store a message without building it. Arguments are the
+        arguments of the constructor of the message class, starting with
+        the data and the date of the message (see
+        :meth:`PCAPImporter._buildMessages <netzob.Import.PCAPImporter.PCAPImporter.PCAPImporter._buildMessages>`).
+        If `messageId` is None, an identifier is given to the message
+        when it is built."""
+
+        if messageClass not in MessageStore.MESSAGE_PROPERTIES:
+            raise TypeError(
+                "Messages of type {0} cannot be stored in a MessageStore".
+                format(messageClass.__name__))
+        data = arguments[0]
+        date = arguments[1]
+        if data is None:
+            data = b''
+        if date is None:
+            raise TypeError("Stored messages must have a date")
+
+        self.__payloads += data
+        self.__offsets.append(len(self.__payloads))
+        self.__dates.append(date)
+        if messageId is None:
+            messageId = 0
+        else:
+            messageId = messageId.int
+        self.__idsHigh.append(messageId >> 64)
+        self.__idsLow.append(messageId & 0xFFFFFFFFFFFFFFFF)
+        self.__types.append(self.__messageClasses.index(messageClass))
+        properties = arguments[2:]
+        for (iColumn, column) in enumerate(self.__columns):
+            if iColumn < len(properties):
+                column.append(self.__getValueIndex(properties[iColumn]))
+            else:
+                column.append(0)
+
+        # Messages are sorted like in a SortedTypedList, by priority then
+        # by insertion order. Rows added in order are appended to the
+        # sorted rows, others are merged when the order is needed.
+        priority = int(date * 1000)
+        if len(self.__unsortedRows) == 0 and (
+                self.__lastPriority is None or
+                priority >= self.__lastPriority):
+            self.__order.append(len(self.__dates) - 1)
+            self.__lastPriority = priority
+        else:
+            self.__unsortedRows.append(len(self.__dates) - 1)
+
+    def addRecords(self, records):
+        """Store the messages described by a list of records
+        (messageClass, arguments)."""
+        for (messageClass, arguments) in records:
+            self.addRecord(messageClass, arguments)
+
+    def records(self):
+        """Generator of the records (messageClass, arguments) of the
+        stored messages, sorted by date. Messages are not built."""
+        for row in self.__getOrder():
+            yield self.__getRecord(row)
+
+    def values(self):
+        """Return a list of the stored messages sorted by date (as
+        :meth:`SortedTypedList.values <netzob.Common.Utils.SortedTypedList.SortedTypedList.values>`)."""
+        return list(self)
+
+    def clear(self):
+        """Remove all the stored messages."""
+        self.__init__()
+
+    def __getValueIndex(self, value):
+        """Internal method that returns the index of a property value in
+        the table of distinct values."""
+        index = self.__valueIndexes.get(value)
+        if index is None:
+            index = len(self.__values)
+            self.__values.append(value)
+            self.__valueIndexes[value] = index
+        return index
+
+    def __getId(self, row):
+        """Internal method that returns the identifier of the message of
+        a row. Version 4 UUIDs are never null, so a null identifier
+        stands for a message stored without identifier."""
+        messageId = (self.__idsHigh[row] << 64) | self.__idsLow[row]
+        if messageId == 0:
+            messageId = (self.id.int + row) % (1 << 128)
+        return uuid.UUID(int=messageId)
+
+    def __getRecord(self, row):
+        """Internal method that returns the record (messageClass,
+        arguments) of a row."""
+        messageClass = self.__messageClasses[self.__types[row]]
+        nbProperties = len(MessageStore.MESSAGE_PROPERTIES[messageClass])
+        data = bytes(self.__payloads[self.__offsets[row]:self.__offsets[row +
+                                                                         1]])
+        arguments = (data, self.__dates[row]) + tuple(
+            self.__values[self.__columns[iColumn][row]]
+            for iColumn in range(nbProperties))
+        return (messageClass, arguments)
+
+    def __getOrder(self):
+        """Internal method that returns the rows sorted by date. Rows
+        added out of order are sorted and merged with the sorted rows (the
+        whole store is not sorted again)."""
+        if len(self.__unsortedRows) > 0:
+            dates = self.__dates
+            priority = lambda row: int(dates[row] * 1000)
+            self.__order = array.array('L', heapq.merge(
+                self.__order,
+                sorted(self.__unsortedRows, key=priority),
+                key=priority))
+            self.__unsortedRows = []
+            self.__lastPriority = priority(self.__order[-1])
+        return self.__order
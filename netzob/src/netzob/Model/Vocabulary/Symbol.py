@@ -48,7 +48,9 @@ from netzob.Common.Utils.Decorators import NetzobLogger
 from netzob.Common.Utils.Decorators import typeCheck
 from netzob.Model.Vocabulary.AbstractField import AbstractField
 from netzob.Common.Utils.TypedList import TypedList
+from netzob.Common.Utils.SortedTypedList import SortedTypedList
 from netzob.Model.Vocabulary.Messages.AbstractMessage import AbstractMessage
+from netzob.Model.Vocabulary.Messages.MessageStore import MessageStore
 from netzob.Model.Vocabulary.Field import Field
 from netzob.Model.Vocabulary.Domain.Variables.Memory import Memory
 from netzob.Model.Vocabulary.Types.Raw import Raw
@@ -91,7 +93,7 @@ class Symbol(AbstractField):
         :keyword fields: the fields which participate in symbol definition
         :type fields: a :class:`list` of :class:`netzob.Model.Vocabulary.Field`
         :keyword messages: the message that represent the symbol
-        :type messages: a :class:`list` of :class:`netzob.Model.Vocabulary.Messages.AbstractMessage.AbstractMessage`
+        :type messages: a :class:`list` of :class:`netzob.Model.Vocabulary.Messages.AbstractMessage.AbstractMessage` or a :class:`netzob.Model.Vocabulary.Messages.MessageStore.MessageStore`
         :keyword name: the name of the symbol
         :type name: :class:`str`
         """
@@ -181,14 +183,18 @@ class Symbol(AbstractField):
 
     def clearMessages(self):
         """Delete all the messages attached to the current symbol"""
-        while (len(self.__messages) > 0):
-            self.__messages.pop()
+        if isinstance(self.__messages, MessageStore):
+            # the store may be shared, it is detached instead of cleared
+            self.__messages = TypedList(AbstractMessage)
+        self.__messages.clear()
 
     # Properties
 
     @property
     def messages(self):
         """A list containing all the messages that this symbol represent.
+        A :class:`MessageStore <netzob.Model.Vocabulary.Messages.MessageStore.MessageStore>`
+        is not copied, it becomes the list of messages of the symbol.
 
         :type : a :class:`list` of :class:`netzob.Model.Vocabulary.Messages.AbstractMessage.AbstractMessage`
         """
@@ -199,16 +205,26 @@ class Symbol(AbstractField):
         if messages is None:
             messages = []
 
+        if isinstance(messages, MessageStore):
+            self.__messages = messages
+            return
+
+        # Messages of a typed list of messages are already checked
+        trusted = isinstance(messages, (TypedList, SortedTypedList)) and isinstance(
+            messages.membersTypes, type) and issubclass(messages.membersTypes,
+                                                        AbstractMessage)
+        messages = list(messages)
+
         # First it checks the specified messages are all AbstractMessages
-        for msg in messages:
-            if not isinstance(msg, AbstractMessage):
-                raise TypeError(
-                    "Cannot add messages of type {0} in the session, only AbstractMessages are allowed.".
-                    format(type(msg)))
+        if not trusted:
+            for msgType in set(map(type, messages)):
+                if not issubclass(msgType, AbstractMessage):
+                    raise TypeError(
+                        "Cannot add messages of type {0} in the session, only AbstractMessages are allowed.".
+                        format(msgType))
 
         self.clearMessages()
-        for msg in messages:
-            self.__messages.append(msg)
+        self.__messages._extendTrusted(messages)
 
     def __repr__(self):
         return self.name
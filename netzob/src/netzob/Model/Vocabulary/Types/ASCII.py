@@ -85,6 +85,11 @@ class ASCII(AbstractType):
 
     """
 
+    # Translation table used by encode(), it keeps the bytes between ' '
+    # and '~' and replaces the others with '.'
+    PRINTABLE_TABLE = bytes(c if 0x20 <= c <= 0x7e else ord('.')
+                            for c in range(256))
+
     def __init__(self,
                  value=None,
                  nbChars=(None, None),
@@ -272,22 +277,93 @@ class ASCII(AbstractType):
         if len(data) % 8 != 0:
             return False
 
-        rawData = data.tobytes()
+        return self.buildCanParse()(data)
 
-        try:
-            rawData.decode('utf-8')
-        except:
-            return False
+    def buildCanParse(self,
+                      unitSize=None,
+                      endianness=None,
+                      sign=None):
+        """Returns a function which checks the number of chars of the data
+        before it decodes them as utf-8."""
 
         (minChar, maxChar) = self.nbChars
-        if minChar is not None:
-            if len(rawData) < minChar:
+        if minChar is None:
+            minChar = 0
+
+        def _canParse(data):
+            if data is None:
+                raise TypeError("data cannot be None")
+
+            nbBits = len(data)
+
+            # Ascii must be 8 bits modulo length
+            if nbBits == 0 or nbBits % 8 != 0:
                 return False
-        if maxChar is not None:
-            if len(rawData) > maxChar:
+
+            nbChars = nbBits // 8
+            if nbChars < minChar:
+                return False
+            if maxChar is not None and nbChars > maxChar:
+                return False
+
+            try:
+                data.tobytes().decode('utf-8')
+            except UnicodeDecodeError:
                 return False
 
-        return True
+            return True
+
+        return _canParse
+
+    def buildParsableSizes(self):
+        """Returns a function which decodes the data once to find its
+        longest valid utf-8 prefix and yields the sizes of the prefixes
+        ending on a char boundary, in the bounds of the type.
+
+        >>> from netzob.all import *
+        >>> parsableSizes = ASCII(nbChars=(2, 10)).buildParsableSizes()
+        >>> content = TypeConverter.convert("n\xe9tzob", ASCII, BitArray)
+        >>> list(parsableSizes(content))
+        [56, 48, 40, 32, 24]
+        >>> list(parsableSizes(content + bitarray('1111')))
+        [56, 48, 40, 32, 24]
+        >>> list(parsableSizes(content[:16]))
+        []
+        """
+
+        (minSize, maxSize) = self.size
+        (minChar, maxChar) = self.nbChars
+        if minChar is None:
+            minChar = 0
+        minChar = max(minChar, 1, (minSize + 7) // 8)
+        if maxSize is not None:
+            maxSize = maxSize // 8
+            if maxChar is None or maxSize < maxChar:
+                maxChar = maxSize
+
+        def _parsableSizes(data):
+            nbBytes = len(data) // 8
+            if maxChar is not None and maxChar < nbBytes:
+                nbBytes = maxChar
+            content = data[:nbBytes * 8].tobytes()
+
+            # only the prefixes of the longest valid utf-8 prefix can be
+            # decoded
+            try:
+                content.decode('utf-8')
+            except UnicodeDecodeError as e:
+                content = content[:e.start]
+
+            for nbChars in range(len(content), minChar - 1, -1):
+                # a prefix cannot end in the middle of a multi-bytes char
+                if nbChars == len(content) or content[nbChars] & 0xC0 != 0x80:
+                    yield nbChars * 8
+
+            # deals with 'optional' data
+            if minSize == 0:
+                yield 0
+
+        return _parsableSizes
 
     @property
     def nbChars(self):
@@ -378,11 +454,4 @@ class ASCII(AbstractType):
         if data is None:
             raise TypeError("data cannot be None")
 
-        res = ""
-        for ordElt in data:
-            if ordElt >= 0x20 and ordElt <= 0x7e:  # means between ' ' and '~'
-                res += chr(ordElt)
-            else:
-                res += "."
-
-        return res
+        return bytes(data).translate(ASCII.PRINTABLE_TABLE).decode('ascii')
@@ -86,9 +86,14 @@ class AbstractType(object, metaclass=abc.ABCMeta):
     # 65535*8 is completly arbitrary and equals to 2^16 - 1 octets
     MAXIMUM_GENERATED_DATA_SIZE = 65535 * 8
 
+    # Registry of the supported types indexed by their name, filled with
+    # the built-in types on first use and completed by registerType()
+    __supportedTypes = None
+    __supportedTypesSet = None
+    __builtinTypesSet = None
+
     @staticmethod
-    def supportedTypes():
-        """Official list of supported types"""
+    def __buildSupportedTypes():
         from netzob.Model.Vocabulary.Types.ASCII import ASCII
         from netzob.Model.Vocabulary.Types.Raw import Raw
         from netzob.Model.Vocabulary.Types.BitArray import BitArray
@@ -97,7 +102,7 @@ class AbstractType(object, metaclass=abc.ABCMeta):
         from netzob.Model.Vocabulary.Types.IPv4 import IPv4
         from netzob.Model.Vocabulary.Types.Timestamp import Timestamp
 
-        return [
+        builtinTypes = [
             # an array of bits: [1,0,0,1,1,0..]
             BitArray,
             # original python way of encoding data, raw data
@@ -113,6 +118,157 @@ class AbstractType(object, metaclass=abc.ABCMeta):
             # Timestamp
             Timestamp
         ]
+        AbstractType.__supportedTypes = collections.OrderedDict(
+            (typeClass.__name__, typeClass) for typeClass in builtinTypes)
+        AbstractType.__supportedTypesSet = set(builtinTypes)
+        AbstractType.__builtinTypesSet = frozenset(builtinTypes)
+
+    @staticmethod
+    def supportedTypes():
+        """Official list of supported types
+
+        >>> from netzob.all import *
+        >>> Integer in AbstractType.supportedTypes()
+        True
+        """
+        if AbstractType.__supportedTypes is None:
+            AbstractType.__buildSupportedTypes()
+        return list(AbstractType.__supportedTypes.values())
+
+    @staticmethod
+    def isSupportedType(typeClass):
+        """Computes if the specified class is a supported type.
+
+        >>> from netzob.all import *
+        >>> AbstractType.isSupportedType(ASCII)
+        True
+        >>> AbstractType.isSupportedType(str)
+        False
+        """
+        if AbstractType.__supportedTypes is None:
+            AbstractType.__buildSupportedTypes()
+        try:
+            return typeClass in AbstractType.__supportedTypesSet
+        except TypeError:
+            return False
+
+    @staticmethod
+    @typeCheck(str)
+    def typeByName(name):
+        """Returns the supported type which has the specified name.
+
+        >>> from netzob.all import *
+        >>> AbstractType.typeByName("Integer")
+        <class 'netzob.Model.Vocabulary.Types.Integer.Integer'>
+        >>> AbstractType.typeByName("Float")
+        Traceback (most recent call last):
+        ...
+        ValueError: No supported type is named 'Float'
+
+        :param name: the name of the type
+        :type name: :class:`str`
+        :raise: ValueError if no supported type has this name
+        """
+        if AbstractType.__supportedTypes is None:
+            AbstractType.__buildSupportedTypes()
+        try:
+            return AbstractType.__supportedTypes[name]
+        except KeyError:
+            raise ValueError(
+                "No supported type is named '{0}'".format(name))
+
+    @staticmethod
+    @typeCheck(type)
+    def registerType(typeClass):
+        """Registers a user-defined type in the list of supported types, so
+        it can be used by the type converter and the encoding functions.
+
+        >>> from netzob.all import *
+        >>> class Login(ASCII):
+        ...     pass
+        >>> AbstractType.registerType(Login)
+        >>> AbstractType.isSupportedType(Login)
+        True
+        >>> AbstractType.typeByName("Login") is Login
+        True
+        >>> print(TypeConverter.convert(b"zoby", Raw, Login))
+        zoby
+        >>> AbstractType.unregisterType(Login)
+        >>> AbstractType.isSupportedType(Login)
+        False
+        >>> AbstractType.registerType(str)
+        Traceback (most recent call last):
+        ...
+        TypeError: The type must inherit from AbstractType
+
+        :param typeClass: the class of the type to register
+        :type typeClass: :class:`type`
+        :raise: TypeError if the class is not an AbstractType, ValueError if another type already has its name
+        """
+        if not issubclass(typeClass, AbstractType):
+            raise TypeError("The type must inherit from AbstractType")
+        if AbstractType.__supportedTypes is None:
+            AbstractType.__buildSupportedTypes()
+
+        name = typeClass.__name__
+        registeredType = AbstractType.__supportedTypes.get(name)
+        if registeredType is typeClass:
+            return
+        if registeredType is not None:
+            raise ValueError(
+                "Another type is already registered with the name '{0}'".
+                format(name))
+        AbstractType.__supportedTypes[name] = typeClass
+        AbstractType.__supportedTypesSet.add(typeClass)
+
+    @staticmethod
+    @typeCheck(type)
+    def unregisterType(typeClass):
+        """Removes a user-defined type from the list of supported types,
+        along with the converters the type converter cached for it.
+
+        >>> from netzob.all import *
+        >>> class Password(Raw):
+        ...     pass
+        >>> AbstractType.registerType(Password)
+        >>> print(TypeConverter.convert(b"zoby", Password, ASCII))
+        zoby
+        >>> AbstractType.unregisterType(Password)
+        >>> AbstractType.typeByName("Password")
+        Traceback (most recent call last):
+        ...
+        ValueError: No supported type is named 'Password'
+        >>> TypeConverter.convert(b"zoby", Password, ASCII)
+        Traceback (most recent call last):
+        ...
+        TypeError: The source type (<class 'netzob.Model.Vocabulary.Types.AbstractType.Password'>) is not supported
+        >>> AbstractType.unregisterType(Password)
+        Traceback (most recent call last):
+        ...
+        ValueError: The type 'Password' is not registered
+        >>> AbstractType.unregisterType(ASCII)
+        Traceback (most recent call last):
+        ...
+        ValueError: The built-in type 'ASCII' cannot be unregistered
+
+        :param typeClass: the class of the type to unregister
+        :type typeClass: :class:`type`
+        :raise: ValueError if the type is not registered or is a built-in type
+        """
+        from netzob.Model.Vocabulary.Types.TypeConverter import TypeConverter
+
+        if AbstractType.__supportedTypes is None:
+            AbstractType.__buildSupportedTypes()
+
+        name = typeClass.__name__
+        if typeClass in AbstractType.__builtinTypesSet:
+            raise ValueError(
+                "The built-in type '{0}' cannot be unregistered".format(name))
+        if AbstractType.__supportedTypes.get(name) is not typeClass:
+            raise ValueError("The type '{0}' is not registered".format(name))
+        del AbstractType.__supportedTypes[name]
+        AbstractType.__supportedTypesSet.discard(typeClass)
+        TypeConverter._forgetConverters(typeClass)
 
     @staticmethod
     def supportedUnitSizes():
@@ -251,7 +407,7 @@ class AbstractType(object, metaclass=abc.ABCMeta):
         """
         if typeClass is None:
             raise TypeError("TypeClass cannot be None")
-        if typeClass not in AbstractType.supportedTypes():
+        if not AbstractType.isSupportedType(typeClass):
             raise TypeError("Requested typeClass ({0}) is not supported.".
                             format(typeClass))
 
@@ -419,6 +575,85 @@ class AbstractType(object, metaclass=abc.ABCMeta):
         raise NotImplementedError(
             "Internal Error: 'canParse' method not implemented")
 
+    def buildCanParse(self,
+                      unitSize=None,
+                      endianness=None,
+                      sign=None):
+        """This method returns a function which takes the data as its
+        single parameter and returns the same result as :meth:`canParse`.
+        The constraints of the type are processed once when the function
+        is built, so it should be used to check many data, for instance
+        the candidate sizes of a content, against the same type.
+
+        The returned function must be built again if the constraints of
+        the type are modified.
+
+        >>> from netzob.all import *
+        >>> canParse = ASCII(nbChars=(2, 3)).buildCanParse()
+        >>> content = TypeConverter.convert("hello", ASCII, BitArray)
+        >>> [canParse(content[:size]) for size in range(0, 48, 8)]
+        [False, False, True, True, False, False]
+
+        :keyword unitSize: the unit size of the data, default is the one of :meth:`canParse`
+        :keyword endianness: the endianness of the data, default is the one of :meth:`canParse`
+        :keyword sign: the sign of the data, default is the one of :meth:`canParse`
+        :return: a function which computes if a data can be parsed with the current type
+        :rtype: :class:`function`
+        """
+        kwargs = dict()
+        if unitSize is not None:
+            kwargs["unitSize"] = unitSize
+        if endianness is not None:
+            kwargs["endianness"] = endianness
+        if sign is not None:
+            kwargs["sign"] = sign
+        if len(kwargs) == 0:
+            return self.canParse
+
+        canParse = self.canParse
+
+        def _canParse(data):
+            return canParse(data, **kwargs)
+
+        return _canParse
+
+    def buildParsableSizes(self):
+        """This method returns a function which takes some data as its
+        single parameter and lazily yields, from the longest to the
+        shortest, the sizes of the prefixes of the data that can be
+        parsed with the current type. An empty prefix is yielded last if
+        the minimum size of the type is 0 (optional data).
+
+        The default implementation checks every size allowed by the
+        type with :meth:`buildCanParse`, types override it to skip the
+        sizes their structure cannot match.
+
+        >>> from netzob.all import *
+        >>> parsableSizes = ASCII(nbChars=(0, 4)).buildParsableSizes()
+        >>> content = TypeConverter.convert(b"hello", Raw, BitArray)
+        >>> list(parsableSizes(content))
+        [32, 24, 16, 8, 0]
+        >>> parsableSizes = Integer(unitSize=AbstractType.UNITSIZE_16).buildParsableSizes()
+        >>> list(parsableSizes(content))
+        [16]
+
+        :return: a function which yields the sizes of the parsable prefixes of a data
+        :rtype: :class:`function`
+        """
+        canParse = self.buildCanParse()
+        (minSize, maxSize) = self.size
+
+        def _parsableSizes(data):
+            if maxSize is None or maxSize > len(data):
+                longestSize = len(data)
+            else:
+                longestSize = maxSize
+            for size in range(longestSize, minSize - 1, -1):
+                if size == 0 or canParse(data[:size]):
+                    yield size
+
+        return _parsableSizes
+
     @property
     def value(self):
         """The current value of the instance. This value is represented
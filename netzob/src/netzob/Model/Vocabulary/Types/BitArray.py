@@ -113,6 +113,50 @@ class BitArray(AbstractType):
 
         return True
 
+    def buildCanParse(self,
+                      unitSize=None,
+                      endianness=None,
+                      sign=None):
+        """Returns a function which compares the length of the data with
+        the size bounds of the type."""
+
+        (nbMinBits, nbMaxBits) = self.size
+        if nbMinBits is None or nbMinBits < 1:
+            nbMinBits = 1
+
+        def _canParse(data):
+            if data is None:
+                raise TypeError("data cannot be None")
+
+            if not isinstance(data, bitarray):
+                raise TypeError("Data should be a python raw ({0}:{1})".
+                                format(data, type(data)))
+
+            nbBitsData = len(data)
+            if nbBitsData < nbMinBits:
+                return False
+            if nbMaxBits is not None and nbMaxBits < nbBitsData:
+                return False
+
+            return True
+
+        return _canParse
+
+    def buildParsableSizes(self):
+        """Returns a function which yields every size in the bounds of the
+        type, as any bitarray can be parsed."""
+
+        (minSize, maxSize) = self.size
+
+        def _parsableSizes(data):
+            if maxSize is None or maxSize > len(data):
+                longestSize = len(data)
+            else:
+                longestSize = maxSize
+            return iter(range(longestSize, minSize - 1, -1))
+
+        return _parsableSizes
+
     def generate(self, generationStrategy=None):
         """Generates a random bitarray that respects the constraints.
         """
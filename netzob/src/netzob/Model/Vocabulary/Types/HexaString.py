@@ -35,6 +35,7 @@
 #| Standard library imports                                                  |
 #+---------------------------------------------------------------------------+
 import binascii
+import re
 from bitarray import bitarray
 
 #+---------------------------------------------------------------------------+
@@ -51,6 +52,10 @@ from netzob.Model.Vocabulary.Types.ASCII import ASCII
 
 
 class HexaString(AbstractType):
+
+    # Data made only of lowercase hexadecimal digits
+    HEXA_REGEX = re.compile(b"[0-9a-f]+")
+
     def __init__(self, value=None, size=(None, None)):
         if value is not None and not isinstance(value, bitarray):
             from netzob.Model.Vocabulary.Types.TypeConverter import TypeConverter
@@ -80,8 +85,24 @@ class HexaString(AbstractType):
         >>> print(HexaString().canParse(hex))
         True
 
+        A bitarray is the encoded value of an hexastring: the bytes of
+        the data are checked, not their hexadecimal digits. Hence, a
+        specialized HexaString field can be parsed back:
+
+        >>> HexaString().canParse(TypeConverter.convert(b"\\x0a\\xbc", Raw, BitArray))
+        True
+        >>> HexaString().canParse(bitarray('0000'))
+        False
+        >>> symbol = Symbol([Field(HexaString("0abc")), Field(";")])
+        >>> data = symbol.specialize()
+        >>> data
+        b'\\n\\xbc;'
+        >>> symbol = Symbol([Field(HexaString(size=(8, 32))), Field(";")])
+        >>> MessageParser().parseMessage(RawMessage(data), symbol)
+        [bitarray('0000101010111100'), bitarray('00111011')]
+
         :param data: the data to check
-        :type data: python raw
+        :type data: python raw or :class:`bitarray`
         :return: True if data can be parsed as an hexastring
         :rtype: bool
         :raise: TypeError if the data is None
@@ -93,29 +114,31 @@ class HexaString(AbstractType):
         if len(data) == 0:
             return False
 
-        # import logging
-        # logger = logging.getLogger(__name__)
-
-        # logger.warn("PAF: {0}".format(data))
+        if isinstance(data, bitarray):
+            return len(data) % 8 == 0
 
-        # if not ASCII().canParse(data):
-        #     logger.warn("OUPS: {0}".format(data))
-        #     return False
+        return HexaString.HEXA_REGEX.fullmatch(data) is not None
 
-        # try:
-        #     value = ASCII.encode(data)
-        # except:
-        #     return False
+    def buildCanParse(self,
+                      unitSize=None,
+                      endianness=None,
+                      sign=None):
+        """Returns a function which matches the data with the precompiled
+        regex of hexadecimal digits. As in :meth:`canParse`, a bitarray
+        only has to hold whole bytes."""
 
-        allowedValues = [str(i) for i in range(0, 10)]
-        allowedValues.extend(["a", "b", "c", "d", "e", "f"])
+        fullmatch = HexaString.HEXA_REGEX.fullmatch
 
-        str_data = data.decode('utf-8')
-        for i in range(0, len(data)):
-            if not str_data[i] in allowedValues:
+        def _canParse(data):
+            if data is None:
+                raise TypeError("data cannot be None")
+            if len(data) == 0:
                 return False
+            if isinstance(data, bitarray):
+                return len(data) % 8 == 0
+            return fullmatch(data) is not None
 
-        return True
+        return _canParse
 
     @staticmethod
     @typeCheck(str)
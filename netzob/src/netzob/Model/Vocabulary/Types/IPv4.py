@@ -260,6 +260,50 @@ class IPv4(AbstractType):
 
         return True
 
+    def buildCanParse(self,
+                      unitSize=AbstractType.defaultUnitSize(),
+                      endianness=AbstractType.defaultEndianness(),
+                      sign=AbstractType.defaultSign()):
+        """Returns a function which rejects bitarrays that are not made of
+        4 bytes. When no value nor network is expected, the 4 bytes are
+        checked as an integer instead of an IPAddress.
+
+        >>> from netzob.all import *
+        >>> canParse = IPv4().buildCanParse()
+        >>> canParse(TypeConverter.convert("192.168.0.10", IPv4, BitArray))
+        True
+        >>> canParse(TypeConverter.convert(b"\\xff\\xff\\xff\\x00", Raw, BitArray))
+        False
+        >>> canParse(TypeConverter.convert(b"\\x01\\x02\\x03", Raw, BitArray))
+        False
+        """
+
+        canParse = self.canParse
+        checkInteger = self.value is None and self.network is None and sign == AbstractType.SIGN_SIGNED
+
+        def _canParse(data):
+            if data is None:
+                raise TypeError("data cannot be None")
+
+            if not isinstance(data, bitarray):
+                return canParse(
+                    data, unitSize=unitSize, endianness=endianness, sign=sign)
+
+            # The IPv4 must be made of 4 bytes
+            if (len(data) + 7) // 8 != 4:
+                return False
+
+            if checkInteger and len(data) == 32:
+                # The IPv4 must not be a netmask
+                value = (int.from_bytes(data.tobytes(), 'big') ^
+                         0xffffffff) + 1
+                return value & (value - 1) != 0
+
+            return canParse(
+                data, unitSize=unitSize, endianness=endianness, sign=sign)
+
+        return _canParse
+
     def _isValidIPv4Network(self, network):
         """Computes if the specified network is a valid IPv4 network.
 
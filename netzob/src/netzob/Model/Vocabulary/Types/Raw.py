@@ -228,19 +228,75 @@ class Raw(AbstractType):
         :raise: TypeError if the data is None
         """
 
-        if data is None:
-            raise TypeError("data cannot be None")
+        return self.buildCanParse()(data)
 
-        if len(data) == 0:
-            return False
+    def buildCanParse(self,
+                      unitSize=None,
+                      endianness=None,
+                      sign=None):
+        """Returns a function which checks the length of the data and,
+        if an alphabet is defined, deletes the bytes of the alphabet from
+        the data to verify no other byte remains."""
 
-        if len(data) % 8 != 0:
-            return False
+        alphabetBytes = None
+        if self.alphabet is not None:
+            alphabetBytes = bytes(
+                sorted(
+                    set(
+                        ord(letter) if isinstance(letter, (str, bytes)) else
+                        letter for letter in self.alphabet)))
+
+        def _canParse(data):
+            if data is None:
+                raise TypeError("data cannot be None")
+
+            nbBits = len(data)
+            if nbBits == 0 or nbBits % 8 != 0:
+                return False
+
+            if alphabetBytes is not None:
+                return len(data.tobytes().translate(None, alphabetBytes)) == 0
+
+            return True
+
+        return _canParse
+
+    def buildParsableSizes(self):
+        """Returns a function which yields the sizes in bytes of the data
+        and, if an alphabet is defined, stops at the first byte out of the
+        alphabet.
 
+        >>> from netzob.all import *
+        >>> parsableSizes = Raw(nbBytes=(0, 3), alphabet=["a", "b"]).buildParsableSizes()
+        >>> list(parsableSizes(TypeConverter.convert(b"abcab", Raw, BitArray)))
+        [16, 8, 0]
+        """
+
+        (minSize, maxSize) = self.size
+        alphabetBytes = None
         if self.alphabet is not None:
-            data_set = set(data)
-            for element in data_set:
-                if element not in self.alphabet:
-                    return False
+            alphabetBytes = bytes(
+                sorted(
+                    set(
+                        ord(letter) if isinstance(letter, (str, bytes)) else
+                        letter for letter in self.alphabet)))
+
+        def _parsableSizes(data):
+            if maxSize is None or maxSize > len(data):
+                nbBytes = len(data) // 8
+            else:
+                nbBytes = maxSize // 8
+
+            if alphabetBytes is not None:
+                # length of the longest prefix made of alphabet bytes
+                content = data[:nbBytes * 8].tobytes()
+                nbBytes = len(content) - len(content.lstrip(alphabetBytes))
+
+            for size in range(nbBytes * 8, max(minSize, 1) - 1, -8):
+                yield size
+
+            # deals with 'optional' data
+            if minSize == 0:
+                yield 0
 
-        return True
+        return _parsableSizes
@@ -201,7 +201,53 @@ class Timestamp(AbstractType):
                 Integer,
                 dst_unitSize=AbstractType.UNITSIZE_32,
                 dst_sign=AbstractType.SIGN_UNSIGNED)
+        except Exception:
+            return False
+
+        return self.__isValidValue(value)
+
+    def buildCanParse(self,
+                      unitSize=None,
+                      endianness=None,
+                      sign=None):
+        """Returns a function which only checks the length of the data
+        when the lowest and the highest values of the type are both valid
+        timestamps, since all the values between them are then valid.
+
+        >>> from netzob.all import *
+        >>> canParse = Timestamp().buildCanParse()
+        >>> canParse(TypeConverter.convert("test", ASCII, BitArray))
+        True
+        >>> canParse(TypeConverter.convert("te", ASCII, BitArray))
+        False
+        >>> time = Timestamp(epoch=Timestamp.EPOCH_WINDOWS, unity=Timestamp.UNITY_NANOSECOND, unitSize = AbstractType.UNITSIZE_64)
+        >>> time.buildCanParse()(TypeConverter.convert("test", ASCII, BitArray))
+        False
+        """
+
+        canParse = self.canParse
+        nbBits = int(self.unitSize)
+        allValid = nbBits % 8 == 0 and self.__isValidValue(
+            0) and self.__isValidValue(pow(2, nbBits) - 1)
+
+        def _canParse(data):
+            if data is None:
+                raise TypeError("data cannot be None")
+
+            # Timestamp must be 8 bits modulo length
+            if len(data) % 8 != 0 or len(data) < nbBits:
+                return False
 
+            if allValid:
+                return True
+
+            return canParse(data)
+
+        return _canParse
+
+    def __isValidValue(self, value):
+        """Computes if the specified integer value is a valid timestamp."""
+        try:
             # convert the value in seconds
             value = value / self.unity
 
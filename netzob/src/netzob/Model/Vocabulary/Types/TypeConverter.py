@@ -28,10 +28,18 @@
 # +---------------------------------------------------------------------------+
 # | Standard library imports                                                  |
 # +---------------------------------------------------------------------------+
+import binascii
+import struct
 
 # +---------------------------------------------------------------------------+
 # | Related third party imports                                               |
 # +---------------------------------------------------------------------------+
+from bitarray import bitarray
+try:
+    # numpy is only used to convert columns of integers at once
+    import numpy
+except ImportError:
+    numpy = None
 
 # +---------------------------------------------------------------------------+
 # | Local application imports                                                 |
@@ -52,12 +60,208 @@ class TypeConverter(object):
         """
         return AbstractType.supportedTypes()
 
+    # Converters of each (sourceType, destinationType) couple and structs of
+    # each (unitSize, endianness, sign) of integers, computed on first use
+    __converters = None
+    __integerStructs = None
+
     @staticmethod
     def __directEncoding():
+        """Converters of the couples which do not go through the generic
+        decoding to raw and encoding from raw."""
+        from netzob.Model.Vocabulary.Types.BitArray import BitArray
+        from netzob.Model.Vocabulary.Types.Integer import Integer
+        from netzob.Model.Vocabulary.Types.HexaString import HexaString
+
         return {
-            # (ASCII,bitarray):TypeConverter.__encodeASCIIToBitarray,
+            (BitArray, Raw): TypeConverter.__encodeBitArrayToRaw,
+            (Raw, BitArray): TypeConverter.__encodeRawToBitArray,
+            (BitArray, Integer): TypeConverter.__encodeBitArrayToInteger,
+            (Raw, Integer): TypeConverter.__encodeRawToInteger,
+            (Integer, Raw): TypeConverter.__encodeIntegerToRaw,
+            (Integer, BitArray): TypeConverter.__encodeIntegerToBitArray,
+            (Raw, HexaString): TypeConverter.__encodeRawToHexaString,
+            (BitArray, HexaString): TypeConverter.__encodeBitArrayToHexaString,
         }
 
+    @staticmethod
+    def __buildConverters():
+        from netzob.Model.Vocabulary.Types.Integer import Integer
+
+        integerStructs = dict()
+        for unitSize in [
+                AbstractType.UNITSIZE_8, AbstractType.UNITSIZE_16,
+                AbstractType.UNITSIZE_32, AbstractType.UNITSIZE_64
+        ]:
+            for endianness in AbstractType.supportedEndianness():
+                for sign in AbstractType.supportedSign():
+                    integerStructs[(unitSize, endianness, sign)] = struct.Struct(
+                        Integer.computeFormat(unitSize, endianness, sign))
+        TypeConverter.__integerStructs = integerStructs
+
+        converters = dict()
+        for sourceType in TypeConverter.supportedTypes():
+            for destinationType in TypeConverter.supportedTypes():
+                converters[(sourceType, destinationType)] = TypeConverter.__genericConverter(
+                    sourceType, destinationType)
+        converters.update(TypeConverter.__directEncoding())
+        TypeConverter.__converters = converters
+
+    @staticmethod
+    def _forgetConverters(typeClass):
+        """Removes the cached converters from and to the specified type,
+        used when the type is no longer supported."""
+        if TypeConverter.__converters is None:
+            return
+        for (sourceType, destinationType) in list(
+                TypeConverter.__converters.keys()):
+            if typeClass in (sourceType, destinationType):
+                del TypeConverter.__converters[(sourceType, destinationType)]
+
+    @staticmethod
+    def __genericConverter(sourceType, destinationType):
+        """Returns a converter that decodes the data to raw and encodes the
+        raw data to the destination type."""
+
+        if sourceType is Raw and destinationType is Raw:
+
+            def converter(data, src_unitSize, src_endianness, src_sign,
+                          dst_unitSize, dst_endianness, dst_sign):
+                return data
+        elif sourceType is Raw:
+            encode = destinationType.encode
+
+            def converter(data, src_unitSize, src_endianness, src_sign,
+                          dst_unitSize, dst_endianness, dst_sign):
+                return encode(
+                    data,
+                    unitSize=dst_unitSize,
+                    endianness=dst_endianness,
+                    sign=dst_sign)
+        elif destinationType is Raw:
+            decode = sourceType.decode
+
+            def converter(data, src_unitSize, src_endianness, src_sign,
+                          dst_unitSize, dst_endianness, dst_sign):
+                return decode(
+                    data,
+                    unitSize=src_unitSize,
+                    endianness=src_endianness,
+                    sign=src_sign)
+        else:
+            decode = sourceType.decode
+            encode = destinationType.encode
+
+            def converter(data, src_unitSize, src_endianness, src_sign,
+                          dst_unitSize, dst_endianness, dst_sign):
+                return encode(
+                    decode(
+                        data,
+                        unitSize=src_unitSize,
+                        endianness=src_endianness,
+                        sign=src_sign),
+                    unitSize=dst_unitSize,
+                    endianness=dst_endianness,
+                    sign=dst_sign)
+
+        return converter
+
+    @staticmethod
+    def __encodeBitArrayToRaw(data, src_unitSize, src_endianness, src_sign,
+                              dst_unitSize, dst_endianness, dst_sign):
+        return data.tobytes()
+
+    @staticmethod
+    def __encodeRawToBitArray(data, src_unitSize, src_endianness, src_sign,
+                              dst_unitSize, dst_endianness, dst_sign):
+        if dst_endianness not in (AbstractType.ENDIAN_BIG,
+                                  AbstractType.ENDIAN_LITTLE):
+            raise ValueError("Invalid endianness value")
+        if isinstance(data, str):
+            data = bytes(data, "utf-8")
+        b = bitarray(endian=dst_endianness)
+        b.frombytes(data)
+        return b
+
+    @staticmethod
+    def __encodeRawToInteger(data, src_unitSize, src_endianness, src_sign,
+                             dst_unitSize, dst_endianness, dst_sign):
+        integerStruct = TypeConverter.__integerStructs.get(
+            (dst_unitSize, dst_endianness, dst_sign))
+        if integerStruct is not None and len(data) == integerStruct.size:
+            return integerStruct.unpack(data)[0]
+
+        # data made of multiple words or invalid parameters
+        from netzob.Model.Vocabulary.Types.Integer import Integer
+        return Integer.encode(
+            data,
+            unitSize=dst_unitSize,
+            endianness=dst_endianness,
+            sign=dst_sign)
+
+    @staticmethod
+    def __encodeBitArrayToInteger(data, src_unitSize, src_endianness,
+                                  src_sign, dst_unitSize, dst_endianness,
+                                  dst_sign):
+        return TypeConverter.__encodeRawToInteger(
+            data.tobytes(), src_unitSize, src_endianness, src_sign,
+            dst_unitSize, dst_endianness, dst_sign)
+
+    @staticmethod
+    def __encodeIntegerToRaw(data, src_unitSize, src_endianness, src_sign,
+                             dst_unitSize, dst_endianness, dst_sign):
+        integerStruct = TypeConverter.__integerStructs.get(
+            (src_unitSize, src_endianness, src_sign))
+        if integerStruct is not None:
+            return integerStruct.pack(int(data))
+
+        # invalid parameters
+        from netzob.Model.Vocabulary.Types.Integer import Integer
+        return Integer.decode(
+            data,
+            unitSize=src_unitSize,
+            endianness=src_endianness,
+            sign=src_sign)
+
+    @staticmethod
+    def __encodeIntegerToBitArray(data, src_unitSize, src_endianness,
+                                  src_sign, dst_unitSize, dst_endianness,
+                                  dst_sign):
+        return TypeConverter.__encodeRawToBitArray(
+            TypeConverter.__encodeIntegerToRaw(
+                data, src_unitSize, src_endianness, src_sign, dst_unitSize,
+                dst_endianness, dst_sign), src_unitSize, src_endianness,
+            src_sign, dst_unitSize, dst_endianness, dst_sign)
+
+    @staticmethod
+    def __encodeRawToHexaString(data, src_unitSize, src_endianness, src_sign,
+                                dst_unitSize, dst_endianness, dst_sign):
+        return binascii.hexlify(data)
+
+    @staticmethod
+    def __encodeBitArrayToHexaString(data, src_unitSize, src_endianness,
+                                     src_sign, dst_unitSize, dst_endianness,
+                                     dst_sign):
+        return binascii.hexlify(data.tobytes())
+
+    @staticmethod
+    def __encodeRawColumnToInteger(data, dst_unitSize, dst_endianness,
+                                   dst_sign):
+        """Converts at once a column of raw data which are all made of a
+        single integer word, or returns None if it is not possible."""
+        if numpy is None or len(data) == 0:
+            return None
+        if (dst_unitSize, dst_endianness,
+                dst_sign) not in TypeConverter.__integerStructs:
+            return None
+        wordSize = int(int(dst_unitSize) / 8)
+        if any(len(d) != wordSize for d in data):
+            return None
+        dtype = numpy.dtype("{0}{1}{2}".format(
+            '>' if dst_endianness == AbstractType.ENDIAN_BIG else '<', 'i'
+            if dst_sign == AbstractType.SIGN_SIGNED else 'u', wordSize))
+        return numpy.frombuffer(b"".join(data), dtype=dtype).tolist()
+
     @staticmethod
     def convert(data,
                 sourceType,
@@ -107,6 +311,17 @@ class TypeConverter(object):
         >>> TypeConverter.convert(167815360, Integer, IPv4, src_unitSize=AbstractType.UNITSIZE_32, src_sign=AbstractType.SIGN_UNSIGNED)
         IPAddress('10.0.168.192')
 
+        Conversions between integers, bitarrays, raw and hexastring data do not
+        go through intermediate types
+
+        >>> bits = TypeConverter.convert(b'\\x01\\x02', Raw, BitArray)
+        >>> TypeConverter.convert(bits, BitArray, Integer, dst_unitSize=AbstractType.UNITSIZE_16)
+        258
+        >>> TypeConverter.convert(258, Integer, Raw, src_unitSize=AbstractType.UNITSIZE_16)
+        b'\\x01\\x02'
+        >>> TypeConverter.convert(bits, BitArray, HexaString)
+        b'0102'
+
         :param sourceType: the data source type
         :type sourceType: :class:`type`
         :param destinationType: the destination type
@@ -127,42 +342,102 @@ class TypeConverter(object):
         :raise: TypeError if parameter not valid
 
         """
+        if TypeConverter.__converters is None:
+            TypeConverter.__buildConverters()
+
         # is the two formats supported ?
-        if sourceType not in TypeConverter.supportedTypes():
-            raise TypeError(
-                "The source type ({0}) is not supported".format(sourceType))
-        if destinationType not in TypeConverter.supportedTypes():
-            raise TypeError("The destination type ({0}) is not supported".
-                            format(destinationType))
+        try:
+            converter = TypeConverter.__converters[(sourceType,
+                                                    destinationType)]
+        except (KeyError, TypeError):
+            if not AbstractType.isSupportedType(sourceType):
+                raise TypeError("The source type ({0}) is not supported".
+                                format(sourceType))
+            if not AbstractType.isSupportedType(destinationType):
+                raise TypeError("The destination type ({0}) is not supported".
+                                format(destinationType))
+            # One of the types has been registered after the converters
+            converter = TypeConverter.__genericConverter(sourceType,
+                                                         destinationType)
+            TypeConverter.__converters[(sourceType,
+                                        destinationType)] = converter
         if data is None:
             raise TypeError("Data cannot be None")
 
-        # Do we have a specific source to destination encoding function
-        if (sourceType, destinationType
-            ) in list(TypeConverter.__directEncoding().keys()):
-            func = TypeConverter.__directEncoding()[(sourceType,
-                                                     destinationType)]
-            return func(data, src_unitSize, src_endianness, src_sign,
-                        dst_unitSize, dst_endianness, dst_sign)
-        else:
-            # Convert from source to raw
-            if sourceType is not Raw:
-                binData = sourceType.decode(
-                    data,
-                    unitSize=src_unitSize,
-                    endianness=src_endianness,
-                    sign=src_sign)
-            else:
-                binData = data
+        return converter(data, src_unitSize, src_endianness, src_sign,
+                         dst_unitSize, dst_endianness, dst_sign)
 
-            # Convert from raw to Destination
-            if destinationType is not Raw:
-                outputData = destinationType.encode(
-                    binData,
-                    unitSize=dst_unitSize,
-                    endianness=dst_endianness,
-                    sign=dst_sign)
+    @staticmethod
+    def convertColumn(data,
+                      sourceType,
+                      destinationType,
+                      src_unitSize=AbstractType.defaultUnitSize(),
+                      src_endianness=AbstractType.defaultEndianness(),
+                      src_sign=AbstractType.defaultSign(),
+                      dst_unitSize=AbstractType.defaultUnitSize(),
+                      dst_endianness=AbstractType.defaultEndianness(),
+                      dst_sign=AbstractType.defaultSign()):
+        """Encode a list of data provided as a sourceType to a list of data
+        of the destinationType.
+
+        It returns the same values as calling :meth:`convert` on each
+        data, but the converter is only looked up once. Columns of raw
+        data or bitarrays that all hold a single integer word are
+        converted at once to integers when numpy is available.
+
+        >>> from netzob.all import *
+        >>> TypeConverter.convertColumn([b'\\x00\\x01', b'\\x01\\x00', b'\\xff\\xff'], Raw, Integer, dst_unitSize=AbstractType.UNITSIZE_16)
+        [1, 256, -1]
+        >>> TypeConverter.convertColumn([b'\\x01', b'\\x01\\x02'], Raw, Integer)
+        [1, 513]
+        >>> TypeConverter.convertColumn([b'net', b'zob'], Raw, HexaString)
+        [b'6e6574', b'7a6f62']
+        >>> TypeConverter.convertColumn([b'net', None], Raw, HexaString)
+        Traceback (most recent call last):
+        ...
+        TypeError: Data cannot be None
+
+        :param data: the list of data to convert
+        :type data: :class:`list`
+        :param sourceType: the data source type
+        :type sourceType: :class:`type`
+        :param destinationType: the destination type
+        :type destinationType: :class:`type`
+
+        The other parameters are the ones of :meth:`convert`.
+
+        :raise: TypeError if parameter not valid
+
+        """
+        from netzob.Model.Vocabulary.Types.BitArray import BitArray
+        from netzob.Model.Vocabulary.Types.Integer import Integer
+
+        data = list(data)
+        if len(data) == 0:
+            return []
+
+        # Converts the first data to check the parameters and to get the
+        # converter ready
+        first = TypeConverter.convert(
+            data[0], sourceType, destinationType, src_unitSize,
+            src_endianness, src_sign, dst_unitSize, dst_endianness, dst_sign)
+        if any(d is None for d in data):
+            raise TypeError("Data cannot be None")
+
+        if destinationType is Integer and sourceType in (Raw, BitArray):
+            if sourceType is BitArray:
+                rawData = [d.tobytes() for d in data]
             else:
-                outputData = binData
+                rawData = data
+            result = TypeConverter.__encodeRawColumnToInteger(
+                rawData, dst_unitSize, dst_endianness, dst_sign)
+            if result is not None:
+                return result
 
-            return outputData
+        converter = TypeConverter.__converters[(sourceType, destinationType)]
+        result = [first]
+        result.extend(
+            converter(d, src_unitSize, src_endianness, src_sign,
+                      dst_unitSize, dst_endianness, dst_sign)
+            for d in data[1:])
+        return result
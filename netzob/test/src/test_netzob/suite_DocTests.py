@@ -51,7 +51,9 @@ from netzob.Inference.Vocabulary.FormatOperations import ClusterByAlignment
 from netzob.Inference.Vocabulary.FormatOperations import ClusterBySize
 from netzob.Inference.Vocabulary.FormatOperations import FindKeyFields
 from netzob.Common.Utils import SortedTypedList
+from netzob.Common.Utils import TypedList
 from netzob.Common.Utils import MessageCells
+from netzob.Common.Utils import Decorators
 
 from netzob.Inference.Vocabulary.Search import SearchTask
 from netzob.Inference.Vocabulary.Search import SearchResult
@@ -67,6 +69,8 @@ from netzob.Model.Vocabulary.Domain.Variables.SVAS import SVAS
 from netzob.Model.Vocabulary.Domain.Parser.MessageParser import MessageParser
 from netzob.Model.Vocabulary.Domain.Specializer.MessageSpecializer import MessageSpecializer
 from netzob.Model.Vocabulary.Domain.Parser.FlowParser import FlowParser
+from netzob.Model.Vocabulary.Domain.Parser.ParsingPlan import ParsingPlan
+from netzob.Model.Vocabulary.Domain.Parser.ParsingPath import ParsingPath
 
 from netzob.Simulator.AbstractionLayer import AbstractionLayer
 
@@ -78,6 +82,11 @@ from netzob.Inference.Grammar.AutomataFactories.PTAAutomataFactory import PTAAut
 from netzob.Inference.Grammar.ProcessWrappers import ProcessWrapper
 from netzob.Inference.Grammar.ProcessWrappers import NetworkProcessWrapper
 
+from netzob.Import.PCAPImporter import TCPStreamReassembler
+from netzob.Import.PCAPImporter import PCAPReader
+from netzob.Import.PCAPImporter import PacketFilter
+from netzob.Export.PCAPExporter.PCAPExporter import PCAPExporter
+
 def getSuite():
     # List of modules to include in the list of tests
     modules = [
@@ -122,13 +131,16 @@ def getSuite():
         L3NetworkMessage.__module__,
         L4NetworkMessage.__module__,
         FileMessage.__module__,
+        MessageStore.__module__,
         FieldOperations,
         CorrelationFinder.__module__,
         RelationFinder.__module__,
         Format.__module__,
         Session.__module__,
         SortedTypedList,
+        TypedList,
         MessageCells,
+        Decorators,
         ApplicativeData.__module__,
         DomainEncodingFunction.__module__,
         TypeEncodingFunction.__module__,
@@ -157,6 +169,8 @@ def getSuite():
         MessageSpecializer.__module__,
 
         FlowParser.__module__,
+        ParsingPlan.__module__,
+        ParsingPath.__module__,
         AbstractionLayer.__module__,
         EntropyMeasurement,
 
@@ -183,7 +197,16 @@ def getSuite():
         # Modules related to the import
         # -----------------------------
         PCAPImporter.__module__,
-        FileImporter.__module__
+        TCPStreamReassembler,
+        ParallelPCAPImporter.__module__,
+        PCAPReader,
+        PacketFilter,
+        FlowSampler.__module__,
+        FileImporter.__module__,
+
+        # Modules related to the export
+        # -----------------------------
+        PCAPExporter.__module__
 
         # Other
         # -----